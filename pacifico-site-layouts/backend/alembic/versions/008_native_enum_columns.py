@@ -0,0 +1,63 @@
+"""Store enum-like columns as native Postgres ENUM types
+
+Converts assets.asset_type, layouts.status, layouts.stage and
+exclusion_zones.zone_type from VARCHAR(50) to native ENUM types.
+ENUM values are stored as 4-byte OIDs, which shrinks the rows and the
+btree indexes on these columns.
+
+Revision ID: 008_native_enum_columns
+Revises: 007_phase5_compliance
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_native_enum_columns'
+down_revision: Union[str, None] = '007_phase5_compliance'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type name, allowed values)
+ENUM_COLUMNS = [
+    ('assets', 'asset_type', 'asset_type_enum', [
+        'solar_array', 'wind_turbine', 'battery', 'generator', 'gas_turbine',
+        'substation', 'transformer', 'inverter', 'control_center', 'cooling_system',
+    ]),
+    ('layouts', 'status', 'layout_status_enum', [
+        'queued', 'processing', 'completed', 'failed',
+    ]),
+    ('layouts', 'stage', 'layout_stage_enum', [
+        'queued', 'fetching_dem', 'computing_slope', 'analyzing_terrain',
+        'placing_assets', 'generating_roads', 'computing_earthwork',
+        'finalizing', 'completed', 'failed',
+    ]),
+    ('exclusion_zones', 'zone_type', 'exclusion_zone_type_enum', [
+        'environmental', 'regulatory', 'infrastructure', 'safety', 'custom',
+    ]),
+]
+
+
+def upgrade() -> None:
+    """Create ENUM types and convert the VARCHAR columns to use them."""
+    for table, column, type_name, values in ENUM_COLUMNS:
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({labels})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    """Convert the ENUM columns back to VARCHAR(50) and drop the types."""
+    for table, column, type_name, _ in reversed(ENUM_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR(50) USING {column}::text"
+        )
+        op.execute(f"DROP TYPE {type_name}")
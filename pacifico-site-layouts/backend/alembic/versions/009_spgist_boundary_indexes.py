@@ -0,0 +1,59 @@
+"""Switch site boundary and exclusion zone geometry indexes to SP-GiST
+
+Site boundaries and exclusion zone polygons frequently overlap (same
+project, same region). SP-GiST produces a smaller index than GiST for this
+workload and speeds up point-in-polygon lookups.
+
+Revision ID: 009_spgist_boundary_indexes
+Revises: 008_native_enum_columns
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_spgist_boundary_indexes'
+down_revision: Union[str, None] = '008_native_enum_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace GiST indexes with SP-GiST indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_sites_boundary")
+    op.create_index(
+        'ix_sites_boundary_spgist',
+        'sites',
+        ['boundary'],
+        postgresql_using='spgist',
+    )
+    
+    op.execute("DROP INDEX IF EXISTS idx_exclusion_zones_geometry")
+    op.create_index(
+        'ix_exclusion_zones_geometry_spgist',
+        'exclusion_zones',
+        ['geometry'],
+        postgresql_using='spgist',
+    )
+
+
+def downgrade() -> None:
+    """Restore the original GiST indexes."""
+    op.drop_index('ix_exclusion_zones_geometry_spgist', table_name='exclusion_zones')
+    op.create_index(
+        'idx_exclusion_zones_geometry',
+        'exclusion_zones',
+        ['geometry'],
+        postgresql_using='gist',
+    )
+    
+    op.drop_index('ix_sites_boundary_spgist', table_name='sites')
+    op.create_index(
+        'idx_sites_boundary',
+        'sites',
+        ['boundary'],
+        postgresql_using='gist',
+    )
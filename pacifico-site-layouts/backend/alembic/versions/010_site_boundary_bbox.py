@@ -0,0 +1,51 @@
+"""Add precomputed bounding box column to sites
+
+Adds sites.boundary_bbox (ST_Envelope of the boundary) with an SP-GiST
+index so viewport and extent queries can filter on a 5-point box instead
+of the full boundary ring.
+
+Revision ID: 010_site_boundary_bbox
+Revises: 009_spgist_boundary_indexes
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_site_boundary_bbox'
+down_revision: Union[str, None] = '009_spgist_boundary_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add and backfill boundary_bbox, then index it."""
+    op.add_column(
+        'sites',
+        sa.Column(
+            'boundary_bbox',
+            Geometry(geometry_type='POLYGON', srid=4326, spatial_index=False),
+            nullable=True,
+        )
+    )
+    
+    # Backfill existing rows
+    op.execute("UPDATE sites SET boundary_bbox = ST_Envelope(boundary)")
+    
+    op.create_index(
+        'ix_sites_boundary_bbox_spgist',
+        'sites',
+        ['boundary_bbox'],
+        postgresql_using='spgist',
+    )
+
+
+def downgrade() -> None:
+    """Remove boundary_bbox column."""
+    op.drop_index('ix_sites_boundary_bbox_spgist', table_name='sites')
+    op.drop_column('sites', 'boundary_bbox')
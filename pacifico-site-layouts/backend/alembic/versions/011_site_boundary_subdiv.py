@@ -0,0 +1,58 @@
+"""Add subdivided boundary column to sites
+
+Adds sites.boundary_subdiv, the site boundary split with
+ST_Subdivide(boundary, 64) and collected into a MULTIPOLYGON. Large
+shapefile boundaries with thousands of vertices are tested against small
+parts instead of one huge ring.
+
+Revision ID: 011_site_boundary_subdiv
+Revises: 010_site_boundary_bbox
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_site_boundary_subdiv'
+down_revision: Union[str, None] = '010_site_boundary_bbox'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add and backfill boundary_subdiv, then index it."""
+    op.add_column(
+        'sites',
+        sa.Column(
+            'boundary_subdiv',
+            Geometry(geometry_type='MULTIPOLYGON', srid=4326, spatial_index=False),
+            nullable=True,
+        )
+    )
+    
+    # Backfill existing rows
+    op.execute("""
+        UPDATE sites
+        SET boundary_subdiv = (
+            SELECT ST_Multi(ST_Collect(part))
+            FROM ST_Subdivide(sites.boundary, 64) AS part
+        )
+    """)
+    
+    op.create_index(
+        'ix_sites_boundary_subdiv_spgist',
+        'sites',
+        ['boundary_subdiv'],
+        postgresql_using='spgist',
+    )
+
+
+def downgrade() -> None:
+    """Remove boundary_subdiv column."""
+    op.drop_index('ix_sites_boundary_subdiv_spgist', table_name='sites')
+    op.drop_column('sites', 'boundary_subdiv')
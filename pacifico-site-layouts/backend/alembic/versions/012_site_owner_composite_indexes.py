@@ -0,0 +1,44 @@
+"""Add composite owner indexes for multi-tenant site listing
+
+Replaces the standalone sites.owner_id index with composite indexes that
+match the listing queries: (owner_id, project_id) and
+(owner_id, created_at) INCLUDE (id, name, area_m2) for index-only scans.
+
+Revision ID: 012_site_owner_indexes
+Revises: 011_site_boundary_subdiv
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_site_owner_indexes'
+down_revision: Union[str, None] = '011_site_boundary_subdiv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite owner indexes and drop the redundant owner_id index."""
+    op.create_index(
+        'ix_sites_owner_project',
+        'sites',
+        ['owner_id', 'project_id'],
+    )
+    op.create_index(
+        'ix_sites_owner_created',
+        'sites',
+        ['owner_id', 'created_at'],
+        postgresql_include=['id', 'name', 'area_m2'],
+    )
+    op.drop_index('ix_sites_owner_id', table_name='sites')
+
+
+def downgrade() -> None:
+    """Restore the standalone owner_id index."""
+    op.create_index('ix_sites_owner_id', 'sites', ['owner_id'])
+    op.drop_index('ix_sites_owner_created', table_name='sites')
+    op.drop_index('ix_sites_owner_project', table_name='sites')
@@ -0,0 +1,53 @@
+"""Replace terrain_cache single-column indexes with a composite unique constraint
+
+Cache lookups always filter on (site_id, terrain_type, variant_key). A
+single composite unique constraint serves that lookup with one index probe
+and prevents duplicate cache rows from racing writers.
+
+Revision ID: 013_terrain_cache_lookup
+Revises: 012_site_owner_indexes
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_terrain_cache_lookup'
+down_revision: Union[str, None] = '012_site_owner_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Dedupe cache rows, add the unique constraint, drop old indexes."""
+    # Keep only the most recent row for each cache key
+    op.execute("""
+        DELETE FROM terrain_cache t
+        USING terrain_cache newer
+        WHERE t.site_id = newer.site_id
+          AND t.terrain_type = newer.terrain_type
+          AND t.variant_key IS NOT DISTINCT FROM newer.variant_key
+          AND (t.updated_at, t.id) < (newer.updated_at, newer.id)
+    """)
+    
+    op.create_unique_constraint(
+        'uq_terrain_cache_variant',
+        'terrain_cache',
+        ['site_id', 'terrain_type', 'variant_key'],
+        postgresql_nulls_not_distinct=True,
+    )
+    
+    op.drop_index('ix_terrain_cache_terrain_type', table_name='terrain_cache')
+    op.drop_index('ix_terrain_cache_variant_key', table_name='terrain_cache')
+    op.drop_index('ix_terrain_cache_site_id', table_name='terrain_cache')
+
+
+def downgrade() -> None:
+    """Restore single-column indexes and drop the unique constraint."""
+    op.create_index('ix_terrain_cache_site_id', 'terrain_cache', ['site_id'])
+    op.create_index('ix_terrain_cache_variant_key', 'terrain_cache', ['variant_key'])
+    op.create_index('ix_terrain_cache_terrain_type', 'terrain_cache', ['terrain_type'])
+    op.drop_constraint('uq_terrain_cache_variant', 'terrain_cache', type_='unique')
@@ -0,0 +1,64 @@
+"""Generate area_m2 in Postgres instead of writing it from the app
+
+Replaces sites.area_m2 and exclusion_zones.area_m2 with stored generated
+columns computed from ST_Area(<geometry>::geography), so every write path
+keeps the area consistent without an extra UPDATE round-trip.
+
+ix_sites_owner_created INCLUDEs area_m2, so it is dropped with the column
+and recreated afterwards.
+
+Revision ID: 014_generated_area_columns
+Revises: 013_terrain_cache_lookup
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_generated_area_columns'
+down_revision: Union[str, None] = '013_terrain_cache_lookup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, geometry column)
+AREA_COLUMNS = [
+    ('sites', 'boundary'),
+    ('exclusion_zones', 'geometry'),
+]
+
+
+def _recreate_owner_created_index() -> None:
+    op.create_index(
+        'ix_sites_owner_created',
+        'sites',
+        ['owner_id', 'created_at'],
+        postgresql_include=['name', 'area_m2'],
+    )
+
+
+def upgrade() -> None:
+    """Swap the app-maintained area_m2 columns for generated columns."""
+    op.drop_index('ix_sites_owner_created', table_name='sites')
+    for table, geom_column in AREA_COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN area_m2")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN area_m2 double precision "
+            f"GENERATED ALWAYS AS (ST_Area({geom_column}::geography)) STORED"
+        )
+    _recreate_owner_created_index()
+
+
+def downgrade() -> None:
+    """Restore plain area_m2 columns, backfilled from the geometry."""
+    op.drop_index('ix_sites_owner_created', table_name='sites')
+    for table, geom_column in reversed(AREA_COLUMNS):
+        op.execute(f"ALTER TABLE {table} DROP COLUMN area_m2")
+        op.execute(f"ALTER TABLE {table} ADD COLUMN area_m2 double precision")
+        op.execute(
+            f"UPDATE {table} SET area_m2 = ST_Area({geom_column}::geography)"
+        )
+    _recreate_owner_created_index()
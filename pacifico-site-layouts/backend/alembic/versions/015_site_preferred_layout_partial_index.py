@@ -0,0 +1,44 @@
+"""Replace the sites.preferred_layout_id index with a partial index
+
+Most sites never get a preferred layout, so the full index from
+003_preferred_layout is mostly NULL entries. A partial index on
+preferred_layout_id IS NOT NULL is much smaller and still serves the
+preferred-layout join and the ON DELETE SET NULL lookup.
+
+Revision ID: 015_site_preferred_layout_idx
+Revises: 014_generated_area_columns
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015_site_preferred_layout_idx'
+down_revision: Union[str, None] = '014_generated_area_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the partial index and drop the full one."""
+    op.create_index(
+        'ix_sites_preferred_layout',
+        'sites',
+        ['preferred_layout_id'],
+        postgresql_where=sa.text('preferred_layout_id IS NOT NULL'),
+    )
+    op.drop_index('ix_sites_preferred_layout_id', table_name='sites')
+
+
+def downgrade() -> None:
+    """Restore the full preferred_layout_id index."""
+    op.create_index(
+        'ix_sites_preferred_layout_id',
+        'sites',
+        ['preferred_layout_id'],
+    )
+    op.drop_index('ix_sites_preferred_layout', table_name='sites')
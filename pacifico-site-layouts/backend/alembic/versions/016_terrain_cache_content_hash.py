@@ -0,0 +1,36 @@
+"""Add content_hash to terrain_cache
+
+Terrain artifacts are now stored under content-addressed S3 keys
+(e.g. terrain/{site_id}/dem-{sha256}.tif). The digest is recorded on the
+cache row. Existing rows keep their old keys and a NULL hash until the
+artifact is regenerated.
+
+Revision ID: 016_terrain_cache_content_hash
+Revises: 015_site_preferred_layout_idx
+Create Date: 2025-11-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_terrain_cache_content_hash'
+down_revision: Union[str, None] = '015_site_preferred_layout_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the nullable content_hash column."""
+    op.add_column(
+        'terrain_cache',
+        sa.Column('content_hash', sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the content_hash column."""
+    op.drop_column('terrain_cache', 'content_hash')
@@ -18,7 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, lazy_load_guard
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -221,7 +221,9 @@ async def get_current_user(
     if await validate_demo_token(token):
         # Get or create demo user
         result = await db.execute(
-            select(User).where(User.cognito_sub == DEMO_USER_SUB)
+            select(User)
+            .options(*lazy_load_guard())
+            .where(User.cognito_sub == DEMO_USER_SUB)
         )
         user = result.scalar_one_or_none()
         
@@ -242,7 +244,9 @@ async def get_current_user(
     
     # Look up user by Cognito sub
     result = await db.execute(
-        select(User).where(User.cognito_sub == token_payload.sub)
+        select(User)
+        .options(*lazy_load_guard())
+        .where(User.cognito_sub == token_payload.sub)
     )
     user = result.scalar_one_or_none()
     
@@ -320,7 +324,9 @@ async def get_current_user_or_demo(
     if await validate_demo_token(token):
         # Get or create demo user
         result = await db.execute(
-            select(User).where(User.cognito_sub == DEMO_USER_SUB)
+            select(User)
+            .options(*lazy_load_guard())
+            .where(User.cognito_sub == DEMO_USER_SUB)
         )
         user = result.scalar_one_or_none()
         
@@ -23,7 +23,6 @@ from app.schemas.layout import (
     ComplianceCheckResponse,
     ComplianceRuleRequest,
     ComplianceRuleResponse,
-    ComplianceViolation,
     GetComplianceRulesRequest,
     GetComplianceRulesResponse,
     GISPublishRequest,
@@ -114,40 +113,15 @@ async def check_layout_compliance(
     # Run validation
     check_result = engine.validate_layout(assets_data, roads_data)
     
-    # Convert violations to response format
-    violations = [
-        ComplianceViolation(
-            rule_id=v.rule_id,
-            rule_type=v.rule_type.value,
-            asset_type=v.asset_type,
-            message=v.message,
-            severity=v.severity,
-            actual_value=v.actual_value,
-            limit_value=v.limit_value,
-        )
-        for v in check_result.violations
-    ]
-    
-    warnings = [
-        ComplianceViolation(
-            rule_id=w.rule_id,
-            rule_type=w.rule_type.value,
-            asset_type=w.asset_type,
-            message=w.message,
-            severity=w.severity,
-            actual_value=w.actual_value,
-            limit_value=w.limit_value,
-        )
-        for w in check_result.warnings
-    ]
-    
+    # RuleViolation dataclasses are read into ComplianceViolation via
+    # from_attributes in one validation pass
     return ComplianceCheckResponse(
         layout_id=layout_id,
         is_compliant=check_result.is_compliant,
-        violations_count=len(violations),
-        warnings_count=len(warnings),
-        violations=violations,
-        warnings=warnings,
+        violations_count=len(check_result.violations),
+        warnings_count=len(check_result.warnings),
+        violations=check_result.violations,
+        warnings=check_result.warnings,
         checked_rules_count=check_result.checked_rules_count,
     )
 
@@ -246,7 +220,8 @@ async def override_compliance_rule(
         )
     
     # Create engine and add rule
-    engine = get_compliance_rules_engine("default")
+    # Private engine: the rule must not leak into the shared per-jurisdiction engine
+    engine = get_compliance_rules_engine("default", fresh=True)
     from app.services.compliance_rules_engine import ComplianceRule
     
     rule = ComplianceRule(
@@ -10,7 +10,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from geoalchemy2.functions import ST_AsGeoJSON, ST_Area, ST_Transform, ST_GeomFromGeoJSON
+from geoalchemy2.functions import ST_AsGeoJSON, ST_GeomFromGeoJSON
 from shapely.geometry import shape
 from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -181,13 +181,7 @@ async def create_exclusion_zone(
     # Verify site ownership
     await _verify_site_ownership(site_id, current_user, db)
     
-    # Convert GeoJSON to WKT for PostGIS
-    geojson_str = json.dumps(zone_data.geometry)
-    
-    # Calculate area in square meters using ST_Area with transform to UTM
-    # We'll calculate this after insertion using the stored geometry
-    
-    # Create the zone
+    # Create the zone (area_m2 is generated by Postgres from the geometry)
     zone = ExclusionZone(
         name=zone_data.name,
         zone_type=zone_data.zone_type.value,
@@ -198,19 +192,6 @@ async def create_exclusion_zone(
     )
     
     db.add(zone)
-    await db.flush()
-    
-    # Calculate area in m² using PostGIS
-    # Transform to a suitable projection for area calculation (EPSG:3857 for web mercator)
-    area_result = await db.execute(
-        select(ST_Area(ST_Transform(ExclusionZone.geometry, 3857)))
-        .where(ExclusionZone.id == zone.id)
-    )
-    area_m2 = area_result.scalar() or 0
-    
-    # Update the zone with calculated area
-    zone.area_m2 = area_m2
-    
     await db.commit()
     await db.refresh(zone)
     
@@ -270,15 +251,8 @@ async def update_exclusion_zone(
     
     # Update geometry if provided
     if zone_data.geometry is not None:
+        # area_m2 is regenerated by Postgres from the new geometry
         zone.geometry = f"SRID=4326;{shape(zone_data.geometry).wkt}"
-        
-        # Recalculate area
-        await db.flush()
-        area_result = await db.execute(
-            select(ST_Area(ST_Transform(ExclusionZone.geometry, 3857)))
-            .where(ExclusionZone.id == zone.id)
-        )
-        zone.area_m2 = area_result.scalar() or 0
     
     await db.commit()
     await db.refresh(zone)
@@ -6,6 +6,7 @@ Provides layout exports in various formats:
 - KMZ for Google Earth (B-09)
 - PDF report (B-10)
 - CSV tabular data (D-04-05)
+- Streamed GeoJSON features (FeatureCollection or RFC 8142 text sequence)
 
 Phase D-04 enhancements:
 - Filenames include site name and timestamp
@@ -17,19 +18,20 @@ import json
 import logging
 import re
 from datetime import datetime
+from collections.abc import AsyncIterator
 from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from geoalchemy2.functions import ST_AsGeoJSON
 from pydantic import BaseModel, Field
 from shapely.geometry import shape
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.api.auth import get_current_user
-from app.database import get_db
+from app.database import async_session_maker, get_db
 from app.models.asset import Asset
 from app.models.layout import Layout
 from app.models.road import Road
@@ -95,7 +97,6 @@ async def _get_layout_with_details(
     # Note: Must specify join condition explicitly because Site has preferred_layout_id FK back to Layout
     result = await db.execute(
         select(Layout)
-        .options(selectinload(Layout.assets), selectinload(Layout.roads))
         .join(Site, Layout.site_id == Site.id)
         .where(
             Layout.id == layout_id,
@@ -116,13 +117,20 @@ async def _get_layout_with_details(
     )
     site = site_result.scalar_one()
     
+    # Load assets and roads with PostGIS-rendered GeoJSON in one query each
+    asset_rows = await db.execute(
+        select(Asset, ST_AsGeoJSON(Asset.position))
+        .where(Asset.layout_id == layout.id)
+    )
+    road_rows = await db.execute(
+        select(Road, ST_AsGeoJSON(Road.geometry))
+        .where(Road.layout_id == layout.id)
+    )
+    
     # Build asset list with GeoJSON positions
     assets = []
-    for asset in layout.assets:
-        pos_result = await db.execute(
-            select(ST_AsGeoJSON(Asset.position)).where(Asset.id == asset.id)
-        )
-        position_geojson = json.loads(pos_result.scalar() or "{}")
+    for asset, position_json in asset_rows:
+        position_geojson = json.loads(position_json or "{}")
         
         assets.append({
             "id": str(asset.id),
@@ -138,11 +146,8 @@ async def _get_layout_with_details(
     
     # Build road list with GeoJSON geometries
     roads = []
-    for road in layout.roads:
-        geom_result = await db.execute(
-            select(ST_AsGeoJSON(Road.geometry)).where(Road.id == road.id)
-        )
-        geometry_geojson = json.loads(geom_result.scalar() or "{}")
+    for road, geometry_json in road_rows:
+        geometry_geojson = json.loads(geometry_json or "{}")
         
         roads.append({
             "id": str(road.id),
@@ -461,3 +466,132 @@ async def export_csv(
         expires_in_seconds=3600,
     )
 
+
+# =============================================================================
+# Streamed GeoJSON features
+# =============================================================================
+
+# RFC 8142 record separator for GeoJSON text sequences
+_RS = b"\x1e"
+
+
+def _feature_bytes(geometry_json: str, properties: dict) -> bytes:
+    """Encode one Feature, splicing in PostGIS-rendered geometry text as-is."""
+    return (
+        f'{{"type":"Feature","geometry":{geometry_json},'
+        f'"properties":{json.dumps(properties, separators=(",", ":"))}}}'
+    ).encode()
+
+
+async def _stream_layout_features(layout_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Yield encoded asset and road Features for a layout, one row at a time.
+    
+    Uses its own session so the server-side cursor stays open for the life
+    of the response, independent of the request-scoped session.
+    """
+    async with async_session_maker() as session:
+        asset_rows = await session.stream(
+            select(
+                Asset.id,
+                Asset.asset_type,
+                Asset.name,
+                Asset.capacity_kw,
+                Asset.elevation_m,
+                Asset.slope_deg,
+                Asset.footprint_length_m,
+                Asset.footprint_width_m,
+                ST_AsGeoJSON(Asset.position),
+            ).where(Asset.layout_id == layout_id)
+        )
+        async for row in asset_rows:
+            yield _feature_bytes(row[8], {
+                "feature_type": "asset",
+                "id": str(row.id),
+                "asset_type": row.asset_type,
+                "name": row.name,
+                "capacity_kw": row.capacity_kw,
+                "elevation_m": row.elevation_m,
+                "slope_deg": row.slope_deg,
+                "footprint_length_m": row.footprint_length_m,
+                "footprint_width_m": row.footprint_width_m,
+            })
+        
+        road_rows = await session.stream(
+            select(
+                Road.id,
+                Road.name,
+                Road.length_m,
+                Road.max_grade_pct,
+                ST_AsGeoJSON(Road.geometry),
+            ).where(Road.layout_id == layout_id)
+        )
+        async for row in road_rows:
+            yield _feature_bytes(row[4], {
+                "feature_type": "road",
+                "id": str(row.id),
+                "name": row.name,
+                "length_m": row.length_m,
+                "max_grade_pct": row.max_grade_pct,
+            })
+
+
+async def _feature_collection_chunks(layout_id: UUID) -> AsyncIterator[bytes]:
+    """Wrap streamed features in a FeatureCollection document."""
+    yield b'{"type":"FeatureCollection","features":['
+    first = True
+    async for feature in _stream_layout_features(layout_id):
+        yield feature if first else b"," + feature
+        first = False
+    yield b"]}"
+
+
+async def _feature_sequence_chunks(layout_id: UUID) -> AsyncIterator[bytes]:
+    """Emit features as an RFC 8142 GeoJSON text sequence."""
+    async for feature in _stream_layout_features(layout_id):
+        yield _RS + feature + b"\n"
+
+
+@router.get(
+    "/{layout_id}/features.geojson",
+    summary="Stream layout features as GeoJSON",
+    description=(
+        "Stream the layout's assets and roads as a GeoJSON FeatureCollection, "
+        "or as an RFC 8142 GeoJSON text sequence when seq=true."
+    ),
+)
+async def stream_layout_features(
+    layout_id: UUID,
+    seq: bool = Query(False, description="Emit application/geo+json-seq instead of a FeatureCollection"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream layout features without materializing the FeatureCollection.
+    
+    Features are encoded per row straight from a server-side cursor, so
+    peak memory is one feature rather than the whole layout.
+    """
+    result = await db.execute(
+        select(Layout.id)
+        .join(Site, Layout.site_id == Site.id)
+        .where(
+            Layout.id == layout_id,
+            Site.owner_id == current_user.id,
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Layout not found",
+        )
+    
+    if seq:
+        return StreamingResponse(
+            _feature_sequence_chunks(layout_id),
+            media_type="application/geo+json-seq",
+        )
+    return StreamingResponse(
+        _feature_collection_chunks(layout_id),
+        media_type="application/geo+json",
+    )
@@ -12,26 +12,32 @@ from typing import Any, Optional
 from uuid import UUID
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from geoalchemy2.functions import ST_AsGeoJSON, ST_GeomFromText, ST_Length, ST_SetSRID
+from geoalchemy2.shape import from_shape
+from pydantic import ValidationError
 from shapely import wkt
 from shapely.geometry import mapping, shape, Point
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.api.auth import get_current_user
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, lazy_load_guard
 from app.models.asset import Asset
 from app.models.exclusion_zone import ExclusionZone
 from app.models.layout import Layout, LayoutStatus
 from app.models.road import Road
 from app.models.site import Site
+from app.models.terrain_cache import TerrainType
 from app.models.user import User
+from app.schemas.geojson import GeoJSONLineString, GeoJSONPoint
 from app.schemas.layout import (
+    ASSET_LIST_ADAPTER,
     AssetResponse,
     BlockLayoutInfo,
+    GENERATE_REQUEST_ADAPTER,
     GenerateLayoutRequest,
     LayoutDetailResponse,
     LayoutEnqueueResponse,
@@ -44,6 +50,9 @@ from app.schemas.layout import (
     LayoutVariantMetrics,
     LayoutVariantResponse,
     LayoutVariantsResponse,
+    ProfileInfo,
+    ProfilesResponse,
+    ROAD_LIST_ADAPTER,
     RoadResponse,
     STRATEGY_INFO_LIST,
     VariantComparison,
@@ -57,9 +66,11 @@ from app.schemas.layout import (
 )
 # Phase A: Dummy layout generator
 from app.services.layout_generator import DummyLayoutGenerator
+from app.services.generation_profiles import get_profile_info
 # Phase B: Terrain-aware services
 from app.services.dem_service import get_dem_service
 from app.services.slope_service import get_slope_service
+from app.services.terrain_cache_lookup import get_terrain_cache_lookup
 # D-05: Import LayoutStrategy enum from generator for strategy mapping
 # Phase 3: Also import PlacedAsset/PlacedRoad for recompute operations
 from app.services.terrain_layout_generator import (
@@ -103,28 +114,82 @@ def _to_native(value: Any) -> Any:
     return value
 
 
+def _inline_schema_refs(schema: dict[str, Any]) -> dict[str, Any]:
+    """Resolve local $defs references so a JSON schema can be embedded inline."""
+    defs = schema.pop("$defs", {})
+    
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
+
+
+# The generate endpoints take their body through parse_generate_request, so
+# document it explicitly to keep the OpenAPI request schema.
+_GENERATE_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": _inline_schema_refs(GenerateLayoutRequest.model_json_schema()),
+            },
+        },
+    },
+}
+
+
+async def parse_generate_request(http_request: Request) -> GenerateLayoutRequest:
+    """
+    Validate a GenerateLayoutRequest straight from the raw body bytes.
+    
+    Skips FastAPI's json.loads-then-validate_python step. Validation errors
+    are reported as the usual 422 with body-prefixed locations.
+    """
+    try:
+        return GENERATE_REQUEST_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
 # =============================================================================
 # D-05: Layout Strategies Endpoint
 # =============================================================================
 
 
+# Strategies never change at runtime; serialize the response body once
+_STRATEGIES_JSON = LayoutStrategiesResponse(
+    strategies=list(STRATEGY_INFO_LIST),
+).model_dump_json().encode()
+
+
 @router.get(
     "/strategies",
     response_model=LayoutStrategiesResponse,
     summary="Get available layout strategies",
     description="D-05: Returns all available layout optimization strategies with descriptions.",
 )
-async def get_layout_strategies() -> LayoutStrategiesResponse:
+async def get_layout_strategies() -> Response:
     """Get available layout strategies for variant generation."""
-    return LayoutStrategiesResponse(strategies=STRATEGY_INFO_LIST)
+    return Response(content=_STRATEGIES_JSON, media_type="application/json")
 
 
 # =============================================================================
 # Generation Profiles Endpoint
 # =============================================================================
 
-from app.services.generation_profiles import get_profile_info
-from app.schemas.layout import ProfilesResponse, ProfileInfo
+# Profiles are static module data as well; serialize once like strategies
+_PROFILES_JSON = ProfilesResponse(
+    profiles=[ProfileInfo(**p) for p in get_profile_info()],
+).model_dump_json().encode()
 
 
 @router.get(
@@ -133,12 +198,9 @@ from app.schemas.layout import ProfilesResponse, ProfileInfo
     summary="Get available generation profiles",
     description="Returns available asset mix profiles (solar, gas+bess, wind, hybrid).",
 )
-async def get_generation_profiles() -> ProfilesResponse:
+async def get_generation_profiles() -> Response:
     """Get available generation profiles for layout generation."""
-    profiles_data = get_profile_info()
-    return ProfilesResponse(
-        profiles=[ProfileInfo(**p) for p in profiles_data]
-    )
+    return Response(content=_PROFILES_JSON, media_type="application/json")
 
 
 @router.post(
@@ -147,9 +209,10 @@ async def get_generation_profiles() -> ProfilesResponse:
     status_code=status.HTTP_201_CREATED,
     summary="Generate layout",
     description="Generate a layout for a site. Uses terrain-aware placement by default (Phase B). Returns async job ID if enabled (Phase C).",
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
 )
 async def generate_layout(
-    request: GenerateLayoutRequest,
+    request: GenerateLayoutRequest = Depends(parse_generate_request),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> LayoutGenerateResponse | LayoutEnqueueResponse:
@@ -266,9 +329,10 @@ async def generate_layout(
     status_code=status.HTTP_201_CREATED,
     summary="Generate layout variants",
     description="D-05: Generate multiple layout variants with different optimization strategies for comparison.",
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
 )
 async def generate_layout_variants(
-    request: GenerateLayoutRequest,
+    request: GenerateLayoutRequest = Depends(parse_generate_request),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> LayoutVariantsResponse:
@@ -321,15 +385,13 @@ async def generate_layout_variants(
         )
     
     # Determine which strategies to use
-    strategies = request.variant_strategies or [
-        LayoutStrategy.BALANCED,
-        LayoutStrategy.DENSITY,
-        LayoutStrategy.LOW_EARTHWORK,
-        LayoutStrategy.CLUSTERED,
-    ]
+    strategies = request.selected_strategies
     
     num_assets = random_asset_count(request.target_capacity_kw)
     
+    # Exclusion zones are the same for every variant; load them once
+    exclusion_zones = await _fetch_exclusion_zones(site.id, db)
+    
     # Generate variants
     variants: list[LayoutVariantResponse] = []
     metrics: list[LayoutVariantMetrics] = []
@@ -343,6 +405,7 @@ async def generate_layout_variants(
                 dem_resolution_m=request.dem_resolution_m,
                 num_assets=num_assets,
                 strategy=strategy,
+                exclusion_zones=exclusion_zones,
                 db=db,
                 generation_profile=request.generation_profile.value if request.generation_profile else None,
             )
@@ -377,6 +440,7 @@ async def _generate_variant(
     dem_resolution_m: int,
     num_assets: int,
     strategy: LayoutStrategy,
+    exclusion_zones: list[dict[str, Any]],
     db: AsyncSession,
     generation_profile: Optional[str] = None,
 ) -> dict:
@@ -385,6 +449,10 @@ async def _generate_variant(
     
     Phase E: Enhanced with terrain analysis for suitability scoring.
     
+    exclusion_zones is loaded once by the caller (see _fetch_exclusion_zones)
+    and shared by all variants. Asset/road responses are built from the
+    freshly inserted records, so no per-variant collection loads are issued.
+    
     Returns both the variant response and metrics for comparison.
     """
     # Map schema strategy to generator strategy
@@ -462,9 +530,6 @@ async def _generate_variant(
             asset_type=asset_type,
         )
     
-    # Fetch exclusion zones
-    exclusion_zones = await _fetch_exclusion_zones(site.id, db)
-    
     # Generate layout with strategy and enhanced terrain data
     generator = TerrainAwareLayoutGenerator(
         target_capacity_kw=target_capacity_kw,
@@ -507,30 +572,31 @@ async def _generate_variant(
     
     # Create Asset records
     total_capacity = 0.0
-    asset_responses = []
+    asset_payloads = []
     
-    for placed in placed_assets:
-        asset = Asset(
+    # Insert all assets with a single batched flush; geometries bind as EWKB
+    asset_records = [
+        Asset(
             layout_id=layout.id,
             asset_type=placed.asset_type,
             name=placed.name,
-            position=ST_SetSRID(
-                ST_GeomFromText(placed.position.wkt),
-                4326
-            ),
+            position=from_shape(placed.position, srid=4326, extended=True),
             capacity_kw=placed.capacity_kw,
             elevation_m=placed.elevation_m,
             slope_deg=placed.slope_deg,
             footprint_length_m=placed.footprint_length_m,
             footprint_width_m=placed.footprint_width_m,
         )
-        db.add(asset)
-        await db.flush()
-        
+        for placed in placed_assets
+    ]
+    db.add_all(asset_records)
+    await db.flush()
+    
+    for placed, asset in zip(placed_assets, asset_records):
         total_capacity += placed.capacity_kw or 0
         asset_cutfill = per_asset_cutfill.get(placed.name, {})
         
-        asset_responses.append(AssetResponse(
+        asset_payloads.append(dict(
             id=asset.id,
             asset_type=asset.asset_type,
             name=asset.name,
@@ -548,42 +614,47 @@ async def _generate_variant(
             rotation_deg=placed.rotation_deg,
         ))
     
+    asset_responses = ASSET_LIST_ADAPTER.validate_python(asset_payloads)
+    
     # Create Road records
-    road_responses = []
+    road_payloads = []
     total_road_length = 0.0
     
-    for placed in placed_roads:
-            road = Road(
-                layout_id=layout.id,
-                name=placed.name,
-                geometry=ST_SetSRID(
-                    ST_GeomFromText(placed.geometry.wkt),
-                    4326
-                ),
-                length_m=placed.length_m,
-                width_m=placed.width_m,
-                max_grade_pct=placed.max_grade_pct,
-                road_class=placed.road_class,
-                max_cumulative_cost=placed.max_cumulative_cost,
-                stationing_json={"data": placed.stationing} if placed.stationing else None,
-                kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
-            )
-            db.add(road)
-            await db.flush()
-            
-            total_road_length += placed.length_m or 0
-            
-            road_responses.append(RoadResponse(
-                id=road.id,
-                name=road.name,
-                length_m=road.length_m,
-                max_grade_pct=road.max_grade_pct,
-                geometry=mapping(placed.geometry),
-                road_class=placed.road_class,
-                max_cumulative_cost=placed.max_cumulative_cost,
-                stationing_json={"data": placed.stationing} if placed.stationing else None,
-                kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
-            ))
+    # Insert all roads with a single batched flush; geometries bind as EWKB
+    road_records = [
+        Road(
+            layout_id=layout.id,
+            name=placed.name,
+            geometry=from_shape(placed.geometry, srid=4326, extended=True),
+            length_m=placed.length_m,
+            width_m=placed.width_m,
+            max_grade_pct=placed.max_grade_pct,
+            road_class=placed.road_class,
+            max_cumulative_cost=placed.max_cumulative_cost,
+            stationing_json={"data": placed.stationing} if placed.stationing else None,
+            kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
+        )
+        for placed in placed_roads
+    ]
+    db.add_all(road_records)
+    await db.flush()
+    
+    for placed, road in zip(placed_roads, road_records):
+        total_road_length += placed.length_m or 0
+        
+        road_payloads.append(dict(
+            id=road.id,
+            name=road.name,
+            length_m=road.length_m,
+            max_grade_pct=road.max_grade_pct,
+            geometry=mapping(placed.geometry),
+            road_class=placed.road_class,
+            max_cumulative_cost=placed.max_cumulative_cost,
+            stationing_json={"data": placed.stationing} if placed.stationing else None,
+            kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
+        ))
+    
+    road_responses = ROAD_LIST_ADAPTER.validate_python(road_payloads)
     
     # Update layout with totals
     layout.total_capacity_kw = round(total_capacity, 1)
@@ -601,11 +672,13 @@ async def _generate_variant(
     site_area_ha = (site.area_m2 or 0) / 10000
     capacity_per_ha = total_capacity / site_area_ha if site_area_ha > 0 else None
     
-    # Build variant response
+    # Build variant response. The nested layout comes from the row we just
+    # refreshed, so construct it without validation; LayoutVariantResponse
+    # then passes the instance through instead of re-running its validator.
     variant = LayoutVariantResponse(
-        strategy=strategy,
+        strategy=strategy.value,
         strategy_name=strategy_names.get(strategy, strategy.value),
-        layout=LayoutResponse(
+        layout=LayoutResponse.model_construct(
             id=layout.id,
             site_id=layout.site_id,
             status=layout.status,
@@ -624,7 +697,7 @@ async def _generate_variant(
     # Build metrics
     metrics = LayoutVariantMetrics(
         layout_id=layout.id,
-        strategy=strategy,
+        strategy=strategy.value,
         strategy_name=strategy_names.get(strategy, strategy.value),
         total_capacity_kw=total_capacity,
         asset_count=len(asset_responses),
@@ -674,24 +747,19 @@ async def _fetch_exclusion_zones(site_id: UUID, db: AsyncSession) -> list[dict[s
     """
     from shapely.ops import unary_union
     
+    # Load zones together with their GeoJSON geometry in one query
     result = await db.execute(
-        select(ExclusionZone).where(ExclusionZone.site_id == site_id)
+        select(ExclusionZone, ST_AsGeoJSON(ExclusionZone.geometry))
+        .where(ExclusionZone.site_id == site_id)
     )
-    zones = result.scalars().all()
+    rows = result.all()
     
-    if not zones:
+    if not rows:
         return []
     
     exclusion_data = []
     
-    for zone in zones:
-        # Get geometry as GeoJSON
-        geom_result = await db.execute(
-            select(ST_AsGeoJSON(ExclusionZone.geometry))
-            .where(ExclusionZone.id == zone.id)
-        )
-        geom_json = geom_result.scalar()
-        
+    for zone, geom_json in rows:
         if geom_json:
             try:
                 geom_dict = json.loads(geom_json)
@@ -893,32 +961,33 @@ async def _generate_terrain_aware_layout(
         
         # Create Asset records with terrain data
         total_capacity = 0.0
-        asset_responses = []
+        asset_payloads = []
         
-        for placed in placed_assets:
-            asset = Asset(
+        # Insert all assets with a single batched flush; geometries bind as EWKB
+        asset_records = [
+            Asset(
                 layout_id=layout.id,
                 asset_type=placed.asset_type,
                 name=placed.name,
-                position=ST_SetSRID(
-                    ST_GeomFromText(placed.position.wkt),
-                    4326
-                ),
+                position=from_shape(placed.position, srid=4326, extended=True),
                 capacity_kw=placed.capacity_kw,
                 elevation_m=placed.elevation_m,
                 slope_deg=placed.slope_deg,
                 footprint_length_m=placed.footprint_length_m,
                 footprint_width_m=placed.footprint_width_m,
             )
-            db.add(asset)
-            await db.flush()
-            
+            for placed in placed_assets
+        ]
+        db.add_all(asset_records)
+        await db.flush()
+        
+        for placed, asset in zip(placed_assets, asset_records):
             total_capacity += placed.capacity_kw or 0
             
             # D-02: Get per-asset cut/fill from lookup
             asset_cutfill = per_asset_cutfill.get(placed.name, {})
             
-            asset_responses.append(AssetResponse(
+            asset_payloads.append(dict(
                 id=asset.id,
                 asset_type=asset.asset_type,
                 name=asset.name,
@@ -936,18 +1005,18 @@ async def _generate_terrain_aware_layout(
                 rotation_deg=_to_float(placed.rotation_deg),
             ))
         
+        asset_responses = ASSET_LIST_ADAPTER.validate_python(asset_payloads)
+        
         # Create Road records with grade data
-        road_responses = []
+        road_payloads = []
         total_road_length = 0.0
         
-        for placed in placed_roads:
-            road = Road(
+        # Insert all roads with a single batched flush; geometries bind as EWKB
+        road_records = [
+            Road(
                 layout_id=layout.id,
                 name=placed.name,
-                geometry=ST_SetSRID(
-                    ST_GeomFromText(placed.geometry.wkt),
-                    4326
-                ),
+                geometry=from_shape(placed.geometry, srid=4326, extended=True),
                 length_m=placed.length_m,
                 width_m=placed.width_m,
                 max_grade_pct=placed.max_grade_pct,
@@ -956,12 +1025,15 @@ async def _generate_terrain_aware_layout(
                 stationing_json={"data": placed.stationing} if placed.stationing else None,
                 kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
             )
-            db.add(road)
-            await db.flush()
-            
+            for placed in placed_roads
+        ]
+        db.add_all(road_records)
+        await db.flush()
+        
+        for placed, road in zip(placed_roads, road_records):
             total_road_length += placed.length_m or 0
             
-            road_responses.append(RoadResponse(
+            road_payloads.append(dict(
                 id=road.id,
                 name=road.name,
                 length_m=_to_float(road.length_m),
@@ -973,6 +1045,8 @@ async def _generate_terrain_aware_layout(
                 kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
             ))
         
+        road_responses = ROAD_LIST_ADAPTER.validate_python(road_payloads)
+        
         # Update layout with totals
         layout.total_capacity_kw = _to_float(round(total_capacity, 1))
         
@@ -1067,27 +1141,28 @@ async def _generate_dummy_layout(
     
     # Create Asset records
     total_capacity = 0.0
-    asset_responses = []
+    asset_payloads = []
     
-    for placed in placed_assets:
-        asset = Asset(
+    # Insert all assets with a single batched flush; geometries bind as EWKB
+    asset_records = [
+        Asset(
             layout_id=layout.id,
             asset_type=placed.asset_type,
             name=placed.name,
-            position=ST_SetSRID(
-                ST_GeomFromText(placed.position.wkt),
-                4326
-            ),
+            position=from_shape(placed.position, srid=4326, extended=True),
             capacity_kw=placed.capacity_kw,
             footprint_length_m=placed.footprint_length_m,
             footprint_width_m=placed.footprint_width_m,
         )
-        db.add(asset)
-        await db.flush()
-        
+        for placed in placed_assets
+    ]
+    db.add_all(asset_records)
+    await db.flush()
+    
+    for placed, asset in zip(placed_assets, asset_records):
         total_capacity += placed.capacity_kw or 0
         
-        asset_responses.append(AssetResponse(
+        asset_payloads.append(dict(
             id=asset.id,
             asset_type=asset.asset_type,
             name=asset.name,
@@ -1095,33 +1170,38 @@ async def _generate_dummy_layout(
             position=mapping(placed.position),
         ))
     
+    asset_responses = ASSET_LIST_ADAPTER.validate_python(asset_payloads)
+    
     # Create Road records
-    road_responses = []
+    road_payloads = []
     total_road_length = 0.0
     
-    for placed in placed_roads:
-        road = Road(
+    # Insert all roads with a single batched flush; geometries bind as EWKB
+    road_records = [
+        Road(
             layout_id=layout.id,
             name=placed.name,
-            geometry=ST_SetSRID(
-                ST_GeomFromText(placed.geometry.wkt),
-                4326
-            ),
+            geometry=from_shape(placed.geometry, srid=4326, extended=True),
             length_m=placed.length_m,
             width_m=placed.width_m,
         )
-        db.add(road)
-        await db.flush()
-        
+        for placed in placed_roads
+    ]
+    db.add_all(road_records)
+    await db.flush()
+    
+    for placed, road in zip(placed_roads, road_records):
         total_road_length += placed.length_m or 0
         
-        road_responses.append(RoadResponse(
+        road_payloads.append(dict(
             id=road.id,
             name=road.name,
             length_m=road.length_m,
             geometry=mapping(placed.geometry),
         ))
     
+    road_responses = ROAD_LIST_ADAPTER.validate_python(road_payloads)
+    
     # Update layout with totals
     layout.total_capacity_kw = round(total_capacity, 1)
     
@@ -1179,7 +1259,7 @@ async def get_layout(
     # Query layout with ownership check through site
     result = await db.execute(
         select(Layout)
-        .options(selectinload(Layout.assets), selectinload(Layout.roads))
+        .options(*lazy_load_guard())
         .join(Site, Layout.site_id == Site.id)
         .where(
             Layout.id == layout_id,
@@ -1194,38 +1274,40 @@ async def get_layout(
             detail="Layout not found",
         )
     
-    # Build asset responses with GeoJSON positions
-    asset_responses = []
-    for asset in layout.assets:
-        # Get position as GeoJSON
-        pos_result = await db.execute(
-            select(ST_AsGeoJSON(Asset.position)).where(Asset.id == asset.id)
-        )
-        position_geojson = json.loads(pos_result.scalar() or "{}")
-        
-        asset_responses.append(AssetResponse(
+    # Load assets and roads with PostGIS-rendered GeoJSON: one query per
+    # table instead of a collection load plus one ST_AsGeoJSON per row
+    asset_rows = await db.execute(
+        select(Asset, ST_AsGeoJSON(Asset.position))
+        .where(Asset.layout_id == layout.id)
+    )
+    road_rows = await db.execute(
+        select(Road, ST_AsGeoJSON(Road.geometry))
+        .where(Road.layout_id == layout.id)
+    )
+    
+    # Rows come straight from PostGIS (NOT NULL geometries, typed columns),
+    # so build the per-asset/per-road models with model_construct and skip
+    # re-validating thousands of trusted objects. ST_AsGeoJSON text is
+    # parsed by pydantic-core straight into the typed geometry models.
+    asset_responses = [
+        AssetResponse.model_construct(
             id=asset.id,
             asset_type=asset.asset_type,
             name=asset.name,
             capacity_kw=asset.capacity_kw,
-            position=position_geojson,
-        ))
-    
-    # Build road responses with GeoJSON geometries
-    road_responses = []
-    for road in layout.roads:
-        # Get geometry as GeoJSON
-        geom_result = await db.execute(
-            select(ST_AsGeoJSON(Road.geometry)).where(Road.id == road.id)
+            position=GeoJSONPoint.model_validate_json(position_json),
         )
-        geometry_geojson = json.loads(geom_result.scalar() or "{}")
-        
-        road_responses.append(RoadResponse(
+        for asset, position_json in asset_rows
+    ]
+    road_responses = [
+        RoadResponse.model_construct(
             id=road.id,
             name=road.name,
             length_m=road.length_m,
-            geometry=geometry_geojson,
-        ))
+            geometry=GeoJSONLineString.model_validate_json(geometry_json),
+        )
+        for road, geometry_json in road_rows
+    ]
     
     return LayoutDetailResponse(
         id=layout.id,
@@ -1252,15 +1334,17 @@ async def list_layouts(
     site_id: UUID | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> LayoutListResponse:
+) -> Response:
     """
     List layouts for the current user.
     
-    Optionally filter by site_id.
+    Optionally filter by site_id. Null fields (e.g. total_capacity_kw on
+    queued layouts) are omitted from the serialized listing.
     """
     try:
         query = (
             select(Layout)
+            .options(*lazy_load_guard())
             .join(Site, Layout.site_id == Site.id)
             .where(Site.owner_id == current_user.id)
             .order_by(Layout.created_at.desc())
@@ -1272,7 +1356,7 @@ async def list_layouts(
         result = await db.execute(query)
         layouts = result.scalars().all()
         
-        return LayoutListResponse(
+        listing = LayoutListResponse(
             layouts=[
                 {
                     "id": layout.id,
@@ -1285,6 +1369,10 @@ async def list_layouts(
             ],
             total=len(layouts),
         )
+        return Response(
+            content=listing.model_dump_json(exclude_none=True),
+            media_type="application/json",
+        )
     except Exception as e:
         logger.exception(f"Failed to list layouts for user {current_user.id}: {e}")
         raise HTTPException(
@@ -1324,22 +1412,35 @@ async def get_layout_status(
     
     Used by frontend for async job tracking - call every 2-3 seconds during processing.
     """
-    # Query layout with ownership check through site
+    # Query layout with ownership check through site. The completed-state
+    # metrics ride along as correlated subqueries so each poll is a single
+    # round-trip (they are cheap index probes while the job is running).
+    asset_count_subq = (
+        select(func.count(Asset.id))
+        .where(Asset.layout_id == Layout.id)
+        .scalar_subquery()
+    )
+    road_length_subq = (
+        select(func.sum(Road.length_m))
+        .where(Road.layout_id == Layout.id)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Layout)
+        select(Layout, asset_count_subq, road_length_subq)
         .join(Site, Layout.site_id == Site.id)
         .where(
             Layout.id == layout_id,
             Site.owner_id == current_user.id,
         )
     )
-    layout = result.scalar_one_or_none()
+    row = result.one_or_none()
     
-    if not layout:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Layout not found",
         )
+    layout, asset_count, total_road_length = row
     
     # If not completed, return status with progress info
     if layout.status != LayoutStatus.COMPLETED.value:
@@ -1353,19 +1454,7 @@ async def get_layout_status(
             stage_message=layout.stage_message,
         )
     
-    # If completed, calculate additional metrics
-    # Count assets
-    asset_count_result = await db.execute(
-        select(func.count(Asset.id)).where(Asset.layout_id == layout.id)
-    )
-    asset_count = asset_count_result.scalar() or 0
-    
-    # Sum road lengths
-    road_length_result = await db.execute(
-        select(func.sum(Road.length_m)).where(Road.layout_id == layout.id)
-    )
-    total_road_length = road_length_result.scalar() or 0.0
-    
+    # If completed, include the layout metrics
     return LayoutStatusResponse(
         layout_id=layout.id,
         status=layout.status,
@@ -1375,8 +1464,8 @@ async def get_layout_status(
         progress_pct=100,
         stage_message="Layout generation complete",
         total_capacity_kw=layout.total_capacity_kw,
-        asset_count=asset_count,
-        road_length_m=total_road_length,
+        asset_count=asset_count or 0,
+        road_length_m=total_road_length or 0.0,
         cut_volume_m3=layout.cut_volume_m3,
         fill_volume_m3=layout.fill_volume_m3,
     )
@@ -1535,49 +1624,34 @@ async def move_asset(
     if request.recompute_local:
         try:
             dem_service = get_dem_service()
-            slope_service = get_slope_service()
+            lookup = get_terrain_cache_lookup()
             
-            # Get cached terrain data
-            from app.models.terrain_cache import TerrainCache
-            cache_result = await db.execute(
-                select(TerrainCache).where(
-                    TerrainCache.site_id == site.id,
-                    TerrainCache.data_type == "dem",
-                )
+            # Sample only the tiles under the new position instead of
+            # downloading the full DEM and slope rasters
+            dem_s3_key = await lookup.get_s3_key(site.id, TerrainType.ELEVATION, db)
+            elevation = (
+                await dem_service.sample_raster(dem_s3_key, new_lon, new_lat)
+                if dem_s3_key else None
             )
-            dem_cache = cache_result.scalar_one_or_none()
             
-            if dem_cache and dem_cache.s3_key:
-                # Load DEM and sample at new position
-                dem_array, dem_profile = await dem_service.get_dem_array(dem_cache.s3_key)
-                transform = dem_profile["transform"]
-                
-                from rasterio.transform import rowcol
-                row, col = rowcol(transform, new_lon, new_lat)
+            if elevation is not None:
+                asset.elevation_m = elevation
                 
-                if 0 <= row < dem_array.shape[0] and 0 <= col < dem_array.shape[1]:
-                    asset.elevation_m = float(dem_array[row, col])
+                # Get slope
+                slope_s3_key = await lookup.get_s3_key(site.id, TerrainType.SLOPE, db)
+                slope = (
+                    await dem_service.sample_raster(slope_s3_key, new_lon, new_lat)
+                    if slope_s3_key else None
+                )
+                if slope is not None:
+                    asset.slope_deg = slope
                     
-                    # Get slope
-                    slope_cache_result = await db.execute(
-                        select(TerrainCache).where(
-                            TerrainCache.site_id == site.id,
-                            TerrainCache.data_type == "slope",
+                    # Check if slope exceeds limit
+                    slope_limit = TerrainAwareLayoutGenerator.SLOPE_LIMITS.get(asset.asset_type, 15.0)
+                    if asset.slope_deg > slope_limit:
+                        warnings.append(
+                            f"Slope ({asset.slope_deg:.1f}°) exceeds limit for {asset.asset_type} ({slope_limit}°)"
                         )
-                    )
-                    slope_cache = slope_cache_result.scalar_one_or_none()
-                    
-                    if slope_cache and slope_cache.s3_key:
-                        slope_array, _ = await slope_service.get_slope_array(slope_cache.s3_key)
-                        if 0 <= row < slope_array.shape[0] and 0 <= col < slope_array.shape[1]:
-                            asset.slope_deg = float(slope_array[row, col])
-                            
-                            # Check if slope exceeds limit
-                            slope_limit = TerrainAwareLayoutGenerator.SLOPE_LIMITS.get(asset.asset_type, 15.0)
-                            if asset.slope_deg > slope_limit:
-                                warnings.append(
-                                    f"Slope ({asset.slope_deg:.1f}°) exceeds limit for {asset.asset_type} ({slope_limit}°)"
-                                )
         except Exception as e:
             logger.warning(f"Failed to recompute terrain metrics: {e}")
             warnings.append("Could not recompute terrain metrics")
@@ -1785,17 +1859,15 @@ async def recompute_roads(
         await db.flush()
         
         # Create new road records
-        road_responses = []
+        road_payloads = []
         total_length = 0.0
         
-        for placed in placed_roads:
-            road = Road(
+        # Insert all roads with a single batched flush; geometries bind as EWKB
+        road_records = [
+            Road(
                 layout_id=layout.id,
                 name=placed.name,
-                geometry=ST_SetSRID(
-                    ST_GeomFromText(placed.geometry.wkt),
-                    4326
-                ),
+                geometry=from_shape(placed.geometry, srid=4326, extended=True),
                 length_m=placed.length_m,
                 width_m=placed.width_m,
                 max_grade_pct=placed.max_grade_pct,
@@ -1804,12 +1876,15 @@ async def recompute_roads(
                 stationing_json={"data": placed.stationing} if placed.stationing else None,
                 kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
             )
-            db.add(road)
-            await db.flush()
-            
+            for placed in placed_roads
+        ]
+        db.add_all(road_records)
+        await db.flush()
+        
+        for placed, road in zip(placed_roads, road_records):
             total_length += placed.length_m or 0
             
-            road_responses.append(RoadResponse(
+            road_payloads.append(dict(
                 id=road.id,
                 name=road.name,
                 length_m=road.length_m,
@@ -1821,6 +1896,8 @@ async def recompute_roads(
                 kpi_flags={"flags": placed.kpi_flags} if placed.kpi_flags else None,
             ))
         
+        road_responses = ROAD_LIST_ADAPTER.validate_python(road_payloads)
+        
         await db.commit()
         
         logger.info(f"Recomputed roads for layout {layout_id}: {len(road_responses)} roads, {total_length:.1f}m total")
@@ -11,17 +11,18 @@ import logging
 from typing import Annotated, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from geoalchemy2.functions import ST_Area, ST_AsGeoJSON, ST_GeomFromText, ST_SetSRID, ST_Transform
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from geoalchemy2.functions import ST_AsGeoJSON, ST_GeomFromText, ST_SetSRID, ST_Transform
+from geoalchemy2.shape import from_shape
 from pydantic import BaseModel, Field
 from shapely import wkt
 from shapely.geometry import shape
-from sqlalchemy import cast, select
-from geoalchemy2 import Geography
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.api.auth import get_current_user
-from app.database import get_db
+from app.database import get_db, lazy_load_guard
 from app.models.exclusion_zone import ExclusionZone
 from app.models.layout import Layout
 from app.models.site import Site
@@ -104,6 +105,11 @@ MAX_FILE_SIZE = 10 * 1024 * 1024
 # Exclusion Zone Types (must be BEFORE /{site_id} to avoid path conflict)
 # =============================================================================
 
+# Zone types never change at runtime; serialize the response body once
+_ZONE_TYPES_JSON = ExclusionZoneTypesResponse(
+    types=list(ZONE_TYPE_INFO),
+).model_dump_json().encode()
+
 
 @router.get(
     "/exclusion-zone-types",
@@ -112,14 +118,14 @@ MAX_FILE_SIZE = 10 * 1024 * 1024
     description="Returns all available exclusion zone types with their default colors and buffers.",
     tags=["Exclusion Zones"],
 )
-async def get_zone_types() -> ExclusionZoneTypesResponse:
+async def get_zone_types() -> Response:
     """
     Get all available exclusion zone types.
     
     This endpoint does not require authentication as zone types are static.
     It must be defined before /{site_id} routes to avoid path conflicts.
     """
-    return ExclusionZoneTypesResponse(types=ZONE_TYPE_INFO)
+    return Response(content=_ZONE_TYPES_JSON, media_type="application/json")
 
 
 # =============================================================================
@@ -197,17 +203,7 @@ async def upload_site(
     )
     
     db.add(site)
-    await db.flush()  # Get the ID
-    
-    # Calculate area in square meters using PostGIS
-    # Cast geometry to geography to get area in square meters
-    area_result = await db.execute(
-        select(ST_Area(cast(Site.boundary, Geography))).where(Site.id == site.id)
-    )
-    area_m2 = area_result.scalar() or 0.0
-    
-    # Update site with calculated area
-    site.area_m2 = area_m2
+    await db.flush()  # Get the ID (area_m2 is generated by Postgres)
     
     # Upload original file to S3
     try:
@@ -260,7 +256,9 @@ async def get_site(
     """
     # Query site with ownership check
     result = await db.execute(
-        select(Site).where(
+        select(Site)
+        .options(*lazy_load_guard())
+        .where(
             Site.id == site_id,
             Site.owner_id == current_user.id,
         )
@@ -297,20 +295,46 @@ async def get_site(
     description="List all sites owned by the current user.",
 )
 async def list_sites(
+    bbox: Optional[str] = Query(
+        None,
+        description="Optional map viewport filter as 'min_lon,min_lat,max_lon,max_lat'",
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> SiteListResponse:
     """
     List all sites for the current user.
     
-    Returns basic site info without full geometry.
+    Returns basic site info without full geometry. Only the listed columns
+    are selected, so without a bbox the query is an index-only scan of
+    ix_sites_owner_created. When a viewport bbox is given, sites are
+    prefiltered with a bounding-box overlap (&&) against the precomputed
+    boundary_bbox column, then tested exactly against the subdivided boundary.
     """
-    result = await db.execute(
-        select(Site)
+    query = (
+        select(Site.id, Site.name, Site.area_m2, Site.created_at)
         .where(Site.owner_id == current_user.id)
         .order_by(Site.created_at.desc())
     )
-    sites = result.scalars().all()
+    
+    if bbox:
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="bbox must be 'min_lon,min_lat,max_lon,max_lat'",
+            )
+        viewport = func.ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326)
+        query = query.where(
+            Site.boundary_bbox.op("&&")(viewport),
+            func.ST_Intersects(
+                func.coalesce(Site.boundary_subdiv, Site.boundary), viewport
+            ),
+        )
+    
+    result = await db.execute(query)
+    sites = result.all()
     
     return SiteListResponse(
         sites=[
@@ -342,9 +366,12 @@ async def delete_site(
     
     Also deletes associated files from S3.
     """
-    # Query site with ownership check
+    # Query site with ownership check. The delete cascade walks layouts and
+    # terrain_cache, so load both up front with one IN query each.
     result = await db.execute(
-        select(Site).where(
+        select(Site)
+        .options(selectinload(Site.layouts), selectinload(Site.terrain_cache))
+        .where(
             Site.id == site_id,
             Site.owner_id == current_user.id,
         )
@@ -495,48 +522,42 @@ async def sync_regulatory_data(
         layer_types=request.layer_types,
     )
     
-    # Create exclusion zone records
-    created_zones = []
+    # Build all exclusion zone records, then insert them with one batched
+    # flush (a single multi-row INSERT ... RETURNING) instead of a flush
+    # and a geometry read-back per zone
+    zones: list[ExclusionZone] = []
+    zone_geometries: list[dict] = []
     for zone_data in zone_data_list:
         geometry_geojson = zone_data.pop("geometry")
         zone_site_id = zone_data.pop("site_id")
         
-        # Convert GeoJSON to WKT for PostGIS
         try:
             geom_shape = shape(geometry_geojson)
-            geom_wkt = geom_shape.wkt
         except Exception as e:
             logger.warning(f"Failed to convert geometry: {e}")
             continue
         
-        # Calculate area
-        area_m2 = geom_shape.area * (111000 ** 2)  # Approximate conversion from degrees²
-        
-        zone = ExclusionZone(
+        zones.append(ExclusionZone(
             site_id=zone_site_id,
             name=zone_data["name"],
             zone_type=zone_data["zone_type"],
-            geometry=ST_SetSRID(ST_GeomFromText(geom_wkt), 4326),
+            geometry=from_shape(geom_shape, srid=4326, extended=True),
             buffer_m=zone_data["buffer_m"],
             cost_multiplier=zone_data["cost_multiplier"],
             description=zone_data.get("description"),
-            area_m2=area_m2,
-        )
-        db.add(zone)
-        await db.flush()
-        
-        # Get geometry as GeoJSON for response
-        geojson_result = await db.execute(
-            select(ST_AsGeoJSON(ExclusionZone.geometry)).where(ExclusionZone.id == zone.id)
-        )
-        geometry_json = json.loads(geojson_result.scalar() or "{}")
-        
-        created_zones.append(ExclusionZoneResponse(
+        ))
+        zone_geometries.append(geometry_geojson)
+    
+    db.add_all(zones)
+    await db.flush()
+    
+    created_zones = [
+        ExclusionZoneResponse(
             id=zone.id,
             site_id=zone.site_id,
             name=zone.name,
             zone_type=zone.zone_type,
-            geometry=geometry_json,
+            geometry=geometry_geojson,
             buffer_m=zone.buffer_m,
             cost_multiplier=zone.cost_multiplier,
             description=zone.description,
@@ -544,7 +565,9 @@ async def sync_regulatory_data(
             color=zone.color,
             created_at=zone.created_at,
             updated_at=zone.updated_at,
-        ))
+        )
+        for zone, geometry_geojson in zip(zones, zone_geometries)
+    ]
     
     await db.commit()
     
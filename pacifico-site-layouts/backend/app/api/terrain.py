@@ -9,10 +9,11 @@ Provides endpoints for terrain analysis and visualization:
 """
 import json
 import logging
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 from geoalchemy2.functions import ST_AsGeoJSON
 from shapely.geometry import shape
 from sqlalchemy import select
@@ -21,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.auth import get_current_user
 from app.database import get_db
 from app.models.site import Site
+from app.models.terrain_cache import TerrainType
 from app.models.user import User
 from app.schemas.terrain import (
     BuildableAreaResponse,
@@ -28,7 +30,12 @@ from app.schemas.terrain import (
     SlopeHeatmapResponse,
     TerrainSummaryResponse,
 )
-from app.services.terrain_visualization_service import get_terrain_visualization_service
+from app.services.terrain_visualization_service import (
+    SLOPE_HEATMAP_VARIANT,
+    buildable_area_variant,
+    contours_variant,
+    get_terrain_visualization_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +76,61 @@ async def get_site_with_boundary(
     return site, boundary_geojson
 
 
+# Authenticated per-user data: browsers may store it but must revalidate
+_GEOJSON_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against a strong ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _geojson_response(
+    request: Request,
+    site_id: UUID,
+    terrain_type: TerrainType,
+    variant: str,
+    db: AsyncSession,
+    compute: Callable[[], Awaitable[dict[str, Any]]],
+    response_model: type[BaseModel],
+) -> Response:
+    """
+    Serve a terrain GeoJSON response with an ETag.
+    
+    The ETag is the content digest of the cached artifact, read from its
+    TerrainCache key without touching S3, so a matching If-None-Match is
+    answered with 304 straight away. Otherwise the serialized body is reused
+    from memory when the digest has been served before, and only built
+    (download, validate, serialize) on a miss.
+    """
+    terrain_service = get_terrain_visualization_service()
+    digest = await terrain_service.get_cached_digest(site_id, terrain_type, variant, db)
+    if digest is not None:
+        etag = f'"{digest}"'
+        headers = {"ETag": etag, "Cache-Control": _GEOJSON_CACHE_CONTROL}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        body = terrain_service.get_response_body(digest)
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers=headers)
+    
+    body = response_model(**await compute()).model_dump_json().encode()
+    
+    # Computing may have (re)generated the artifact under a new digest
+    digest = await terrain_service.get_cached_digest(site_id, terrain_type, variant, db)
+    if digest is None:
+        return Response(content=body, media_type="application/json")
+    terrain_service.remember_response_body(digest, body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": f'"{digest}"', "Cache-Control": _GEOJSON_CACHE_CONTROL},
+    )
+
+
 @router.get(
     "/{site_id}/terrain/summary",
     response_model=TerrainSummaryResponse,
@@ -127,6 +189,7 @@ async def get_terrain_summary(
     description="Returns contour lines as GeoJSON LineStrings at specified intervals.",
 )
 async def get_contours(
+    request: Request,
     site_id: UUID,
     interval_m: float = Query(
         default=5.0,
@@ -136,12 +199,13 @@ async def get_contours(
     ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> ContoursResponse:
+) -> Response:
     """
     Generate contour lines from DEM.
     
     Returns contour lines at the specified elevation interval.
-    Lines are clipped to the site boundary.
+    Lines are clipped to the site boundary. Responses carry an ETag and
+    honour If-None-Match.
     
     - **interval_m**: Contour interval in meters (1-100, default 5)
     """
@@ -159,8 +223,15 @@ async def get_contours(
     terrain_service = get_terrain_visualization_service()
     
     try:
-        contours = await terrain_service.get_contours(site_id, db, boundary, interval_m)
-        return ContoursResponse(**contours)
+        return await _geojson_response(
+            request,
+            site_id,
+            TerrainType.CONTOURS,
+            contours_variant(interval_m),
+            db,
+            lambda: terrain_service.get_contours(site_id, db, boundary, interval_m),
+            ContoursResponse,
+        )
     except ValueError as e:
         logger.error(f"Contour generation failed for site {site_id}: {e}")
         raise HTTPException(
@@ -182,6 +253,7 @@ async def get_contours(
     description="Returns areas where terrain slope is suitable for the specified asset type.",
 )
 async def get_buildable_area(
+    request: Request,
     site_id: UUID,
     asset_type: str = Query(
         default="solar_array",
@@ -195,12 +267,13 @@ async def get_buildable_area(
     ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> BuildableAreaResponse:
+) -> Response:
     """
     Generate buildable area polygons.
     
     Returns polygons representing areas where terrain slope is below
-    the threshold for the specified asset type.
+    the threshold for the specified asset type. Responses carry an ETag
+    and honour If-None-Match.
     
     Default slope limits:
     - solar_array: 15°
@@ -222,10 +295,17 @@ async def get_buildable_area(
     terrain_service = get_terrain_visualization_service()
     
     try:
-        buildable = await terrain_service.get_buildable_area(
-            site_id, db, boundary, asset_type, max_slope
+        return await _geojson_response(
+            request,
+            site_id,
+            TerrainType.BUILDABLE_AREA,
+            buildable_area_variant(asset_type, max_slope),
+            db,
+            lambda: terrain_service.get_buildable_area(
+                site_id, db, boundary, asset_type, max_slope
+            ),
+            BuildableAreaResponse,
         )
-        return BuildableAreaResponse(**buildable)
     except ValueError as e:
         logger.error(f"Buildable area failed for site {site_id}: {e}")
         raise HTTPException(
@@ -247,10 +327,11 @@ async def get_buildable_area(
     description="Returns slope zones as colored polygons for visualization.",
 )
 async def get_slope_heatmap(
+    request: Request,
     site_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> SlopeHeatmapResponse:
+) -> Response:
     """
     Generate slope heatmap as colored zone polygons.
     
@@ -260,7 +341,8 @@ async def get_slope_heatmap(
     - Orange (10-15°): Moderate, solar arrays only
     - Red (>15°): Steep, not buildable
     
-    Includes legend with color mapping.
+    Includes legend with color mapping. Responses carry an ETag and
+    honour If-None-Match.
     """
     site, boundary_geojson = await get_site_with_boundary(site_id, db, current_user)
     
@@ -276,8 +358,15 @@ async def get_slope_heatmap(
     terrain_service = get_terrain_visualization_service()
     
     try:
-        heatmap = await terrain_service.get_slope_heatmap(site_id, db, boundary)
-        return SlopeHeatmapResponse(**heatmap)
+        return await _geojson_response(
+            request,
+            site_id,
+            TerrainType.SLOPE_HEATMAP,
+            SLOPE_HEATMAP_VARIANT,
+            db,
+            lambda: terrain_service.get_slope_heatmap(site_id, db, boundary),
+            SlopeHeatmapResponse,
+        )
     except ValueError as e:
         logger.error(f"Slope heatmap failed for site {site_id}: {e}")
         raise HTTPException(
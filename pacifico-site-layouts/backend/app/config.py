@@ -6,7 +6,7 @@ from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote_plus
 
-from pydantic import field_validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     # Application
     app_name: str = "Pacifico Site Layouts API"
     debug: bool = False
+    # Register /debug/* routes (set ENABLE_DEBUG_ENDPOINTS=true for local debugging)
+    debug_endpoints_enabled: bool = Field(
+        default=False,
+        validation_alias="enable_debug_endpoints",
+    )
     
     # Database
     db_host: str = "localhost"
@@ -51,6 +56,11 @@ class Settings(BaseSettings):
     # Set USE_TERRAIN=false to fall back to the dummy generator for debugging.
     use_terrain: bool = True
     
+    # Terrain
+    # Per-pixel error bound (m) for LERC-compressed DEMs, e.g. 0.01. Unset
+    # keeps DEMs lossless (ZSTD).
+    dem_max_z_error_m: Optional[float] = Field(default=None, gt=0)
+    
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
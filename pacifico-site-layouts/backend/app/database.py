@@ -4,6 +4,8 @@ Database connection and session management.
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
@@ -46,6 +48,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def lazy_load_guard() -> tuple[LoaderOption, ...]:
+    """
+    Loader options that make unplanned relationship loads fail loudly.
+    
+    With DEBUG=true this returns raiseload("*"), so a response serializer
+    that touches a relationship that was not eager-loaded raises instead of
+    silently issuing one SELECT per row. Deployed workers leave DEBUG unset
+    and get no extra options. Do not use it on queries whose objects are
+    deleted via ORM cascades, which must load their children.
+    
+    Usage:
+        select(Site).options(selectinload(Site.layouts), *lazy_load_guard())
+    """
+    if not settings.debug:
+        return ()
+    return (raiseload("*"),)
+
+
 async def check_db_connection() -> bool:
     """Check if database connection is healthy."""
     try:
@@ -10,7 +10,7 @@ from sqlalchemy import Float, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 if TYPE_CHECKING:
     from app.models.layout import Layout
@@ -50,7 +50,7 @@ class Asset(Base, UUIDMixin, TimestampMixin):
     
     # Asset type
     asset_type: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(AssetType, "asset_type_enum"),
         nullable=False,
         index=True,
     )
@@ -105,6 +105,7 @@ class Asset(Base, UUIDMixin, TimestampMixin):
     layout: Mapped["Layout"] = relationship(
         "Layout",
         back_populates="assets",
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
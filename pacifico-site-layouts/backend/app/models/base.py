@@ -1,11 +1,15 @@
 """
 Base model class with common fields and utilities.
 """
+import os
+import time
 import uuid
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
 from sqlalchemy import DateTime, func
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -19,6 +23,23 @@ class Base(DeclarativeBase):
     }
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+    
+    The top 48 bits are the Unix timestamp in milliseconds and the rest is
+    random, so new primary keys land on the right-most B-tree leaf instead
+    of a random page.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | rand & ((1 << 80) - 1)
+    # Set version (7) and RFC 4122 variant bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamps."""
     
@@ -36,11 +57,32 @@ class TimestampMixin:
 
 
 class UUIDMixin:
-    """Mixin that adds a UUID primary key."""
+    """
+    Mixin that adds a UUID primary key.
+
+    Keep as_uuid=True: asyncpg already decodes uuid columns into its C-level
+    UUID type and SQLAlchemy installs no result processor for it, whereas
+    as_uuid=False adds a per-row str() conversion on every hydrated FK/PK.
     
+    Keys are UUIDv7 so inserts stay append-only on the primary key index.
+    """
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
+
+def pg_enum(enum_cls: type[Enum], name: str) -> SAEnum:
+    """
+    Build a native Postgres ENUM column type from a str Enum.
+    
+    Members are stored by value (e.g. 'solar_array'), and rows are
+    hydrated as plain strings so existing string comparisons keep working.
+    """
+    return SAEnum(
+        *[member.value for member in enum_cls],
+        name=name,
+        native_enum=True,
+    )
@@ -10,11 +10,11 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Float, ForeignKey, String, Text
+from sqlalchemy import Computed, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 if TYPE_CHECKING:
     from app.models.site import Site
@@ -69,6 +69,12 @@ class ExclusionZone(Base, UUIDMixin, TimestampMixin):
     """
     
     __tablename__ = "exclusion_zones"
+    __table_args__ = (
+        # Exclusion polygons routinely overlap; SP-GiST handles that better than GiST
+        Index("ix_exclusion_zones_geometry_spgist", "geometry", postgresql_using="spgist"),
+    )
+    # Fetch the generated area_m2 via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     # Zone details
     name: Mapped[str] = mapped_column(
@@ -78,7 +84,7 @@ class ExclusionZone(Base, UUIDMixin, TimestampMixin):
     
     # Zone type (enum)
     zone_type: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(ExclusionZoneType, "exclusion_zone_type_enum"),
         nullable=False,
         default=ExclusionZoneType.CUSTOM.value,
         index=True,
@@ -86,7 +92,7 @@ class ExclusionZone(Base, UUIDMixin, TimestampMixin):
     
     # Geometry as PostGIS POLYGON (SRID 4326 = WGS84)
     geometry: Mapped[str] = mapped_column(
-        Geometry(geometry_type="POLYGON", srid=4326),
+        Geometry(geometry_type="POLYGON", srid=4326, spatial_index=False),
         nullable=False,
     )
     
@@ -110,9 +116,10 @@ class ExclusionZone(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
     
-    # Calculated area in square meters
+    # Area in square meters, generated by Postgres from the geometry
     area_m2: Mapped[Optional[float]] = mapped_column(
         Float,
+        Computed("ST_Area(geometry::geography)", persisted=True),
         nullable=True,
     )
     
@@ -126,6 +133,7 @@ class ExclusionZone(Base, UUIDMixin, TimestampMixin):
     site: Mapped["Site"] = relationship(
         "Site",
         back_populates="exclusion_zones",
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
@@ -11,7 +11,7 @@ from sqlalchemy import Float, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 if TYPE_CHECKING:
     from app.models.asset import Asset
@@ -57,7 +57,7 @@ class Layout(Base, UUIDMixin, TimestampMixin):
     
     # Layout status
     status: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(LayoutStatus, "layout_status_enum"),
         nullable=False,
         default=LayoutStatus.QUEUED.value,
         index=True,
@@ -71,7 +71,7 @@ class Layout(Base, UUIDMixin, TimestampMixin):
     
     # Phase 4 (GAP): Progress tracking
     stage: Mapped[Optional[str]] = mapped_column(
-        String(50),
+        pg_enum(LayoutStage, "layout_stage_enum"),
         nullable=True,
         default=LayoutStage.QUEUED.value,
     )
@@ -121,13 +121,18 @@ class Layout(Base, UUIDMixin, TimestampMixin):
         "Site",
         back_populates="layouts",
         primaryjoin="Layout.site_id == Site.id",
+        lazy="raise_on_sql",
     )
     
-    # Assets in this layout
+    # Assets in this layout. Loading must be explicit (selectinload) so a
+    # serializer can't silently issue one query per layout; deletes rely on
+    # the ON DELETE CASCADE foreign key instead of loading the collection.
     assets: Mapped[list["Asset"]] = relationship(
         "Asset",
         back_populates="layout",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     # Roads in this layout
@@ -135,6 +140,8 @@ class Layout(Base, UUIDMixin, TimestampMixin):
         "Road",
         back_populates="layout",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
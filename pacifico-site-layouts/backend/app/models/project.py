@@ -44,13 +44,17 @@ class Project(Base, UUIDMixin, TimestampMixin):
     owner: Mapped["User"] = relationship(
         "User",
         back_populates="projects",
+        lazy="raise_on_sql",
     )
     
-    # Sites in this project
+    # Sites in this project. sites.project_id is ON DELETE SET NULL, so
+    # deleting a project keeps its sites; the ORM leaves that to the database
+    # instead of loading the collection.
     sites: Mapped[list["Site"]] = relationship(
         "Site",
         back_populates="project",
-        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
@@ -99,6 +99,7 @@ class Road(Base, UUIDMixin, TimestampMixin):
     layout: Mapped["Layout"] = relationship(
         "Layout",
         back_populates="roads",
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
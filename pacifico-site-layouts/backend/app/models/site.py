@@ -2,12 +2,25 @@
 Site model - represents a physical site with a boundary polygon.
 
 D-05-06: Added preferred_layout_id for marking preferred layout variant.
+
+Loading collections: Site has several one-to-many relationships (layouts,
+exclusion_zones, terrain_cache). Endpoints that need them should request
+them explicitly with selectinload(Site.layouts), etc. Each collection is
+then fetched with one IN query no matter how many sites are loaded.
+Avoid joinedload for more than one collection, since it multiplies rows
+into a cartesian product.
+
+Every relationship in app.models declares back_populates on both sides
+and lazy="raise_on_sql": nothing in the API traverses a relationship
+implicitly (and under AsyncSession an implicit load would fail anyway),
+so any load has to be requested with a loader option. Many-to-one
+attributes still resolve from the identity map without SQL.
 """
 import uuid
 from typing import TYPE_CHECKING, Optional
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy import Computed, Float, ForeignKey, Index, String, event, func, inspect, text, update
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,6 +43,34 @@ class Site(Base, UUIDMixin, TimestampMixin):
     """
     
     __tablename__ = "sites"
+    __table_args__ = (
+        # SP-GiST partitions overlapping site boundaries better than GiST,
+        # giving a smaller index for point-in-polygon and overlap lookups.
+        Index("ix_sites_boundary_spgist", "boundary", postgresql_using="spgist"),
+        Index("ix_sites_boundary_bbox_spgist", "boundary_bbox", postgresql_using="spgist"),
+        Index("ix_sites_boundary_subdiv_spgist", "boundary_subdiv", postgresql_using="spgist"),
+        # Multi-tenant listing: owner + project filter, and the site list
+        # ordered by created_at with INCLUDE columns covering every column
+        # list_sites selects, so the listing is an index-only scan.
+        # Both lead with owner_id, so no standalone owner_id index is needed.
+        Index("ix_sites_owner_project", "owner_id", "project_id"),
+        Index(
+            "ix_sites_owner_created",
+            "owner_id",
+            "created_at",
+            postgresql_include=["id", "name", "area_m2"],
+        ),
+        # Most sites have no preferred layout; index only the ones that do.
+        # Also serves the ON DELETE SET NULL lookup when a layout is deleted.
+        Index(
+            "ix_sites_preferred_layout",
+            "preferred_layout_id",
+            postgresql_where=text("preferred_layout_id IS NOT NULL"),
+        ),
+    )
+    # Fetch generated columns (area_m2) via RETURNING on flush, so async
+    # callers can read them without an implicit refresh.
+    __mapper_args__ = {"eager_defaults": True}
     
     # Site details
     name: Mapped[str] = mapped_column(
@@ -39,13 +80,34 @@ class Site(Base, UUIDMixin, TimestampMixin):
     
     # Boundary as PostGIS POLYGON (SRID 4326 = WGS84)
     boundary: Mapped[str] = mapped_column(
-        Geometry(geometry_type="POLYGON", srid=4326),
+        Geometry(geometry_type="POLYGON", srid=4326, spatial_index=False),
         nullable=False,
     )
     
-    # Calculated area in square meters
+    # Bounding box of the boundary, kept in sync by _sync_boundary_bbox below.
+    # Viewport/extent queries filter on this 5-point polygon instead of the
+    # full boundary ring. Only used inside SQL predicates, so it is deferred
+    # and never loaded with the row.
+    boundary_bbox: Mapped[Optional[str]] = mapped_column(
+        Geometry(geometry_type="POLYGON", srid=4326, spatial_index=False),
+        nullable=True,
+        deferred=True,
+    )
+    
+    # Boundary split with ST_Subdivide(boundary, 64), kept in sync by
+    # _sync_boundary_subdiv below. Intersection tests against many small
+    # parts touch far fewer vertices than one large ring. Deferred for the
+    # same reason as boundary_bbox; it is at least as large as the boundary.
+    boundary_subdiv: Mapped[Optional[str]] = mapped_column(
+        Geometry(geometry_type="MULTIPOLYGON", srid=4326, spatial_index=False),
+        nullable=True,
+        deferred=True,
+    )
+    
+    # Area in square meters, generated by Postgres from the boundary
     area_m2: Mapped[Optional[float]] = mapped_column(
         Float,
+        Computed("ST_Area(boundary::geography)", persisted=True),
         nullable=True,
     )
 
@@ -77,6 +139,7 @@ class Site(Base, UUIDMixin, TimestampMixin):
     project: Mapped[Optional["Project"]] = relationship(
         "Project",
         back_populates="sites",
+        lazy="raise_on_sql",
     )
     
     # Owner relationship (required for multi-tenant isolation)
@@ -84,11 +147,11 @@ class Site(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     owner: Mapped["User"] = relationship(
         "User",
         back_populates="sites",
+        lazy="raise_on_sql",
     )
     
     # Layouts for this site
@@ -98,6 +161,7 @@ class Site(Base, UUIDMixin, TimestampMixin):
         back_populates="site",
         cascade="all, delete-orphan",
         primaryjoin="Site.id == Layout.site_id",
+        lazy="raise_on_sql",
     )
     
     # Terrain cache entries
@@ -105,6 +169,7 @@ class Site(Base, UUIDMixin, TimestampMixin):
         "TerrainCache",
         back_populates="site",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     
     # Exclusion zones (D-03)
@@ -112,6 +177,8 @@ class Site(Base, UUIDMixin, TimestampMixin):
         "ExclusionZone",
         back_populates="site",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     # D-05-06: Preferred layout for this site
@@ -125,3 +192,32 @@ class Site(Base, UUIDMixin, TimestampMixin):
     def __repr__(self) -> str:
         return f"<Site {self.name}>"
 
+
+@event.listens_for(Site, "before_insert")
+@event.listens_for(Site, "before_update")
+def _sync_boundary_bbox(mapper, connection, target: Site) -> None:
+    """Recompute boundary_bbox in SQL whenever the boundary is written."""
+    if inspect(target).attrs.boundary.history.has_changes():
+        target.boundary_bbox = func.ST_Envelope(target.boundary)
+
+
+# Max vertices per part when subdividing boundaries
+BOUNDARY_SUBDIVIDE_MAX_VERTICES = 64
+
+
+@event.listens_for(Site, "after_insert")
+@event.listens_for(Site, "after_update")
+def _sync_boundary_subdiv(mapper, connection, target: Site) -> None:
+    """Recompute boundary_subdiv from the stored boundary when it changes."""
+    if not inspect(target).attrs.boundary.history.has_changes():
+        return
+    connection.execute(
+        update(Site.__table__)
+        .where(Site.__table__.c.id == target.id)
+        .values(
+            boundary_subdiv=text(
+                "(SELECT ST_Multi(ST_Collect(part)) "
+                f"FROM ST_Subdivide(boundary, {BOUNDARY_SUBDIVIDE_MAX_VERTICES}) AS part)"
+            )
+        )
+    )
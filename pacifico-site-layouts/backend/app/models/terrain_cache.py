@@ -5,7 +5,7 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy import Float, ForeignKey, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,27 +34,45 @@ class TerrainCache(Base, UUIDMixin, TimestampMixin):
     """
     
     __tablename__ = "terrain_cache"
+    __table_args__ = (
+        # Cache lookups always filter on all three columns; the unique
+        # constraint's index serves them with a single probe and also stops
+        # racing writers from inserting duplicate rows. NULLS NOT DISTINCT
+        # (Postgres 15+) makes un-keyed (NULL variant) entries unique too.
+        UniqueConstraint(
+            "site_id",
+            "terrain_type",
+            "variant_key",
+            name="uq_terrain_cache_variant",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     
     # Type of terrain data
     terrain_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
     
     # Variant key for parameterized caches (e.g., asset type, interval)
     variant_key: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
-        index=True,
     )
     
-    # S3 key where the raster is stored
+    # S3 key where the raster is stored. New keys embed content_hash, so
+    # an object at a given key never changes and can be cached as immutable.
     s3_key: Mapped[str] = mapped_column(
         String(512),
         nullable=False,
     )
     
+    # SHA-256 of the stored object (NULL for rows written before hashing)
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+    )
+    
     # Resolution in meters
     resolution_m: Mapped[Optional[float]] = mapped_column(
         Float,
@@ -72,11 +90,11 @@ class TerrainCache(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("sites.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     site: Mapped["Site"] = relationship(
         "Site",
         back_populates="terrain_cache",
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
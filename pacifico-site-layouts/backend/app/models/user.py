@@ -49,11 +49,15 @@ class User(Base, UUIDMixin, TimestampMixin):
         "Project",
         back_populates="owner",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     sites: Mapped[list["Site"]] = relationship(
         "Site",
         back_populates="owner",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     def __repr__(self) -> str:
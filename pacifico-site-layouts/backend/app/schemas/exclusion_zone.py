@@ -5,10 +5,12 @@ Phase D-03: Schemas for creating, updating, and retrieving exclusion zones.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.schemas.geojson import GeoJSONPolygon
 
 
 class ExclusionZoneType(str, Enum):
@@ -29,8 +31,8 @@ class ExclusionZoneTypeInfo(BaseModel):
     description: str
 
 
-# Zone type metadata for frontend
-ZONE_TYPE_INFO = [
+# Zone type metadata for frontend (static; the API serves a pre-serialized copy)
+ZONE_TYPE_INFO = (
     ExclusionZoneTypeInfo(
         type="environmental",
         label="Environmental",
@@ -66,7 +68,24 @@ ZONE_TYPE_INFO = [
         default_buffer_m=0,
         description="User-defined constraints",
     ),
-]
+)
+
+
+def _check_polygon(cls, v: Optional[GeoJSONPolygon]) -> Optional[GeoJSONPolygon]:
+    """
+    Shared geometry validator for zone create/update schemas.
+    
+    The GeoJSONPolygon type already enforces type/coordinate shapes; this
+    only checks that the outer ring is closed (at least 4 positions).
+    """
+    if v is None:
+        return v
+    rings = v.coordinates
+    if not rings:
+        raise ValueError("Polygon must have coordinates")
+    if len(rings[0]) < 4:
+        raise ValueError("Polygon must have at least 4 coordinates (closed ring)")
+    return v
 
 
 class ExclusionZoneCreate(BaseModel):
@@ -82,7 +101,7 @@ class ExclusionZoneCreate(BaseModel):
         default=ExclusionZoneType.CUSTOM,
         description="Type of exclusion zone",
     )
-    geometry: dict[str, Any] = Field(
+    geometry: GeoJSONPolygon = Field(
         ...,
         description="GeoJSON Polygon geometry",
     )
@@ -104,26 +123,7 @@ class ExclusionZoneCreate(BaseModel):
         description="Optional description of the zone",
     )
     
-    @field_validator("geometry")
-    @classmethod
-    def validate_geometry(cls, v: dict) -> dict:
-        """Validate that geometry is a valid GeoJSON Polygon."""
-        if not isinstance(v, dict):
-            raise ValueError("Geometry must be a GeoJSON object")
-        
-        geom_type = v.get("type")
-        if geom_type != "Polygon":
-            raise ValueError(f"Geometry must be a Polygon, got {geom_type}")
-        
-        coords = v.get("coordinates")
-        if not coords or not isinstance(coords, list):
-            raise ValueError("Polygon must have coordinates")
-        
-        # Basic validation: outer ring should have at least 4 points (closed polygon)
-        if len(coords) < 1 or len(coords[0]) < 4:
-            raise ValueError("Polygon must have at least 4 coordinates (closed ring)")
-        
-        return v
+    validate_geometry = field_validator("geometry")(classmethod(_check_polygon))
 
 
 class ExclusionZoneUpdate(BaseModel):
@@ -139,7 +139,7 @@ class ExclusionZoneUpdate(BaseModel):
         None,
         description="Type of exclusion zone",
     )
-    geometry: Optional[dict[str, Any]] = Field(
+    geometry: Optional[GeoJSONPolygon] = Field(
         None,
         description="GeoJSON Polygon geometry",
     )
@@ -161,28 +161,7 @@ class ExclusionZoneUpdate(BaseModel):
         description="Optional description of the zone",
     )
     
-    @field_validator("geometry")
-    @classmethod
-    def validate_geometry(cls, v: Optional[dict]) -> Optional[dict]:
-        """Validate geometry if provided."""
-        if v is None:
-            return v
-        
-        if not isinstance(v, dict):
-            raise ValueError("Geometry must be a GeoJSON object")
-        
-        geom_type = v.get("type")
-        if geom_type != "Polygon":
-            raise ValueError(f"Geometry must be a Polygon, got {geom_type}")
-        
-        coords = v.get("coordinates")
-        if not coords or not isinstance(coords, list):
-            raise ValueError("Polygon must have coordinates")
-        
-        if len(coords) < 1 or len(coords[0]) < 4:
-            raise ValueError("Polygon must have at least 4 coordinates (closed ring)")
-        
-        return v
+    validate_geometry = field_validator("geometry")(classmethod(_check_polygon))
 
 
 class ExclusionZoneResponse(BaseModel):
@@ -192,7 +171,7 @@ class ExclusionZoneResponse(BaseModel):
     site_id: UUID
     name: str
     zone_type: str
-    geometry: dict[str, Any] = Field(..., description="GeoJSON Polygon geometry")
+    geometry: GeoJSONPolygon = Field(..., description="GeoJSON Polygon geometry")
     buffer_m: float
     cost_multiplier: float = Field(..., description="Cost multiplier for pathfinding")
     description: Optional[str]
@@ -201,8 +180,7 @@ class ExclusionZoneResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ExclusionZoneListResponse(BaseModel):
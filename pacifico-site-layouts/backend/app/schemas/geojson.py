@@ -0,0 +1,75 @@
+"""
+Typed GeoJSON geometry schemas.
+
+Geometries used to be typed as dict[str, Any], which forces Pydantic into
+generic dict validation and serialization. These models pin the geometry
+type with a Literal and the coordinates with concrete float lists, so
+pydantic-core validates and serializes them on its typed fast path.
+
+Each model exposes __geo_interface__, so shapely.geometry.shape() accepts
+instances directly.
+
+LinealGeometry and PolygonalGeometry are unions discriminated on "type", so
+a payload is validated against exactly one model instead of every member.
+"""
+from typing import Annotated, Any, Literal, Union
+
+from pydantic import BaseModel, Field
+
+# A GeoJSON position: [lon, lat] (optionally with elevation)
+Position = list[float]
+
+
+class _GeoJSONGeometry(BaseModel):
+    """Base class for typed GeoJSON geometries."""
+
+    @property
+    def __geo_interface__(self) -> dict[str, Any]:
+        """GeoJSON mapping consumed by shapely.geometry.shape()."""
+        return {"type": self.type, "coordinates": self.coordinates}
+
+
+class GeoJSONPoint(_GeoJSONGeometry):
+    """GeoJSON Point geometry."""
+
+    type: Literal["Point"]
+    coordinates: Position
+
+
+class GeoJSONLineString(_GeoJSONGeometry):
+    """GeoJSON LineString geometry."""
+
+    type: Literal["LineString"]
+    coordinates: list[Position]
+
+
+class GeoJSONPolygon(_GeoJSONGeometry):
+    """GeoJSON Polygon geometry (outer ring followed by holes)."""
+
+    type: Literal["Polygon"]
+    coordinates: list[list[Position]]
+
+
+class GeoJSONMultiLineString(_GeoJSONGeometry):
+    """GeoJSON MultiLineString geometry."""
+
+    type: Literal["MultiLineString"]
+    coordinates: list[list[Position]]
+
+
+class GeoJSONMultiPolygon(_GeoJSONGeometry):
+    """GeoJSON MultiPolygon geometry."""
+
+    type: Literal["MultiPolygon"]
+    coordinates: list[list[list[Position]]]
+
+
+LinealGeometry = Annotated[
+    Union[GeoJSONLineString, GeoJSONMultiLineString],
+    Field(discriminator="type"),
+]
+
+PolygonalGeometry = Annotated[
+    Union[GeoJSONPolygon, GeoJSONMultiPolygon],
+    Field(discriminator="type"),
+]
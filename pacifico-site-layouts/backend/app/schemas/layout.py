@@ -4,18 +4,73 @@ Pydantic schemas for Layout API endpoints.
 D-05: Added variant generation support with multiple optimization strategies.
 Generation Profiles: Added support for different asset mixes (solar, gas+bess, wind, hybrid).
 """
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Final, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter, field_validator
+from typing_extensions import NotRequired, TypedDict
 
 from app.config import get_settings
+from app.schemas.geojson import GeoJSONLineString, GeoJSONPoint
 from app.services.generation_profiles import GenerationProfile, get_profile_info
 
-# Get terrain default from config (environment-specific)
-_settings = get_settings()
+# Canonical home of the layout schemas; import them from here only so each
+# model's core schema is built once per process.
+__all__ = [
+    "LayoutStrategy",
+    "StrategyLiteral",
+    "STRATEGY_BITS",
+    "ALL_STRATEGIES_MASK",
+    "StrategyInfo",
+    "STRATEGY_INFO_LIST",
+    "GenerateLayoutRequest",
+    "GENERATE_REQUEST_ADAPTER",
+    "ProfileInfo",
+    "BlockLayoutInfo",
+    "ProfilesResponse",
+    "AssetResponse",
+    "ASSET_LIST_ADAPTER",
+    "RoadStation",
+    "RoadStationing",
+    "RoadKpiFlags",
+    "PerAssetEarthwork",
+    "RoadResponse",
+    "ROAD_LIST_ADAPTER",
+    "LayoutResponse",
+    "LayoutDetailResponse",
+    "LayoutGenerateResponse",
+    "LayoutListItem",
+    "LayoutListResponse",
+    "LayoutEnqueueResponse",
+    "LayoutGenerationStage",
+    "GenerationStageLiteral",
+    "STAGE_PROGRESS",
+    "LayoutStatusResponse",
+    "LayoutVariantMetrics",
+    "VariantComparison",
+    "LayoutVariantResponse",
+    "LayoutVariantsResponse",
+    "LayoutStrategiesResponse",
+    "AssetMoveRequest",
+    "AssetMoveResponse",
+    "RecomputeRoadsRequest",
+    "RecomputeRoadsResponse",
+    "RecomputeEarthworkRequest",
+    "RecomputeEarthworkResponse",
+    "ComplianceRuleRequest",
+    "ComplianceRuleResponse",
+    "ComplianceViolation",
+    "ComplianceCheckRequest",
+    "ComplianceCheckResponse",
+    "GetComplianceRulesRequest",
+    "GetComplianceRulesResponse",
+    "GISPublishRequest",
+    "GISPublishResponse",
+]
 
 
 # =============================================================================
@@ -31,6 +86,16 @@ class LayoutStrategy(str, Enum):
     CLUSTERED = "clustered"
 
 
+# Wire form of LayoutStrategy for hot request/response bodies. Literal
+# fields validate with a plain string lookup instead of the Enum validator;
+# API code converts to LayoutStrategy at the boundary where it needs the enum.
+StrategyLiteral = Literal["balanced", "density", "low_earthwork", "clustered"]
+
+# Bit i of a strategy mask selects STRATEGY_BITS[i]
+STRATEGY_BITS: Final[tuple[LayoutStrategy, ...]] = tuple(LayoutStrategy)
+ALL_STRATEGIES_MASK: Final[int] = (1 << len(STRATEGY_BITS)) - 1
+
+
 class StrategyInfo(BaseModel):
     """Information about a layout strategy."""
     strategy: LayoutStrategy
@@ -38,8 +103,8 @@ class StrategyInfo(BaseModel):
     description: str
 
 
-# Strategy metadata for frontend
-STRATEGY_INFO_LIST = [
+# Strategy metadata for frontend (static; the API serves a pre-serialized copy)
+STRATEGY_INFO_LIST: Final[tuple[StrategyInfo, ...]] = (
     StrategyInfo(
         strategy=LayoutStrategy.BALANCED,
         name="Balanced",
@@ -60,7 +125,7 @@ STRATEGY_INFO_LIST = [
         name="Clustered",
         description="Group assets tightly to minimize infrastructure",
     ),
-]
+)
 
 
 class GenerateLayoutRequest(BaseModel):
@@ -74,7 +139,9 @@ class GenerateLayoutRequest(BaseModel):
         description="Target total capacity in kW (supports up to 5 GW microgrids)",
     )
     use_terrain: bool = Field(
-        default=_settings.use_terrain,  # From config: USE_TERRAIN env var
+        # From config (USE_TERRAIN env var), resolved per request rather than
+        # at import so loading the schemas doesn't hydrate settings
+        default_factory=lambda: get_settings().use_terrain,
         description="Use terrain-aware placement (Phase B). Set False for dummy placement.",
     )
     dem_resolution_m: int = Field(
@@ -93,10 +160,37 @@ class GenerateLayoutRequest(BaseModel):
         default=False,
         description="D-05: Generate multiple layout variants with different strategies",
     )
-    variant_strategies: Optional[list[LayoutStrategy]] = Field(
+    variant_strategies: Optional[list[StrategyLiteral]] = Field(
         default=None,
         description="D-05: Strategies to use (defaults to all 4 if generate_variants=True)",
     )
+    variant_strategies_mask: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=ALL_STRATEGIES_MASK,
+        description=(
+            "D-05: Strategy selection as a bitmask (1=balanced, 2=density, "
+            "4=low_earthwork, 8=clustered). Takes precedence over variant_strategies."
+        ),
+    )
+    
+    @property
+    def selected_strategies(self) -> list[LayoutStrategy]:
+        """Strategies to generate, resolved from the mask, the list, or all."""
+        if self.variant_strategies_mask is not None:
+            mask = self.variant_strategies_mask
+        elif self.variant_strategies:
+            mask = 0
+            for value in self.variant_strategies:
+                mask |= 1 << STRATEGY_BITS.index(LayoutStrategy(value))
+        else:
+            mask = ALL_STRATEGIES_MASK
+        return [strategy for bit, strategy in enumerate(STRATEGY_BITS) if mask >> bit & 1]
+
+
+# Built once at import; the generate endpoints validate raw request bytes
+# with it in a single pydantic-core call.
+GENERATE_REQUEST_ADAPTER = TypeAdapter(GenerateLayoutRequest)
 
 
 # =============================================================================
@@ -133,7 +227,7 @@ class AssetResponse(BaseModel):
     asset_type: str
     name: Optional[str] = None
     capacity_kw: Optional[float] = None
-    position: dict[str, Any] = Field(..., description="Position as GeoJSON Point")
+    position: GeoJSONPoint = Field(..., description="Position as GeoJSON Point")
     elevation_m: Optional[float] = Field(None, description="Ground elevation in meters")
     slope_deg: Optional[float] = Field(None, description="Terrain slope in degrees")
     footprint_length_m: Optional[float] = Field(None, description="Footprint length (N-S) in meters")
@@ -146,8 +240,39 @@ class AssetResponse(BaseModel):
     suitability_score: Optional[float] = Field(None, description="Composite terrain suitability score (0-1, higher is better)")
     rotation_deg: Optional[float] = Field(None, description="Optimal footprint rotation in degrees")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Typed shapes for the JSON payloads produced by the layout generator.
+# TypedDicts validate on pydantic-core's typed-dict path without building
+# model instances. (typing_extensions is required for TypedDict on <3.12.)
+
+
+class RoadStation(TypedDict):
+    """One stationing point along a road."""
+    station_m: float
+    x: float
+    y: float
+    elevation_m: float
+    grade_pct: NotRequired[float]
+
+
+class RoadStationing(TypedDict):
+    """Road.stationing_json payload."""
+    data: list[RoadStation]
+
+
+class RoadKpiFlags(TypedDict):
+    """Road.kpi_flags payload."""
+    flags: list[str]
+
+
+class PerAssetEarthwork(TypedDict):
+    """Per-asset pad grading volumes from the cut/fill calculation."""
+    asset_name: str
+    asset_type: str
+    cut_m3: float
+    fill_m3: float
 
 
 class RoadResponse(BaseModel):
@@ -157,7 +282,7 @@ class RoadResponse(BaseModel):
     name: Optional[str] = None
     length_m: Optional[float] = None
     width_m: Optional[float] = Field(5.0, description="Road width in meters")
-    geometry: dict[str, Any] = Field(..., description="Geometry as GeoJSON LineString")
+    geometry: GeoJSONLineString = Field(..., description="Geometry as GeoJSON LineString")
     max_grade_pct: Optional[float] = Field(None, description="Maximum grade along road (%)")
     
     # Enhanced road metrics
@@ -165,11 +290,18 @@ class RoadResponse(BaseModel):
     parent_segment_id: Optional[UUID] = Field(None, description="ID of the parent road segment")
     avg_grade_pct: Optional[float] = Field(None, description="Average grade (%)")
     max_cumulative_cost: Optional[float] = Field(None, description="Maximum cumulative cost to reach this segment")
-    kpi_flags: Optional[dict[str, Any]] = Field(None, description="KPI flags raised for this road")
-    stationing_json: Optional[dict[str, Any]] = Field(None, description="Detailed stationing data (chainage, elev, etc.)")
+    # Generator/JSONB payloads are passed through as-is; the TypedDicts only
+    # shape the serializer and the OpenAPI schema.
+    kpi_flags: Optional[SkipValidation[RoadKpiFlags]] = Field(None, description="KPI flags raised for this road")
+    stationing_json: Optional[SkipValidation[RoadStationing]] = Field(None, description="Detailed stationing data (chainage, elev, etc.)")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Built once at import. Generation endpoints validate their freshly built
+# asset/road payloads in a single call rather than one model per row.
+ASSET_LIST_ADAPTER = TypeAdapter(list[AssetResponse])
+ROAD_LIST_ADAPTER = TypeAdapter(list[RoadResponse])
 
 
 class LayoutResponse(BaseModel):
@@ -191,8 +323,7 @@ class LayoutResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LayoutDetailResponse(LayoutResponse):
@@ -227,8 +358,7 @@ class LayoutListItem(BaseModel):
     total_capacity_kw: Optional[float] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LayoutListResponse(BaseModel):
@@ -256,8 +386,7 @@ class LayoutEnqueueResponse(BaseModel):
         description="Confirmation message"
     )
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LayoutGenerationStage(str, Enum):
@@ -274,8 +403,23 @@ class LayoutGenerationStage(str, Enum):
     FAILED = "failed"              # Error
 
 
-# Stage progress percentages for progress bar
-STAGE_PROGRESS = {
+# Wire form of LayoutGenerationStage (what LayoutStatusResponse serializes)
+GenerationStageLiteral = Literal[
+    "queued",
+    "fetching_dem",
+    "computing_slope",
+    "analyzing_terrain",
+    "placing_assets",
+    "generating_roads",
+    "computing_earthwork",
+    "finalizing",
+    "completed",
+    "failed",
+]
+
+
+# Stage progress percentages for progress bar (read-only)
+STAGE_PROGRESS: Final[Mapping[LayoutGenerationStage, int]] = MappingProxyType({
     LayoutGenerationStage.QUEUED: 0,
     LayoutGenerationStage.FETCHING_DEM: 10,
     LayoutGenerationStage.COMPUTING_SLOPE: 25,
@@ -286,7 +430,7 @@ STAGE_PROGRESS = {
     LayoutGenerationStage.FINALIZING: 95,
     LayoutGenerationStage.COMPLETED: 100,
     LayoutGenerationStage.FAILED: -1,
-}
+})
 
 
 class LayoutStatusResponse(BaseModel):
@@ -303,7 +447,7 @@ class LayoutStatusResponse(BaseModel):
     )
     
     # Phase 4 (GAP): Progress tracking
-    stage: Optional[str] = Field(
+    stage: Optional[GenerationStageLiteral] = Field(
         None,
         description="Current generation stage (e.g., 'fetching_dem', 'placing_assets')"
     )
@@ -325,8 +469,7 @@ class LayoutStatusResponse(BaseModel):
     cut_volume_m3: Optional[float] = Field(None, description="Cut volume in cubic meters")
     fill_volume_m3: Optional[float] = Field(None, description="Fill volume in cubic meters")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # =============================================================================
@@ -338,7 +481,7 @@ class LayoutVariantMetrics(BaseModel):
     """Metrics for a single layout variant (D-05)."""
     
     layout_id: UUID
-    strategy: LayoutStrategy
+    strategy: StrategyLiteral
     strategy_name: str
     total_capacity_kw: float
     asset_count: int
@@ -371,7 +514,7 @@ class LayoutVariantResponse(BaseModel):
     Includes the strategy used and full layout data.
     """
     
-    strategy: LayoutStrategy
+    strategy: StrategyLiteral
     strategy_name: str
     layout: LayoutResponse
     assets: list[AssetResponse]
@@ -390,8 +533,7 @@ class LayoutVariantsResponse(BaseModel):
     variants: list[LayoutVariantResponse]
     comparison: VariantComparison
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LayoutStrategiesResponse(BaseModel):
@@ -408,7 +550,7 @@ class LayoutStrategiesResponse(BaseModel):
 class AssetMoveRequest(BaseModel):
     """Request schema for moving an asset (Phase 3 GAP)."""
     
-    position: dict = Field(
+    position: GeoJSONPoint = Field(
         ...,
         description="New position as GeoJSON Point {type: 'Point', coordinates: [lng, lat]}",
     )
@@ -417,17 +559,23 @@ class AssetMoveRequest(BaseModel):
         description="Re-evaluate slope and suitability at new position",
     )
     
+    @field_validator("position")
+    @classmethod
+    def validate_position(cls, v: GeoJSONPoint) -> GeoJSONPoint:
+        """Require both longitude and latitude."""
+        if len(v.coordinates) < 2:
+            raise ValueError("Point must have [lng, lat] coordinates")
+        return v
+    
     @property
     def longitude(self) -> float:
-        """Extract longitude from GeoJSON position."""
-        coords = self.position.get("coordinates", [0, 0])
-        return coords[0] if len(coords) >= 2 else 0.0
+        """Longitude of the validated GeoJSON position."""
+        return self.position.coordinates[0]
     
     @property
     def latitude(self) -> float:
-        """Extract latitude from GeoJSON position."""
-        coords = self.position.get("coordinates", [0, 0])
-        return coords[1] if len(coords) >= 2 else 0.0
+        """Latitude of the validated GeoJSON position."""
+        return self.position.coordinates[1]
 
 
 class AssetMoveResponse(BaseModel):
@@ -477,7 +625,7 @@ class RecomputeEarthworkResponse(BaseModel):
     road_cut_m3: Optional[float] = None
     road_fill_m3: Optional[float] = None
     net_earthwork_m3: float
-    per_asset: list[dict] = Field(default_factory=list)
+    per_asset: list[PerAssetEarthwork] = Field(default_factory=list)
     message: str
 
 
@@ -521,6 +669,9 @@ class ComplianceViolation(BaseModel):
     severity: str  # "error" or "warning"
     actual_value: float
     limit_value: float
+    
+    # Validated straight from the engine's RuleViolation dataclasses
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ComplianceCheckRequest(BaseModel):
@@ -580,3 +731,18 @@ class GISPublishResponse(BaseModel):
     features_published: int
     errors: list[str] = Field(default_factory=list)
 
+
+# Composite response models must be fully built when this module is
+# imported, never lazily on a worker's first request. model_rebuild() is a
+# no-op for complete models and raises here if a forward reference is ever
+# left unresolved.
+for _model in (
+    LayoutResponse,
+    LayoutDetailResponse,
+    LayoutGenerateResponse,
+    LayoutVariantResponse,
+    LayoutVariantsResponse,
+    LayoutStatusResponse,
+):
+    _model.model_rebuild()
+del _model
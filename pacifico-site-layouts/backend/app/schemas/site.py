@@ -5,7 +5,9 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.geojson import GeoJSONPoint, GeoJSONPolygon
 
 
 class SiteUploadResponse(BaseModel):
@@ -14,13 +16,12 @@ class SiteUploadResponse(BaseModel):
     id: UUID = Field(..., description="Unique identifier for the created site")
     name: str = Field(..., description="Name of the site (from filename or KML)")
     area_m2: float = Field(..., description="Site area in square meters")
-    boundary: dict[str, Any] = Field(..., description="Site boundary as GeoJSON Polygon")
-    entry_point: Optional[dict[str, Any]] = Field(None, description="Entry point as GeoJSON Point")
+    boundary: GeoJSONPolygon = Field(..., description="Site boundary as GeoJSON Polygon")
+    entry_point: Optional[GeoJSONPoint] = Field(None, description="Entry point as GeoJSON Point")
     entry_point_metadata: Optional[dict[str, Any]] = Field(None, description="Metadata for the entry point")
     created_at: datetime = Field(..., description="Timestamp when the site was created")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SiteResponse(BaseModel):
@@ -30,14 +31,13 @@ class SiteResponse(BaseModel):
     project_id: Optional[UUID] = None
     name: str
     area_m2: float
-    boundary: dict[str, Any] = Field(..., description="Site boundary as GeoJSON")
-    entry_point: Optional[dict[str, Any]] = Field(None, description="Entry point as GeoJSON Point")
+    boundary: GeoJSONPolygon = Field(..., description="Site boundary as GeoJSON Polygon")
+    entry_point: Optional[GeoJSONPoint] = Field(None, description="Entry point as GeoJSON Point")
     entry_point_metadata: Optional[dict[str, Any]] = Field(None, description="Metadata for the entry point")
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SiteListItem(BaseModel):
@@ -48,8 +48,7 @@ class SiteListItem(BaseModel):
     area_m2: float
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SiteListResponse(BaseModel):
@@ -12,6 +12,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.geojson import LinealGeometry, PolygonalGeometry
+
 
 class ElevationStats(BaseModel):
     """Elevation statistics for a site."""
@@ -80,7 +82,7 @@ class ContourFeature(BaseModel):
     """A single contour line as a GeoJSON Feature."""
     
     type: str = Field(default="Feature")
-    geometry: dict[str, Any] = Field(..., description="LineString or MultiLineString geometry")
+    geometry: LinealGeometry = Field(..., description="LineString or MultiLineString geometry")
     properties: dict[str, Any] = Field(..., description="Contour properties (elevation)")
 
 
@@ -106,7 +108,7 @@ class BuildableAreaFeature(BaseModel):
     """A buildable area polygon as a GeoJSON Feature."""
     
     type: str = Field(default="Feature")
-    geometry: dict[str, Any] = Field(..., description="Polygon or MultiPolygon geometry")
+    geometry: PolygonalGeometry = Field(..., description="Polygon or MultiPolygon geometry")
     properties: dict[str, Any] = Field(..., description="Buildable area properties")
 
 
@@ -134,7 +136,7 @@ class SlopeHeatmapFeature(BaseModel):
     """A slope zone polygon as a GeoJSON Feature."""
     
     type: str = Field(default="Feature")
-    geometry: dict[str, Any] = Field(..., description="Polygon geometry")
+    geometry: PolygonalGeometry = Field(..., description="Polygon or MultiPolygon geometry")
     properties: dict[str, Any] = Field(
         ..., 
         description="Zone properties including slope_class, min_slope, max_slope, color"
@@ -1,21 +1,33 @@
 """
 Business logic services for Pacifico Site Layouts.
+
+Every app.services.<module> import runs this file first, so the re-exports
+below are resolved lazily (PEP 562): importing e.g. app.services.s3 no
+longer drags in rasterio/scipy through the terrain services.
 """
-# Phase A services
-from app.services.kml_parser import KMLParser, KMLParseError
-from app.services.layout_generator import DummyLayoutGenerator
-from app.services.s3 import S3Service, get_s3_service
+import importlib
+from typing import Any
 
-# Phase B services - Terrain processing
-from app.services.dem_service import DEMService, get_dem_service
-from app.services.slope_service import SlopeService, get_slope_service
-from app.services.terrain_layout_generator import (
-    TerrainAwareLayoutGenerator,
-    PlacedAsset,
-    PlacedRoad,
-    CutFillResult,
-)
-from app.services.export_service import ExportService, get_export_service
+# Exported name -> defining module
+_LAZY = {
+    # Phase A services
+    "KMLParser": "app.services.kml_parser",
+    "KMLParseError": "app.services.kml_parser",
+    "DummyLayoutGenerator": "app.services.layout_generator",
+    "S3Service": "app.services.s3",
+    "get_s3_service": "app.services.s3",
+    # Phase B services - Terrain processing
+    "DEMService": "app.services.dem_service",
+    "get_dem_service": "app.services.dem_service",
+    "SlopeService": "app.services.slope_service",
+    "get_slope_service": "app.services.slope_service",
+    "TerrainAwareLayoutGenerator": "app.services.terrain_layout_generator",
+    "PlacedAsset": "app.services.terrain_layout_generator",
+    "PlacedRoad": "app.services.terrain_layout_generator",
+    "CutFillResult": "app.services.terrain_layout_generator",
+    "ExportService": "app.services.export_service",
+    "get_export_service": "app.services.export_service",
+}
 
 __all__ = [
     # Phase A
@@ -38,3 +50,17 @@ __all__ = [
     "get_export_service",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported service on first access and memoize it."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -13,11 +13,19 @@ explicit configuration, then be extended per jurisdiction.
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Literal, Mapping, Optional
 from uuid import UUID
 
+import numpy as np
+from pydantic import TypeAdapter
+
 logger = logging.getLogger(__name__)
 
+# Below this many values a plain comparison loop beats building an array
+VECTORIZE_MIN_ITEMS = 32
+
 
 class RuleType(str, Enum):
     """Types of compliance rules."""
@@ -42,34 +50,28 @@ class Jurisdiction(str, Enum):
     DEFAULT = "default"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceRule:
     """
     Represents a single compliance rule.
     
     Rules are evaluated during layout generation and validation to ensure
     generated layouts meet jurisdiction-specific and project constraints.
+    Rules are immutable; replace one via ComplianceRulesEngine.add_rule.
+    Equality and hashing use rule_id only.
     """
     rule_id: str
-    rule_type: RuleType
-    jurisdiction: Jurisdiction
-    asset_type: Optional[str] = None  # None applies to all asset types
-    value: float = 0.0
-    unit: str = ""  # e.g., "degrees", "meters", "percent"
-    description: str = ""
-    enabled: bool = True
-    override_reason: Optional[str] = None
-    
-    def __hash__(self):
-        return hash(self.rule_id)
-    
-    def __eq__(self, other):
-        if not isinstance(other, ComplianceRule):
-            return False
-        return self.rule_id == other.rule_id
+    rule_type: RuleType = field(compare=False)
+    jurisdiction: Jurisdiction = field(compare=False)
+    asset_type: Optional[str] = field(default=None, compare=False)  # None applies to all asset types
+    value: float = field(default=0.0, compare=False)
+    unit: str = field(default="", compare=False)  # e.g., "degrees", "meters", "percent"
+    description: str = field(default="", compare=False)
+    enabled: bool = field(default=True, compare=False)
+    override_reason: Optional[str] = field(default=None, compare=False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleViolation:
     """Represents a single rule violation."""
     rule_id: str
@@ -82,7 +84,12 @@ class RuleViolation:
     violating_asset_id: Optional[str] = None
 
 
-@dataclass
+# Serializes violations in pydantic-core instead of per-field dict building
+_VIOLATIONS_ADAPTER = TypeAdapter(List[RuleViolation])
+_VIOLATION_DUMP_EXCLUDE = {"__all__": {"violating_asset_id"}}
+
+
+@dataclass(slots=True)
 class ComplianceCheckResult:
     """Result of compliance check."""
     is_compliant: bool
@@ -96,30 +103,12 @@ class ComplianceCheckResult:
             "is_compliant": self.is_compliant,
             "violations_count": len(self.violations),
             "warnings_count": len(self.warnings),
-            "violations": [
-                {
-                    "rule_id": v.rule_id,
-                    "rule_type": v.rule_type.value,
-                    "asset_type": v.asset_type,
-                    "message": v.message,
-                    "severity": v.severity,
-                    "actual_value": v.actual_value,
-                    "limit_value": v.limit_value,
-                }
-                for v in self.violations
-            ],
-            "warnings": [
-                {
-                    "rule_id": w.rule_id,
-                    "rule_type": w.rule_type.value,
-                    "asset_type": w.asset_type,
-                    "message": w.message,
-                    "severity": w.severity,
-                    "actual_value": w.actual_value,
-                    "limit_value": w.limit_value,
-                }
-                for w in self.warnings
-            ],
+            "violations": _VIOLATIONS_ADAPTER.dump_python(
+                self.violations, mode="json", exclude=_VIOLATION_DUMP_EXCLUDE
+            ),
+            "warnings": _VIOLATIONS_ADAPTER.dump_python(
+                self.warnings, mode="json", exclude=_VIOLATION_DUMP_EXCLUDE
+            ),
             "checked_rules_count": self.checked_rules_count,
         }
 
@@ -133,9 +122,9 @@ class ComplianceRulesEngine:
     per site or project.
     """
     
-    # Default rules by jurisdiction
-    DEFAULT_RULES = {
-        Jurisdiction.DEFAULT: [
+    # Default rules by jurisdiction (immutable; shared by every engine)
+    DEFAULT_RULES: Mapping[Jurisdiction, tuple[ComplianceRule, ...]] = MappingProxyType({
+        Jurisdiction.DEFAULT: (
             ComplianceRule(
                 rule_id="max_slope_solar",
                 rule_type=RuleType.MAX_SLOPE,
@@ -214,8 +203,8 @@ class ComplianceRulesEngine:
                 unit="meters",
                 description="Minimum pad size for substation (diagonal)",
             ),
-        ],
-        Jurisdiction.CALIFORNIA: [
+        ),
+        Jurisdiction.CALIFORNIA: (
             # California-specific overrides - more restrictive environmental rules
             ComplianceRule(
                 rule_id="min_distance_boundary_ca",
@@ -233,8 +222,8 @@ class ComplianceRulesEngine:
                 unit="meters",
                 description="CA: Minimum wetland buffer per code",
             ),
-        ],
-        Jurisdiction.TEXAS: [
+        ),
+        Jurisdiction.TEXAS: (
             # Texas-specific rules
             ComplianceRule(
                 rule_id="setback_distance_tx",
@@ -244,37 +233,64 @@ class ComplianceRulesEngine:
                 unit="meters",
                 description="TX: Property line setback",
             ),
-        ],
-    }
+        ),
+    })
     
     def __init__(self, jurisdiction: Jurisdiction = Jurisdiction.DEFAULT):
         """Initialize rules engine with jurisdiction defaults."""
         self.jurisdiction = jurisdiction
         self.custom_rules: Dict[str, ComplianceRule] = {}
         self.overrides: Dict[str, ComplianceRule] = {}
+        # rule_type -> asset_type (None = all assets) -> enabled rules; kept
+        # in step with custom_rules so each check only visits applicable rules
+        self._by_type: Dict[RuleType, Dict[Optional[str], List[ComplianceRule]]] = {}
         
         # Load default rules for this jurisdiction + defaults
         self._load_default_rules()
     
     def _load_default_rules(self):
         """Load default rules for jurisdiction and parent (DEFAULT)."""
-        # Load DEFAULT rules first
-        for rule in self.DEFAULT_RULES.get(Jurisdiction.DEFAULT, []):
-            self.custom_rules[rule.rule_id] = rule
-        
-        # Override with jurisdiction-specific rules
-        if self.jurisdiction != Jurisdiction.DEFAULT:
-            for rule in self.DEFAULT_RULES.get(self.jurisdiction, []):
-                self.custom_rules[rule.rule_id] = rule
+        for rule in _default_rule_map(self.jurisdiction).values():
+            self._store_rule(rule)
+    
+    def _store_rule(self, rule: ComplianceRule) -> None:
+        """Insert or replace a rule in custom_rules and the type index."""
+        self._unindex_rule(rule.rule_id)
+        self.custom_rules[rule.rule_id] = rule
+        if rule.enabled:
+            buckets = self._by_type.setdefault(rule.rule_type, {})
+            buckets.setdefault(rule.asset_type, []).append(rule)
+    
+    def _unindex_rule(self, rule_id: str) -> None:
+        """Drop a rule (if present) from the type index."""
+        existing = self.custom_rules.get(rule_id)
+        if existing is not None and existing.enabled:
+            bucket = self._by_type[existing.rule_type][existing.asset_type]
+            # Rules compare by rule_id only, so match by identity here
+            bucket[:] = [rule for rule in bucket if rule is not existing]
+    
+    def _rules_of_type(self, rule_type: RuleType) -> Iterator[ComplianceRule]:
+        """Enabled rules of a type, regardless of asset type."""
+        for bucket in self._by_type.get(rule_type, {}).values():
+            yield from bucket
+    
+    def _rules_for_asset(self, rule_type: RuleType, asset_type: str) -> Iterator[ComplianceRule]:
+        """Enabled rules of a type that apply to all assets or to asset_type."""
+        buckets = self._by_type.get(rule_type)
+        if not buckets:
+            return
+        yield from buckets.get(None, ())
+        yield from buckets.get(asset_type, ())
     
     def add_rule(self, rule: ComplianceRule) -> None:
         """Add or override a compliance rule."""
-        self.custom_rules[rule.rule_id] = rule
+        self._store_rule(rule)
         logger.info(f"Added rule: {rule.rule_id} ({rule.rule_type.value})")
     
     def remove_rule(self, rule_id: str) -> bool:
         """Remove a custom rule. Returns True if removed, False if not found."""
         if rule_id in self.custom_rules:
+            self._unindex_rule(rule_id)
             del self.custom_rules[rule_id]
             logger.info(f"Removed rule: {rule_id}")
             return True
@@ -303,25 +319,20 @@ class ComplianceRulesEngine:
     ) -> bool:
         """Check if asset slope complies with max slope rule."""
         compliant = True
-        for rule in self.custom_rules.values():
-            if (
-                rule.enabled
-                and rule.rule_type == RuleType.MAX_SLOPE
-                and (rule.asset_type is None or rule.asset_type == asset_type)
-            ):
-                if actual_slope_deg > rule.value:
-                    violations.append(
-                        RuleViolation(
-                            rule_id=rule.rule_id,
-                            rule_type=rule.rule_type,
-                            asset_type=asset_type,
-                            message=f"{asset_type} slope {actual_slope_deg:.1f}° exceeds max {rule.value:.1f}°",
-                            severity="error",
-                            actual_value=actual_slope_deg,
-                            limit_value=rule.value,
-                        )
+        for rule in self._rules_for_asset(RuleType.MAX_SLOPE, asset_type):
+            if actual_slope_deg > rule.value:
+                violations.append(
+                    RuleViolation(
+                        rule_id=rule.rule_id,
+                        rule_type=rule.rule_type,
+                        asset_type=asset_type,
+                        message=f"{asset_type} slope {actual_slope_deg:.1f}° exceeds max {rule.value:.1f}°",
+                        severity="error",
+                        actual_value=actual_slope_deg,
+                        limit_value=rule.value,
                     )
-                    compliant = False
+                )
+                compliant = False
         return compliant
     
     def check_road_grade(
@@ -331,21 +342,20 @@ class ComplianceRulesEngine:
     ) -> bool:
         """Check if road grade complies with max grade rule."""
         compliant = True
-        for rule in self.custom_rules.values():
-            if rule.enabled and rule.rule_type == RuleType.MAX_ROAD_GRADE:
-                if actual_grade_pct > rule.value:
-                    violations.append(
-                        RuleViolation(
-                            rule_id=rule.rule_id,
-                            rule_type=rule.rule_type,
-                            asset_type=None,
-                            message=f"Road grade {actual_grade_pct:.1f}% exceeds max {rule.value:.1f}%",
-                            severity="error",
-                            actual_value=actual_grade_pct,
-                            limit_value=rule.value,
-                        )
+        for rule in self._rules_of_type(RuleType.MAX_ROAD_GRADE):
+            if actual_grade_pct > rule.value:
+                violations.append(
+                    RuleViolation(
+                        rule_id=rule.rule_id,
+                        rule_type=rule.rule_type,
+                        asset_type=None,
+                        message=f"Road grade {actual_grade_pct:.1f}% exceeds max {rule.value:.1f}%",
+                        severity="error",
+                        actual_value=actual_grade_pct,
+                        limit_value=rule.value,
                     )
-                    compliant = False
+                )
+                compliant = False
         return compliant
     
     def check_minimum_spacing(
@@ -356,21 +366,20 @@ class ComplianceRulesEngine:
     ) -> bool:
         """Check if asset spacing complies with minimum spacing rule."""
         compliant = True
-        for rule in self.custom_rules.values():
-            if rule.enabled and rule.rule_type == RuleType.MIN_SPACING:
-                if actual_spacing_m < rule.value:
-                    violations.append(
-                        RuleViolation(
-                            rule_id=rule.rule_id,
-                            rule_type=rule.rule_type,
-                            asset_type=asset_type,
-                            message=f"Spacing {actual_spacing_m:.1f}m is less than minimum {rule.value:.1f}m",
-                            severity="warning",
-                            actual_value=actual_spacing_m,
-                            limit_value=rule.value,
-                        )
+        for rule in self._rules_of_type(RuleType.MIN_SPACING):
+            if actual_spacing_m < rule.value:
+                violations.append(
+                    RuleViolation(
+                        rule_id=rule.rule_id,
+                        rule_type=rule.rule_type,
+                        asset_type=asset_type,
+                        message=f"Spacing {actual_spacing_m:.1f}m is less than minimum {rule.value:.1f}m",
+                        severity="warning",
+                        actual_value=actual_spacing_m,
+                        limit_value=rule.value,
                     )
-                    compliant = False
+                )
+                compliant = False
         return compliant
     
     def check_boundary_setback(
@@ -380,21 +389,20 @@ class ComplianceRulesEngine:
     ) -> bool:
         """Check if asset setback from boundary complies with rule."""
         compliant = True
-        for rule in self.custom_rules.values():
-            if rule.enabled and rule.rule_type == RuleType.MIN_DISTANCE_TO_BOUNDARY:
-                if actual_distance_m < rule.value:
-                    violations.append(
-                        RuleViolation(
-                            rule_id=rule.rule_id,
-                            rule_type=rule.rule_type,
-                            asset_type=None,
-                            message=f"Distance to boundary {actual_distance_m:.1f}m is less than minimum {rule.value:.1f}m",
-                            severity="error",
-                            actual_value=actual_distance_m,
-                            limit_value=rule.value,
-                        )
+        for rule in self._rules_of_type(RuleType.MIN_DISTANCE_TO_BOUNDARY):
+            if actual_distance_m < rule.value:
+                violations.append(
+                    RuleViolation(
+                        rule_id=rule.rule_id,
+                        rule_type=rule.rule_type,
+                        asset_type=None,
+                        message=f"Distance to boundary {actual_distance_m:.1f}m is less than minimum {rule.value:.1f}m",
+                        severity="error",
+                        actual_value=actual_distance_m,
+                        limit_value=rule.value,
                     )
-                    compliant = False
+                )
+                compliant = False
         return compliant
     
     def check_wetland_buffer(
@@ -404,27 +412,27 @@ class ComplianceRulesEngine:
     ) -> bool:
         """Check if wetland buffer complies with rule."""
         compliant = True
-        for rule in self.custom_rules.values():
-            if rule.enabled and rule.rule_type == RuleType.WETLAND_BUFFER:
-                if actual_distance_m < rule.value:
-                    violations.append(
-                        RuleViolation(
-                            rule_id=rule.rule_id,
-                            rule_type=rule.rule_type,
-                            asset_type=None,
-                            message=f"Wetland buffer {actual_distance_m:.1f}m is less than required {rule.value:.1f}m",
-                            severity="error",
-                            actual_value=actual_distance_m,
-                            limit_value=rule.value,
-                        )
+        for rule in self._rules_of_type(RuleType.WETLAND_BUFFER):
+            if actual_distance_m < rule.value:
+                violations.append(
+                    RuleViolation(
+                        rule_id=rule.rule_id,
+                        rule_type=rule.rule_type,
+                        asset_type=None,
+                        message=f"Wetland buffer {actual_distance_m:.1f}m is less than required {rule.value:.1f}m",
+                        severity="error",
+                        actual_value=actual_distance_m,
+                        limit_value=rule.value,
                     )
-                    compliant = False
+                )
+                compliant = False
         return compliant
     
     def validate_layout(
         self,
         assets: List[Dict[str, Any]],
         roads: List[Dict[str, Any]] = None,
+        mode: Literal["full", "first_error"] = "full",
     ) -> ComplianceCheckResult:
         """
         Validate a complete layout against all compliance rules.
@@ -432,42 +440,104 @@ class ComplianceRulesEngine:
         Args:
             assets: List of asset dicts with keys: type, slope_deg, distance_to_boundary_m
             roads: List of road dicts with keys: grade_pct
+            mode: "full" collects every violation and warning (final
+                validation); "first_error" stops at the first violation,
+                for callers that only need is_compliant
         
         Returns:
-            ComplianceCheckResult with violations and warnings
+            ComplianceCheckResult with violations and warnings, each in input
+            order (per asset: slope then setback violations; road grades last)
         """
         violations = []
         warnings = []
-        checked_count = 0
+        assets = assets or []
+        roads = roads or []
+        stop_on_error = mode == "first_error"
         
-        # Check asset constraints
-        if assets:
-            for asset in assets:
-                asset_type = asset.get("type", "unknown")
-                
-                # Check max slope
-                if "slope_deg" in asset:
-                    self.check_max_slope(asset_type, asset["slope_deg"], violations)
-                    checked_count += 1
-                
-                # Check boundary setback
-                if "distance_to_boundary_m" in asset:
-                    self.check_boundary_setback(asset["distance_to_boundary_m"], violations)
-                    checked_count += 1
-                
-                # Check minimum spacing (warning only)
-                if "min_spacing_m" in asset:
-                    spacing_violations = []
-                    self.check_minimum_spacing(asset["min_spacing_m"], asset_type, spacing_violations)
-                    warnings.extend(spacing_violations)
-                    checked_count += 1
+        # Gather the measured values per check. Values are screened in bulk
+        # against the tightest applicable limit, and only the offending ones
+        # go through the per-item checkers that build RuleViolations. Each
+        # value keeps its position (asset index, check) so violations can be
+        # returned in input order: per asset slope then setback, then roads.
+        slopes_by_type: Dict[str, List[float]] = {}
+        slope_positions: Dict[str, List[tuple[int, ...]]] = {}
+        setbacks: List[float] = []
+        setback_positions: List[tuple[int, ...]] = []
+        spacings: List[tuple[str, float]] = []
+        for index, asset in enumerate(assets):
+            asset_type = asset.get("type", "unknown")
+            if "slope_deg" in asset:
+                slopes_by_type.setdefault(asset_type, []).append(asset["slope_deg"])
+                slope_positions.setdefault(asset_type, []).append((0, index, 0))
+            if "distance_to_boundary_m" in asset:
+                setbacks.append(asset["distance_to_boundary_m"])
+                setback_positions.append((0, index, 1))
+            if "min_spacing_m" in asset:
+                spacings.append((asset_type, asset["min_spacing_m"]))
+        grades = [road["grade_pct"] for road in roads if "grade_pct" in road]
+        grade_positions = [(1, index) for index in range(len(grades))]
+        
+        # (values, limits, above, checker for an offending index, positions)
+        screens: List[tuple[
+            List[float], List[float], bool, Callable[[int], None], List[tuple[int, ...]]
+        ]] = []
+        
+        # Check max slope (limits depend on asset type)
+        for asset_type, slopes in slopes_by_type.items():
+            screens.append((
+                slopes,
+                [r.value for r in self._rules_for_asset(RuleType.MAX_SLOPE, asset_type)],
+                True,
+                lambda i, t=asset_type, s=slopes: self.check_max_slope(t, s[i], violations),
+                slope_positions[asset_type],
+            ))
+        
+        # Check boundary setback
+        screens.append((
+            setbacks,
+            [r.value for r in self._rules_of_type(RuleType.MIN_DISTANCE_TO_BOUNDARY)],
+            False,
+            lambda i: self.check_boundary_setback(setbacks[i], violations),
+            setback_positions,
+        ))
+        
+        # Check minimum spacing (warning only; screened in asset order already)
+        screens.append((
+            [value for _, value in spacings],
+            [r.value for r in self._rules_of_type(RuleType.MIN_SPACING)],
+            False,
+            lambda i: self.check_minimum_spacing(spacings[i][1], spacings[i][0], warnings),
+            [],
+        ))
         
         # Check road constraints
-        if roads:
-            for road in roads:
-                if "grade_pct" in road:
-                    self.check_road_grade(road["grade_pct"], violations)
-                    checked_count += 1
+        screens.append((
+            grades,
+            [r.value for r in self._rules_of_type(RuleType.MAX_ROAD_GRADE)],
+            True,
+            lambda i: self.check_road_grade(grades[i], violations),
+            grade_positions,
+        ))
+        
+        checked_count = 0
+        violation_positions: List[tuple[int, ...]] = []
+        for values, limits, above, check, positions in screens:
+            checked_count += len(values)
+            for i in _screen(values, limits, above):
+                check(i)
+                if positions:
+                    violation_positions.extend(
+                        [positions[i]] * (len(violations) - len(violation_positions))
+                    )
+                if stop_on_error and violations:
+                    break
+            if stop_on_error and violations:
+                break
+        
+        # Stable sort keeps rule order within a single check
+        if len(violations) > 1:
+            order = sorted(range(len(violations)), key=violation_positions.__getitem__)
+            violations = [violations[i] for i in order]
         
         is_compliant = len(violations) == 0
         
@@ -479,14 +549,63 @@ class ComplianceRulesEngine:
         )
 
 
+@lru_cache(maxsize=None)
+def _default_rule_map(jurisdiction: Jurisdiction) -> Mapping[str, ComplianceRule]:
+    """
+    DEFAULT rules overridden by a jurisdiction's rules, keyed by rule_id.
+    
+    Resolved once per jurisdiction; rules are frozen, so every engine shares
+    the same instances.
+    """
+    rules: Dict[str, ComplianceRule] = {}
+    for rule in ComplianceRulesEngine.DEFAULT_RULES.get(Jurisdiction.DEFAULT, ()):
+        rules[rule.rule_id] = rule
+    if jurisdiction != Jurisdiction.DEFAULT:
+        for rule in ComplianceRulesEngine.DEFAULT_RULES.get(jurisdiction, ()):
+            rules[rule.rule_id] = rule
+    return MappingProxyType(rules)
+
+
+def _screen(values: List[float], limits: List[float], above: bool) -> List[int]:
+    """
+    Indices of values that violate at least one limit.
+    
+    A value violates a max-type limit when it is above it (above=True) and a
+    min-type limit when it is below it, so comparing against the tightest
+    limit is enough. Large batches are compared as a single NumPy mask.
+    """
+    if not values or not limits:
+        return []
+    bound = min(limits) if above else max(limits)
+    if len(values) < VECTORIZE_MIN_ITEMS:
+        if above:
+            return [i for i, value in enumerate(values) if value > bound]
+        return [i for i, value in enumerate(values) if value < bound]
+    array = np.fromiter(values, dtype=np.float64, count=len(values))
+    mask = array > bound if above else array < bound
+    return np.flatnonzero(mask).tolist()
+
+
+@lru_cache(maxsize=len(Jurisdiction))
+def _shared_engine(jurisdiction: Jurisdiction) -> ComplianceRulesEngine:
+    """One engine per jurisdiction, shared by read-only callers."""
+    return ComplianceRulesEngine(jurisdiction=jurisdiction)
+
+
 def get_compliance_rules_engine(
     jurisdiction: str = "default",
+    fresh: bool = False,
 ) -> ComplianceRulesEngine:
     """
     Factory function to get a compliance rules engine for a jurisdiction.
     
+    Engines are cached per jurisdiction, so add_rule/remove_rule on a
+    returned instance is process-global. Pass fresh=True for a private
+    engine that can be modified in isolation.
+    
     Args:
         jurisdiction: Jurisdiction code (e.g., 'ca', 'tx', 'default')
+        fresh: Return a new, uncached engine
     
     Returns:
         ComplianceRulesEngine instance
@@ -497,5 +616,7 @@ def get_compliance_rules_engine(
         logger.warning(f"Unknown jurisdiction '{jurisdiction}', using DEFAULT")
         juris = Jurisdiction.DEFAULT
     
-    return ComplianceRulesEngine(jurisdiction=juris)
+    if fresh:
+        return ComplianceRulesEngine(jurisdiction=juris)
+    return _shared_engine(juris)
 
@@ -2,34 +2,79 @@
 DEM (Digital Elevation Model) fetching service.
 
 Provides terrain elevation data for site bounding boxes using:
-- Primary: USGS 3DEP via py3dep (10-30m resolution, US coverage)
+- Primary: USGS 3DEP staged 1x1 degree COG tiles, range-read from S3
+- Secondary: USGS 3DEP dynamic service via py3dep (10-30m resolution, US coverage)
 - Fallback: Returns None for international sites (SRTM can be added later)
 
 Implements caching via TerrainCache model to avoid repeated API calls.
 """
+import asyncio
 import io
 import logging
+import math
 import tempfile
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Optional
 from uuid import UUID
 
+import boto3
+from botocore import UNSIGNED
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import numpy as np
 import rasterio
+from affine import Affine
+from rasterio.fill import fillnodata
 from rasterio.io import MemoryFile
+from rasterio.merge import merge
+from rasterio.shutil import copy as rio_copy
+from rasterio.session import AWSSession
 from rasterio.transform import from_bounds
+from rasterio.windows import Window
+from rasterio.windows import from_bounds as window_from_bounds
 from shapely.geometry import Polygon, box, mapping
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models.terrain_cache import TerrainCache, TerrainType
-from app.services.s3 import get_s3_service
+from app.services.s3 import IMMUTABLE_CACHE_CONTROL, content_hash, get_s3_service
+from app.services.terrain_cache_lookup import get_terrain_cache_lookup
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+@lru_cache(maxsize=1)
+def _load_py3dep() -> Optional[ModuleType]:
+    """
+    Import py3dep on first use and remember the outcome.
+    
+    py3dep pulls in xarray and friends, so it stays out of module import
+    time; caching also keeps a missing install from re-scanning sys.path
+    (and re-logging) on every DEM fetch.
+    """
+    try:
+        import py3dep
+    except ImportError:
+        logger.error("py3dep not installed. Run: pip install py3dep")
+        return None
+    return py3dep
+
+
+@lru_cache(maxsize=1)
+def _usgs_staged_client():
+    """Anonymous S3 client for the public USGS staged-products bucket."""
+    return boto3.client(
+        "s3",
+        region_name=DEMService.USGS_STAGED_REGION,
+        config=Config(signature_version=UNSIGNED),
+    )
+
+
 class DEMService:
     """
     Service for fetching and managing DEM (Digital Elevation Model) data.
@@ -44,6 +89,45 @@ class DEMService:
     # S3 path template for terrain data
     TERRAIN_S3_PREFIX = "terrain"
     
+    # Public bucket with the staged 3DEP seamless DEM tiles (COGs)
+    USGS_STAGED_BUCKET = "prd-tnm"
+    USGS_STAGED_REGION = "us-west-2"
+    
+    # resolution_m -> staged 3DEP product (1/3 and 1 arc-second)
+    USGS_STAGED_PRODUCTS = {10: "13", 30: "1"}
+    
+    # Furthest (pixels) a DEM void is interpolated from valid elevations
+    VOID_FILL_MAX_DISTANCE_PX = 60
+    
+    # COG creation options for float32 DEMs: ZSTD with the floating-point
+    # predictor compresses elevation far better than LZW and decodes faster.
+    # 256x256 tiles, averaged overviews and the COG's leading IFD let
+    # readers range-read just the blocks (or resolution) they need.
+    COG_OPTIONS = {
+        "compress": "ZSTD",
+        "level": 1,
+        "predictor": "FLOATING_POINT",
+        "blocksize": 256,
+        "overview_resampling": "AVERAGE",
+    }
+    
+    @classmethod
+    def _cog_options(cls, max_z_error: Optional[float]) -> dict:
+        """
+        COG creation options, lossy LERC when an error bound is given.
+        
+        LERC guarantees every pixel is within max_z_error of the source and
+        compresses elevation several times smaller than lossless ZSTD. A
+        1 cm bound is far below the ~0.3 m vertical RMSE of 3DEP 10 m data,
+        so slope and aspect derived from it are unaffected.
+        """
+        if not max_z_error:
+            return cls.COG_OPTIONS
+        # LERC does its own float encoding; a TIFF predictor does not apply
+        options = {key: value for key, value in cls.COG_OPTIONS.items() if key != "predictor"}
+        options.update(compress="LERC_ZSTD", max_z_error=max_z_error)
+        return options
+    
     def __init__(self):
         """Initialize the DEM service."""
         self._s3_service = get_s3_service()
@@ -55,6 +139,7 @@ class DEMService:
         db: AsyncSession,
         resolution_m: int = DEFAULT_RESOLUTION_M,
         force_refresh: bool = False,
+        max_z_error: Optional[float] = None,
     ) -> Optional[str]:
         """
         Get DEM for a site, using cache if available.
@@ -65,6 +150,8 @@ class DEMService:
             db: Database session
             resolution_m: Desired resolution in meters (10 or 30)
             force_refresh: If True, bypass cache and fetch fresh data
+            max_z_error: LERC error bound in meters for a freshly fetched
+                DEM (defaults to settings.dem_max_z_error_m; None is lossless)
             
         Returns:
             S3 key where DEM is stored, or None if fetch failed
@@ -80,6 +167,8 @@ class DEMService:
         logger.info(f"Fetching fresh DEM for site {site_id}")
         
         try:
+            if max_z_error is None:
+                max_z_error = settings.dem_max_z_error_m
             dem_data, dem_profile = await self._fetch_dem_from_3dep(
                 boundary, resolution_m
             )
@@ -89,13 +178,16 @@ class DEMService:
                 return None
             
             # Upload to S3
-            s3_key = await self._upload_dem_to_s3(site_id, dem_data, dem_profile)
+            s3_key, digest = await self._upload_dem_to_s3(
+                site_id, dem_data, dem_profile, max_z_error
+            )
             
             # Create/update cache record
             await self._update_cache_record(
                 site_id=site_id,
                 terrain_type=TerrainType.ELEVATION,
                 s3_key=s3_key,
+                content_hash=digest,
                 resolution_m=resolution_m,
                 source="usgs_3dep",
                 db=db,
@@ -110,16 +202,22 @@ class DEMService:
     async def get_dem_array(
         self,
         s3_key: str,
+        bounds: Optional[tuple[float, float, float, float]] = None,
     ) -> tuple[np.ndarray, dict]:
         """
         Load DEM array from S3.
         
         Args:
             s3_key: S3 key of the DEM GeoTIFF
+            bounds: Optional (west, south, east, north) to read only that
+                window; GDAL then range-GETs just the tiles it covers
             
         Returns:
             Tuple of (elevation array, rasterio profile)
         """
+        if bounds is not None:
+            return await asyncio.to_thread(self._read_window, s3_key, bounds)
+        
         dem_bytes = await self._s3_service.download_terrain_file(s3_key)
         
         with MemoryFile(dem_bytes) as memfile:
@@ -129,29 +227,84 @@ class DEMService:
                 
         return dem_array, profile
     
+    async def sample_raster(self, s3_key: str, lon: float, lat: float) -> Optional[float]:
+        """
+        Read a single terrain raster value (DEM or slope) at a point.
+        
+        Only the block containing the point is fetched from S3.
+        
+        Returns:
+            The pixel value, or None outside the raster or on nodata/NaN
+        """
+        return await asyncio.to_thread(self._read_point, s3_key, lon, lat)
+    
+    @staticmethod
+    def _open_s3_raster(s3_key: str):
+        """Open a terrain raster in the outputs bucket through GDAL's /vsis3/."""
+        return rasterio.open(f"s3://{settings.s3_outputs_bucket}/{s3_key}")
+    
+    @staticmethod
+    def _gdal_s3_env() -> rasterio.Env:
+        """
+        GDAL environment for range reads from S3.
+        
+        Credentials come from boto3's chain (env, task role, ...), and
+        skipping the sidecar-file directory listing saves a request per open.
+        """
+        return rasterio.Env(
+            AWSSession(boto3.Session(region_name=settings.aws_region)),
+            GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+        )
+    
+    def _read_window(
+        self,
+        s3_key: str,
+        bounds: tuple[float, float, float, float],
+    ) -> tuple[np.ndarray, dict]:
+        """Read the window covering bounds (clipped to the raster)."""
+        with self._gdal_s3_env(), self._open_s3_raster(s3_key) as src:
+            window = (
+                window_from_bounds(*bounds, transform=src.transform)
+                .round_offsets(op="floor")
+                .round_lengths(op="ceil")
+                .intersection(Window(0, 0, src.width, src.height))
+            )
+            dem_array = src.read(1, window=window)
+            profile = src.profile.copy()
+            profile.update(
+                width=window.width,
+                height=window.height,
+                transform=src.window_transform(window),
+            )
+        return dem_array, profile
+    
+    def _read_point(self, s3_key: str, lon: float, lat: float) -> Optional[float]:
+        """Read the pixel under (lon, lat)."""
+        with self._gdal_s3_env(), self._open_s3_raster(s3_key) as src:
+            row, col = src.index(lon, lat)
+            if not (0 <= row < src.height and 0 <= col < src.width):
+                return None
+            value = float(src.read(1, window=Window(col, row, 1, 1))[0, 0])
+            if np.isnan(value) or (src.nodata is not None and value == src.nodata):
+                return None
+        return value
+    
     async def _get_cached_dem(
         self,
         site_id: UUID,
         db: AsyncSession,
     ) -> Optional[str]:
         """Check if we have a cached DEM for this site."""
-        stmt = (
-            select(TerrainCache)
-            .where(TerrainCache.site_id == site_id)
-            .where(TerrainCache.terrain_type == TerrainType.ELEVATION.value)
-            .where(TerrainCache.variant_key.is_(None))
-        )
-        result = await db.execute(stmt)
-        cache_entry = result.scalar_one_or_none()
+        lookup = get_terrain_cache_lookup()
+        s3_key = await lookup.get_s3_key(site_id, TerrainType.ELEVATION, db)
         
-        if cache_entry:
+        if s3_key:
             # Verify file still exists in S3
-            if await self._s3_service.terrain_file_exists(cache_entry.s3_key):
-                return cache_entry.s3_key
+            if await self._s3_service.terrain_file_exists(s3_key):
+                return s3_key
             else:
                 # Cache entry is stale, delete it
-                await db.delete(cache_entry)
-                await db.commit()
+                await lookup.delete_entry(site_id, TerrainType.ELEVATION, db, s3_key=s3_key)
         
         return None
     
@@ -161,7 +314,7 @@ class DEMService:
         resolution_m: int,
     ) -> tuple[Optional[np.ndarray], Optional[dict]]:
         """
-        Fetch DEM from USGS 3DEP using py3dep.
+        Fetch DEM from USGS 3DEP.
         
         Args:
             boundary: Site boundary polygon
@@ -170,12 +323,6 @@ class DEMService:
         Returns:
             Tuple of (elevation array, rasterio profile) or (None, None) if failed
         """
-        try:
-            import py3dep
-        except ImportError:
-            logger.error("py3dep not installed. Run: pip install py3dep")
-            return None, None
-        
         # Get bounding box
         minx, miny, maxx, maxy = boundary.bounds
         
@@ -186,22 +333,26 @@ class DEMService:
         logger.info(f"Fetching 3DEP DEM for bbox: {bbox} at {resolution_m}m resolution")
         
         try:
-            import asyncio
-            
-            # py3dep returns an xarray DataArray
-            # Resolution options: 10 (1/3 arc-second) or 30 (1 arc-second)
-            # Run in thread pool to avoid blocking the async event loop
-            dem_xarray = await asyncio.to_thread(py3dep.get_dem, bbox, resolution=resolution_m)
-            
-            # Convert to numpy array
-            dem_array = dem_xarray.values.astype(np.float32)
+            # Range-read the staged tiles; fall back to the dynamic service
+            # for resolutions or areas the staged products don't cover
+            try:
+                dem_array, transform = await asyncio.to_thread(
+                    self._read_staged_tiles, bbox, resolution_m
+                )
+            except Exception as e:
+                # Throttling, timeouts, truncated reads: py3dep may still work
+                logger.warning(f"Staged 3DEP read failed, falling back to py3dep: {e}")
+                dem_array, transform = None, None
+            if dem_array is None:
+                dem_array, transform = await self._fetch_dem_from_py3dep(bbox, resolution_m)
+            if dem_array is None:
+                return None, None
             
-            # Handle nodata values
-            dem_array = np.where(np.isnan(dem_array), -9999, dem_array)
+            # Interpolate voids, then mark what is left as nodata
+            dem_array = await asyncio.to_thread(self._fill_voids, dem_array)
             
             # Build rasterio profile
             height, width = dem_array.shape
-            transform = from_bounds(bbox[0], bbox[1], bbox[2], bbox[3], width, height)
             
             profile = {
                 "driver": "GTiff",
@@ -212,7 +363,6 @@ class DEMService:
                 "crs": "EPSG:4326",
                 "transform": transform,
                 "nodata": -9999,
-                "compress": "lzw",
             }
             
             logger.info(f"Successfully fetched DEM: {width}x{height} pixels")
@@ -223,78 +373,293 @@ class DEMService:
             # Could add SRTM fallback here for international sites
             return None, None
     
+    @classmethod
+    def _staged_tile_keys(
+        cls,
+        bbox: tuple[float, float, float, float],
+        product: str,
+    ) -> list[str]:
+        """
+        S3 keys of the staged 3DEP tiles covering bbox.
+        
+        Tiles are 1x1 degree and named after their north-west corner,
+        e.g. n40w106 spans 39..40N and 106..105W.
+        """
+        minx, miny, maxx, maxy = bbox
+        keys = []
+        for north in range(math.floor(miny) + 1, math.floor(maxy) + 2):
+            for west in range(math.floor(-maxx) + 1, math.floor(-minx) + 2):
+                tile = f"n{north:02d}w{west:03d}"
+                keys.append(
+                    f"StagedProducts/Elevation/{product}/TIFF/current/"
+                    f"{tile}/USGS_{product}_{tile}.tif"
+                )
+        return keys
+    
+    @classmethod
+    def _staged_tile_exists(cls, key: str) -> bool:
+        """
+        Whether a staged 3DEP tile exists.
+        
+        Returns False only on 404; other errors (throttling, network)
+        propagate so the caller falls back instead of skipping the tile.
+        """
+        try:
+            _usgs_staged_client().head_object(Bucket=cls.USGS_STAGED_BUCKET, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                logger.info(f"No staged 3DEP tile at {key}")
+                return False
+            raise
+        return True
+    
+    @classmethod
+    def _read_staged_tiles(
+        cls,
+        bbox: tuple[float, float, float, float],
+        resolution_m: int,
+    ) -> tuple[Optional[np.ndarray], Optional[Affine]]:
+        """
+        Mosaic bbox from the staged 3DEP COG tiles in the public USGS bucket.
+        
+        The tiles are read at their native grid, so GDAL range-GETs only
+        the header and the blocks under bbox, and nothing is resampled
+        (the dynamic service's on-the-fly reprojection leaves tiling
+        artifacts in its output). Tiles are NAD83, which is within a meter of
+        WGS84, so the mosaic is labelled EPSG:4326 like the rest of the
+        pipeline.
+        
+        Returns:
+            Tuple of (elevation array with NaN voids, transform), or
+            (None, None) if no staged tile covers bbox
+            
+        Raises:
+            Any S3 or GDAL error other than a missing tile
+        """
+        product = cls.USGS_STAGED_PRODUCTS.get(resolution_m)
+        if product is None:
+            return None, None
+        
+        # Only a missing object means "no tile here" (ocean, outside the
+        # US). Any other failure raises: mosaicking around a tile that merely
+        # failed to load would leave a hole for _fill_voids to invent terrain in.
+        keys = [
+            key for key in cls._staged_tile_keys(bbox, product)
+            if cls._staged_tile_exists(key)
+        ]
+        if not keys:
+            return None, None
+        
+        session = AWSSession(aws_unsigned=True, region_name=cls.USGS_STAGED_REGION)
+        with rasterio.Env(session, GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+            sources = []
+            try:
+                for key in keys:
+                    sources.append(rasterio.open(f"s3://{cls.USGS_STAGED_BUCKET}/{key}"))
+                mosaic, transform = merge(
+                    sources, bounds=bbox, nodata=np.nan, dtype="float32"
+                )
+            finally:
+                for src in sources:
+                    src.close()
+        
+        return mosaic[0], transform
+    
+    async def _fetch_dem_from_py3dep(
+        self,
+        bbox: tuple[float, float, float, float],
+        resolution_m: int,
+    ) -> tuple[Optional[np.ndarray], Optional[Affine]]:
+        """Fetch bbox from the dynamic 3DEP service via py3dep."""
+        py3dep = _load_py3dep()
+        if py3dep is None:
+            return None, None
+        
+        # py3dep returns an xarray DataArray
+        # Run in thread pool to avoid blocking the async event loop
+        dem_xarray = await asyncio.to_thread(py3dep.get_dem, bbox, resolution=resolution_m)
+        
+        # Convert to numpy array
+        dem_array = dem_xarray.values.astype(np.float32)
+        height, width = dem_array.shape
+        return dem_array, from_bounds(*bbox, width, height)
+    
+    @classmethod
+    def _fill_voids(cls, dem_array: np.ndarray) -> np.ndarray:
+        """
+        Fill NaN voids in place by inverse-distance interpolation.
+        
+        Isolated voids would otherwise punch -9999 holes into the DEM that
+        np.gradient spreads into the slope raster. Voids farther than
+        VOID_FILL_MAX_DISTANCE_PX from valid data (e.g. outside 3DEP
+        coverage) stay nodata.
+        """
+        voids = np.isnan(dem_array)
+        if voids.any():
+            dem_array = fillnodata(
+                dem_array,
+                mask=(~voids).astype(np.uint8),
+                max_search_distance=cls.VOID_FILL_MAX_DISTANCE_PX,
+                smoothing_iterations=0,
+            )
+            dem_array[np.isnan(dem_array)] = -9999
+        return dem_array
+    
     async def _upload_dem_to_s3(
         self,
         site_id: UUID,
         dem_array: np.ndarray,
         profile: dict,
-    ) -> str:
-        """Upload DEM GeoTIFF to S3."""
-        s3_key = f"{self.TERRAIN_S3_PREFIX}/{site_id}/dem.tif"
-        
-        # Write to memory buffer
-        with MemoryFile() as memfile:
-            with memfile.open(**profile) as dst:
-                dst.write(dem_array, 1)
-            
-            dem_bytes = memfile.read()
+        max_z_error: Optional[float] = None,
+    ) -> tuple[str, str]:
+        """
+        Upload DEM as a Cloud-Optimized GeoTIFF under a content-addressed key.
+        
+        Returns:
+            Tuple of (s3_key, sha256 hex digest of the GeoTIFF bytes)
+        """
+        dem_bytes = await asyncio.to_thread(
+            self._encode_cog, dem_array, profile, self._cog_options(max_z_error)
+        )
+        
+        # Name the object by its content so it can be cached as immutable
+        digest = content_hash(dem_bytes)
+        s3_key = f"{self.TERRAIN_S3_PREFIX}/{site_id}/dem-{digest}.tif"
         
         # Upload to S3
         await self._s3_service.upload_terrain_file(
             s3_key=s3_key,
             content=dem_bytes,
             content_type="image/tiff",
+            cache_control=IMMUTABLE_CACHE_CONTROL,
         )
         
         logger.info(f"Uploaded DEM to s3://{settings.s3_outputs_bucket}/{s3_key}")
-        return s3_key
+        return s3_key, digest
+    
+    @classmethod
+    def _encode_cog(cls, dem_array: np.ndarray, profile: dict, options: dict) -> bytes:
+        """
+        Encode a DEM array as COG bytes.
+        
+        The COG driver can only copy from an existing dataset, so the array
+        is staged as a GeoTIFF first; the driver then builds the overviews
+        and writes tiles in COG order. Staging goes to a temporary file,
+        written one strip of tiles at a time, so the worker never holds a
+        second in-memory copy of the full DEM next to the array and the
+        encoded COG.
+        """
+        block = cls.COG_OPTIONS["blocksize"]
+        height = dem_array.shape[0]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            staging_path = Path(tmp_dir) / "staging.tif"
+            with rasterio.open(
+                staging_path, "w", **profile,
+                tiled=True, blockxsize=block, blockysize=block,
+            ) as dst:
+                for row_off in range(0, height, block):
+                    rows = min(block, height - row_off)
+                    dst.write(
+                        dem_array[row_off:row_off + rows],
+                        1,
+                        window=Window(0, row_off, dst.width, rows),
+                    )
+            with rasterio.open(staging_path) as src, MemoryFile() as cog:
+                rio_copy(src, cog.name, driver="COG", **options)
+                return cog.read()
     
     async def _update_cache_record(
         self,
         site_id: UUID,
         terrain_type: TerrainType,
         s3_key: str,
+        content_hash: str,
         resolution_m: int,
         source: str,
         db: AsyncSession,
         variant: Optional[str] = None,
-    ) -> TerrainCache:
-        """Create or update a TerrainCache record."""
-        # Check for existing record
-        stmt = (
-            select(TerrainCache)
-            .where(TerrainCache.site_id == site_id)
-            .where(TerrainCache.terrain_type == terrain_type.value)
-        )
-        if variant is None:
-            stmt = stmt.where(TerrainCache.variant_key.is_(None))
-        else:
-            stmt = stmt.where(TerrainCache.variant_key == variant)
-
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-        
-        if existing:
-            existing.s3_key = s3_key
-            existing.resolution_m = resolution_m
-            existing.source = source
-            existing.variant_key = variant
-            cache_entry = existing
-        else:
-            cache_entry = TerrainCache(
-                site_id=site_id,
-                terrain_type=terrain_type.value,
-                s3_key=s3_key,
-                resolution_m=resolution_m,
-                source=source,
-                variant_key=variant,
+    ) -> None:
+        """
+        Create or update a TerrainCache record in one round-trip.
+        
+        An INSERT ... ON CONFLICT on uq_terrain_cache_variant replaces the
+        SELECT-then-write. The RETURNING subqueries read the previous row
+        from the statement's snapshot, i.e. before the upsert: the content
+        hash is None when there was no row and '' for a row written before
+        hashing. Objects the row (or, for a new DEM, its derived artifacts)
+        pointed at before are deleted from S3 once the change is committed.
+        """
+        def previous(column):
+            query = (
+                select(column)
+                .where(TerrainCache.site_id == site_id)
+                .where(TerrainCache.terrain_type == terrain_type.value)
             )
-            db.add(cache_entry)
+            if variant is None:
+                query = query.where(TerrainCache.variant_key.is_(None))
+            else:
+                query = query.where(TerrainCache.variant_key == variant)
+            return query.scalar_subquery()
+        
+        stmt = pg_insert(TerrainCache).values(
+            site_id=site_id,
+            terrain_type=terrain_type.value,
+            variant_key=variant,
+            s3_key=s3_key,
+            content_hash=content_hash,
+            resolution_m=resolution_m,
+            source=source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_terrain_cache_variant",
+            set_={
+                "s3_key": stmt.excluded.s3_key,
+                "content_hash": stmt.excluded.content_hash,
+                "resolution_m": stmt.excluded.resolution_m,
+                "source": stmt.excluded.source,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            previous(func.coalesce(TerrainCache.content_hash, "")),
+            previous(TerrainCache.s3_key),
+        )
+        
+        previous_hash, previous_key = (await db.execute(stmt)).one()
+        
+        superseded = []
+        if previous_key is not None and previous_key != s3_key:
+            superseded.append(previous_key)
+        if (
+            previous_hash is not None
+            and terrain_type == TerrainType.ELEVATION
+            and previous_hash != content_hash
+        ):
+            superseded.extend(await self._drop_derived_artifacts(site_id, db))
         
         await db.commit()
-        await db.refresh(cache_entry)
+        # Core statements bypass the lookup cache's mapper-event invalidation
+        get_terrain_cache_lookup().invalidate(site_id, terrain_type, variant)
+        await self._s3_service.discard_terrain_files(superseded)
+    
+    async def _drop_derived_artifacts(self, site_id: UUID, db: AsyncSession) -> list[str]:
+        """
+        Forget everything computed from a site's previous DEM.
         
-        return cache_entry
+        Slope rasters and visualization GeoJSON are keyed by site and
+        variant, not by DEM version, so a refreshed DEM must drop them or
+        they (and the ETags derived from them) would keep being served.
+        
+        Returns:
+            S3 keys of the dropped artifacts, to delete after commit
+        """
+        result = await db.execute(
+            delete(TerrainCache)
+            .where(TerrainCache.site_id == site_id)
+            .where(TerrainCache.terrain_type != TerrainType.ELEVATION.value)
+            .returning(TerrainCache.s3_key)
+        )
+        get_terrain_cache_lookup().invalidate_site(site_id)
+        return [key for key in result.scalars() if key]
 
 
 # Global service instance
@@ -12,14 +12,17 @@ Phase D-04 enhancements:
 - KMZ includes slope/buildability styling
 - CSV export for tabular data
 """
+import asyncio
 import csv
 import io
 import json
 import logging
 import zipfile
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Optional
 from uuid import UUID
+from xml.sax.saxutils import escape as xml_escape
 
 from app.config import get_settings
 from app.services.s3 import get_s3_service
@@ -37,11 +40,155 @@ SLOPE_LIMITS = {
 }
 
 
+# Asset type colors (AABBGGRR format for KML)
+ASSET_COLORS = {
+    "solar_array": "ff00ffff",    # Yellow
+    "battery": "ffff00ff",         # Magenta/Purple
+    "generator": "ff0000ff",       # Red
+    "substation": "ffff0000",      # Blue
+}
+
+# D-04-04: Road grade colors
+ROAD_GRADE_COLORS = {
+    "easy": "ff00ff00",      # Green (< 5%)
+    "moderate": "ff00a5ff",  # Orange (5-10%)
+    "steep": "ff0000ff",     # Red (> 10%)
+}
+
+# KML templates. Placemarks reference the shared styles by id, so each
+# Style is written once per document instead of once per feature.
+_KML_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+    "<name>{name}</name>"
+)
+_KML_DESCRIPTION = "<description>{description}</description>"
+_KML_ICON_STYLE = (
+    '<Style id="{id}"><IconStyle><color>{color}</color><scale>{scale}</scale>'
+    "<Icon><href>http://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href></Icon>"
+    "</IconStyle></Style>"
+)
+_KML_LINE_STYLE = (
+    '<Style id="{id}"><LineStyle><color>{color}</color><width>{width}</width></LineStyle>'
+    "{poly}</Style>"
+)
+_KML_STYLES = "".join([
+    _KML_LINE_STYLE.format(
+        id="boundary", color="ff0000ff", width=3, poly="<PolyStyle><fill>0</fill></PolyStyle>"
+    ),
+    *(
+        _KML_ICON_STYLE.format(id=f"asset-{asset_type}", color=color, scale=1.2)
+        for asset_type, color in ASSET_COLORS.items()
+    ),
+    _KML_ICON_STYLE.format(id="asset-default", color="ffffffff", scale=1.2),
+    # Asset exceeds slope limit - reddish tint
+    _KML_ICON_STYLE.format(id="asset-over-limit", color="ff5555ff", scale=1.0),
+    *(
+        _KML_LINE_STYLE.format(id=f"road-{grade_class}", color=color, width=4, poly="")
+        for grade_class, color in ROAD_GRADE_COLORS.items()
+    ),
+])
+_KML_FOLDER_OPEN = "<Folder><name>{name}</name>"
+_KML_FOLDER_CLOSE = "</Folder>"
+_KML_POINT = (
+    "<Placemark><name>{name}</name><description>{description}</description>"
+    "<styleUrl>#{style}</styleUrl><Point><coordinates>{x},{y}</coordinates></Point></Placemark>"
+)
+_KML_LINESTRING = (
+    "<Placemark><name>{name}</name><description>{description}</description>"
+    "<styleUrl>#{style}</styleUrl><LineString><coordinates>{coordinates}</coordinates></LineString></Placemark>"
+)
+_KML_POLYGON = (
+    "<Placemark><name>{name}</name><description>{description}</description>"
+    "<styleUrl>#{style}</styleUrl><Polygon><outerBoundaryIs><LinearRing>"
+    "<coordinates>{coordinates}</coordinates></LinearRing></outerBoundaryIs></Polygon></Placemark>"
+)
+_KML_FOOTER = "</Document></kml>"
+
+
 def _safe_number(value: Optional[float], default: float = 0.0) -> float:
     """Return a numeric value that is safe to format (treat None as default)."""
     return value if value is not None else default
 
 
+def _xml_text(value: Any) -> str:
+    """Escape a value for use as KML element text."""
+    return xml_escape(str(value))
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> dict[str, Any]:
+    """
+    Build the PDF report's paragraph and table styles once per process.
+    
+    reportlab is imported lazily like in ExportService._build_pdf; the
+    styles are never mutated, so every report shares them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    
+    def table_style(
+        header_color: str,
+        header_font_size: int,
+        body_font_size: int,
+        header_padding: int,
+        body_padding: int,
+        centered_from: Optional[int] = None,
+    ) -> TableStyle:
+        commands = [
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), header_padding),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+            ('FONTSIZE', (0, 1), (-1, -1), body_font_size),
+            ('TOPPADDING', (0, 1), (-1, -1), body_padding),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), body_padding),
+        ]
+        if centered_from is not None:
+            commands.insert(3, ('ALIGN', (centered_from, 0), (-1, -1), 'CENTER'))
+        return TableStyle(commands)
+    
+    sample = getSampleStyleSheet()
+    return {
+        "normal": sample['Normal'],
+        "heading2": sample['Heading2'],
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor('#1a365d'),
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=sample['Heading2'],
+            fontSize=14,
+            spaceBefore=20,
+            spaceAfter=10,
+            textColor=colors.HexColor('#2c5282'),
+        ),
+        "subheading": ParagraphStyle(
+            'CustomSubheading',
+            parent=sample['Heading3'],
+            fontSize=11,
+            spaceBefore=12,
+            spaceAfter=6,
+            textColor=colors.HexColor('#4a5568'),
+        ),
+        # Section tables (site summary, terrain, asset inventory)
+        "summary_table": table_style('#2c5282', 11, 10, 12, 8),
+        "summary_table_centered": table_style('#2c5282', 11, 10, 12, 8, centered_from=1),
+        # Breakdown tables (slope distribution, buildable area, roads)
+        "breakdown_table": table_style('#4a5568', 10, 9, 10, 6, centered_from=1),
+        "detail_table": table_style('#4a5568', 9, 8, 10, 6, centered_from=2),
+    }
+
+
 class ExportService:
     """
     Service for generating layout exports in various formats.
@@ -110,39 +257,151 @@ class ExportService:
         Returns:
             Presigned S3 download URL
         """
-        try:
-            import simplekml
-        except ImportError:
-            logger.error("simplekml not installed. Run: pip install simplekml")
-            raise
+        kmz_bytes = await asyncio.to_thread(
+            self._build_kmz,
+            site_name,
+            site_boundary,
+            assets,
+            roads,
+            layout_data,
+            terrain_summary,
+        )
+        
+        # Upload to S3
+        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/layout.kmz"
+        await self._s3_service.upload_output_file(
+            s3_key=s3_key,
+            content=kmz_bytes,
+            content_type="application/vnd.google-earth.kmz",
+        )
+        
+        url = await self._s3_service.get_output_presigned_url(s3_key)
+        logger.info(f"Generated KMZ export for layout {layout_id}")
+        
+        return url
+    
+    async def export_pdf(
+        self,
+        layout_id: UUID,
+        site_name: str,
+        site_area_m2: float,
+        layout_data: dict,
+        assets: list[dict],
+        roads: list[dict],
+        terrain_summary: Optional[dict] = None,
+    ) -> str:
+        """
+        Export layout as PDF report.
+        
+        D-04-01: Includes terrain summary (slope stats, buildable %).
+        
+        Args:
+            layout_id: UUID of the layout
+            site_name: Name of the site
+            site_area_m2: Site area in square meters
+            layout_data: Layout metadata (capacity, cut/fill, etc.)
+            assets: List of asset dicts
+            roads: List of road dicts
+            terrain_summary: Terrain analysis data (D-04)
+            
+        Returns:
+            Presigned S3 download URL
+        """
+        pdf_bytes = await asyncio.to_thread(
+            self._build_pdf,
+            site_name,
+            site_area_m2,
+            layout_data,
+            assets,
+            roads,
+            terrain_summary,
+        )
+        
+        # Upload to S3
+        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/report.pdf"
+        await self._s3_service.upload_output_file(
+            s3_key=s3_key,
+            content=pdf_bytes,
+            content_type="application/pdf",
+        )
+        
+        url = await self._s3_service.get_output_presigned_url(s3_key)
+        logger.info(f"Generated PDF export for layout {layout_id}")
+        
+        return url
+    
+    @staticmethod
+    def _build_kmz(
+        site_name: str,
+        site_boundary: dict,
+        assets: list[dict],
+        roads: list[dict],
+        layout_data: Optional[dict],
+        terrain_summary: Optional[dict],
+    ) -> bytes:
+        """Render the KMZ archive (CPU-bound; run off the event loop)."""
+        # Create KMZ (ZIP with .kml file inside). KMZ readers only support
+        # DEFLATE, so squeeze it at the highest level instead of switching codec.
+        # The KML is streamed into the archive (TextIOWrapper batches the
+        # small writes), so the uncompressed document is never held whole.
+        kmz_buffer = io.BytesIO()
+        with zipfile.ZipFile(kmz_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            with io.TextIOWrapper(zf.open("doc.kml", "w"), encoding="utf-8") as kml:
+                for part in ExportService._kml_parts(
+                    site_name,
+                    site_boundary,
+                    assets,
+                    roads,
+                    layout_data,
+                    terrain_summary,
+                ):
+                    kml.write(part)
+        return kmz_buffer.getvalue()
+    
+    @staticmethod
+    def _kml_parts(
+        site_name: str,
+        site_boundary: dict,
+        assets: list[dict],
+        roads: list[dict],
+        layout_data: Optional[dict],
+        terrain_summary: Optional[dict],
+    ) -> Iterator[str]:
+        """
+        Yield the KML document in pieces.
         
-        kml = simplekml.Kml(name=f"{site_name} Layout")
+        The KML is formatted straight from string templates rather than
+        through simplekml, which builds (and then re-walks) an object tree
+        with several nodes per placemark.
+        """
         layout_data = layout_data or {}
+        yield _KML_HEADER.format(name=_xml_text(f"{site_name} Layout"))
         
-        # Asset type colors (AABBGGRR format for KML)
-        ASSET_COLORS = {
-            "solar_array": "ff00ffff",    # Yellow
-            "battery": "ffff00ff",         # Magenta/Purple
-            "generator": "ff0000ff",       # Red
-            "substation": "ffff0000",      # Blue
-        }
-        
-        # D-04-04: Road grade colors
-        ROAD_GRADE_COLORS = {
-            "easy": "ff00ff00",      # Green (< 5%)
-            "moderate": "ff00a5ff",  # Orange (5-10%)
-            "steep": "ff0000ff",     # Red (> 10%)
-        }
+        # D-04-04: Add terrain summary as a document description
+        if terrain_summary:
+            elev = terrain_summary.get("elevation", {})
+            slope = terrain_summary.get("slope", {})
+            elev_min = _safe_number(elev.get("min_m"))
+            elev_max = _safe_number(elev.get("max_m"))
+            elev_range = _safe_number(elev.get("range_m"))
+            slope_min = _safe_number(slope.get("min_deg"))
+            slope_max = _safe_number(slope.get("max_deg"))
+            slope_mean = _safe_number(slope.get("mean_deg"))
+            yield _KML_DESCRIPTION.format(description=_xml_text(
+                f"Terrain Summary for {site_name}\n\n"
+                f"DEM Source: {terrain_summary.get('dem_source', 'Unknown')}\n"
+                f"Resolution: {terrain_summary.get('dem_resolution_m', 'N/A')} m\n\n"
+                f"Elevation: {elev_min:.0f} - {elev_max:.0f} m "
+                f"(range: {elev_range:.0f} m)\n"
+                f"Slope: {slope_min:.1f}° - {slope_max:.1f}° "
+                f"(mean: {slope_mean:.1f}°)\n"
+            ))
+        
+        yield _KML_STYLES
         
         # Add site boundary
         if site_boundary and site_boundary.get("coordinates"):
             coords = site_boundary["coordinates"][0]  # Outer ring
-            boundary = kml.newfolder(name="Site Boundary")
-            pol = boundary.newpolygon(name=site_name)
-            pol.outerboundaryis = [(c[0], c[1]) for c in coords]
-            pol.style.linestyle.color = "ff0000ff"  # Red
-            pol.style.linestyle.width = 3
-            pol.style.polystyle.fill = 0
             
             # Add site info to description
             desc_parts = [f"Site: {site_name}"]
@@ -155,10 +414,18 @@ class ExportService:
                 fill_volume = layout_data.get("fill_volume_m3")
                 if fill_volume:
                     desc_parts.append(f"Fill Volume: {_safe_number(fill_volume):,.0f} m³")
-            pol.description = "\n".join(desc_parts)
+            
+            yield _KML_FOLDER_OPEN.format(name="Site Boundary")
+            yield _KML_POLYGON.format(
+                name=_xml_text(site_name),
+                description=_xml_text("\n".join(desc_parts)),
+                style="boundary",
+                coordinates=" ".join(f"{c[0]},{c[1]}" for c in coords),
+            )
+            yield _KML_FOLDER_CLOSE
         
         # Add assets with D-04-04 slope/buildability styling
-        assets_folder = kml.newfolder(name="Assets")
+        yield _KML_FOLDER_OPEN.format(name="Assets")
         for asset in assets:
             if not asset.get("position"):
                 continue
@@ -167,11 +434,6 @@ class ExportService:
             if len(coords) < 2:
                 continue
             
-            pnt = assets_folder.newpoint(
-                name=asset.get("name", "Asset"),
-                coords=[(coords[0], coords[1])],
-            )
-            
             # D-04-04: Enhanced description with slope suitability
             asset_type = asset.get("asset_type", "unknown")
             slope_limit = SLOPE_LIMITS.get(asset_type, 15.0)
@@ -190,20 +452,26 @@ class ExportService:
                 desc_parts.append(f"Max allowed: {slope_limit}°")
             if asset.get("footprint_length_m") and asset.get("footprint_width_m"):
                 desc_parts.append(f"Footprint: {asset['footprint_length_m']:.0f}×{asset['footprint_width_m']:.0f} m")
-            pnt.description = "\n".join(desc_parts)
             
             # D-04-04: Color based on slope suitability
-            base_color = ASSET_COLORS.get(asset_type, "ffffffff")
             if actual_slope is not None and actual_slope > slope_limit:
-                # Asset exceeds slope limit - use red tint
-                pnt.style.iconstyle.color = "ff5555ff"  # Reddish
-                pnt.style.iconstyle.scale = 1.0
+                style = "asset-over-limit"
+            elif asset_type in ASSET_COLORS:
+                style = f"asset-{asset_type}"
             else:
-                pnt.style.iconstyle.color = base_color
-                pnt.style.iconstyle.scale = 1.2
+                style = "asset-default"
+            
+            yield _KML_POINT.format(
+                name=_xml_text(asset.get("name", "Asset")),
+                description=_xml_text("\n".join(desc_parts)),
+                style=style,
+                x=coords[0],
+                y=coords[1],
+            )
+        yield _KML_FOLDER_CLOSE
         
         # Add roads with D-04-04 grade-based coloring
-        roads_folder = kml.newfolder(name="Roads")
+        yield _KML_FOLDER_OPEN.format(name="Roads")
         for i, road in enumerate(roads):
             if not road.get("geometry"):
                 continue
@@ -212,11 +480,6 @@ class ExportService:
             if len(coords) < 2:
                 continue
             
-            line = roads_folder.newlinestring(
-                name=road.get("name", f"Road {i+1}"),
-                coords=[(c[0], c[1]) for c in coords],
-            )
-            
             # D-04-04: Color based on grade
             grade = road.get("max_grade_pct", 0) or 0
             if grade < 5:
@@ -226,94 +489,38 @@ class ExportService:
             else:
                 grade_class = "steep"
             
-            line.style.linestyle.color = ROAD_GRADE_COLORS[grade_class]
-            line.style.linestyle.width = 4
-            
             length_m = _safe_number(road.get("length_m"))
             desc_parts = [f"Length: {length_m:.0f} m"]
             if road.get("max_grade_pct") is not None:
                 desc_parts.append(
                     f"Max Grade: {road['max_grade_pct']:.1f}% ({grade_class.title()})"
                 )
-            line.description = "\n".join(desc_parts)
-        
-        # D-04-04: Add terrain summary as a document description
-        if terrain_summary:
-            elev = terrain_summary.get("elevation", {})
-            slope = terrain_summary.get("slope", {})
-            elev_min = _safe_number(elev.get("min_m"))
-            elev_max = _safe_number(elev.get("max_m"))
-            elev_range = _safe_number(elev.get("range_m"))
-            slope_min = _safe_number(slope.get("min_deg"))
-            slope_max = _safe_number(slope.get("max_deg"))
-            slope_mean = _safe_number(slope.get("mean_deg"))
-            kml.document.description = (
-                f"Terrain Summary for {site_name}\n\n"
-                f"DEM Source: {terrain_summary.get('dem_source', 'Unknown')}\n"
-                f"Resolution: {terrain_summary.get('dem_resolution_m', 'N/A')} m\n\n"
-                f"Elevation: {elev_min:.0f} - {elev_max:.0f} m "
-                f"(range: {elev_range:.0f} m)\n"
-                f"Slope: {slope_min:.1f}° - {slope_max:.1f}° "
-                f"(mean: {slope_mean:.1f}°)\n"
+            
+            yield _KML_LINESTRING.format(
+                name=_xml_text(road.get("name", f"Road {i+1}")),
+                description=_xml_text("\n".join(desc_parts)),
+                style=f"road-{grade_class}",
+                coordinates=" ".join(f"{c[0]},{c[1]}" for c in coords),
             )
+        yield _KML_FOLDER_CLOSE
         
-        # Save as KMZ (zipped KML)
-        kml_content = kml.kml()
-        
-        # Create KMZ (ZIP with .kml file inside)
-        kmz_buffer = io.BytesIO()
-        with zipfile.ZipFile(kmz_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("doc.kml", kml_content)
-        kmz_bytes = kmz_buffer.getvalue()
-        
-        # Upload to S3
-        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/layout.kmz"
-        await self._s3_service.upload_output_file(
-            s3_key=s3_key,
-            content=kmz_bytes,
-            content_type="application/vnd.google-earth.kmz",
-        )
-        
-        url = await self._s3_service.get_output_presigned_url(s3_key)
-        logger.info(f"Generated KMZ export for layout {layout_id}")
-        
-        return url
+        yield _KML_FOOTER
     
-    async def export_pdf(
-        self,
-        layout_id: UUID,
+    @staticmethod
+    def _build_pdf(
         site_name: str,
         site_area_m2: float,
         layout_data: dict,
         assets: list[dict],
         roads: list[dict],
-        terrain_summary: Optional[dict] = None,
-    ) -> str:
-        """
-        Export layout as PDF report.
-        
-        D-04-01: Includes terrain summary (slope stats, buildable %).
-        
-        Args:
-            layout_id: UUID of the layout
-            site_name: Name of the site
-            site_area_m2: Site area in square meters
-            layout_data: Layout metadata (capacity, cut/fill, etc.)
-            assets: List of asset dicts
-            roads: List of road dicts
-            terrain_summary: Terrain analysis data (D-04)
-            
-        Returns:
-            Presigned S3 download URL
-        """
+        terrain_summary: Optional[dict],
+    ) -> bytes:
+        """Render the PDF report (CPU-bound; run off the event loop)."""
         try:
-            from reportlab.lib import colors
             from reportlab.lib.pagesizes import letter
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import inch
             from reportlab.platypus import (
-                SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-                PageBreak
+                SimpleDocTemplate, Paragraph, Spacer, Table, LongTable,
             )
         except ImportError:
             logger.error("reportlab not installed. Run: pip install reportlab")
@@ -329,42 +536,22 @@ class ExportService:
             bottomMargin=72,
         )
         
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1a365d'),
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#2c5282'),
-        )
-        subheading_style = ParagraphStyle(
-            'CustomSubheading',
-            parent=styles['Heading3'],
-            fontSize=11,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=colors.HexColor('#4a5568'),
-        )
+        styles = _pdf_styles()
+        title_style = styles['title']
+        heading_style = styles['heading']
+        subheading_style = styles['subheading']
         
         story = []
         
         # Title
         story.append(Paragraph(f"Site Layout Report", title_style))
-        story.append(Paragraph(f"<b>{site_name}</b>", styles['Heading2']))
+        story.append(Paragraph(f"<b>{site_name}</b>", styles['heading2']))
         story.append(Spacer(1, 12))
         
         # Generation info
         story.append(Paragraph(
             f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
-            styles['Normal']
+            styles['normal']
         ))
         story.append(Spacer(1, 24))
         
@@ -396,19 +583,7 @@ class ExportService:
             site_data.append(["Terrain Mode", "Terrain-aware placement"])
         
         site_table = Table(site_data, colWidths=[2*inch, 3*inch])
-        site_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
+        site_table.setStyle(styles['summary_table'])
         story.append(site_table)
         story.append(Spacer(1, 24))
         
@@ -436,19 +611,7 @@ class ExportService:
             ]
             
             terrain_table = Table(terrain_data, colWidths=[2*inch, 3*inch])
-            terrain_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ]))
+            terrain_table.setStyle(styles['summary_table'])
             story.append(terrain_table)
             story.append(Spacer(1, 16))
             
@@ -468,20 +631,7 @@ class ExportService:
                     ])
                 
                 slope_dist_table = Table(slope_dist_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-                slope_dist_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a5568')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                    ('TOPPADDING', (0, 1), (-1, -1), 6),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ]))
+                slope_dist_table.setStyle(styles['breakdown_table'])
                 story.append(slope_dist_table)
                 story.append(Spacer(1, 16))
             
@@ -502,20 +652,7 @@ class ExportService:
                     ])
                 
                 buildable_table = Table(buildable_data, colWidths=[1.8*inch, 1.2*inch, 1.5*inch, 1*inch])
-                buildable_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a5568')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                    ('TOPPADDING', (0, 1), (-1, -1), 6),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ]))
+                buildable_table.setStyle(styles['breakdown_table'])
                 story.append(buildable_table)
             
             story.append(Spacer(1, 24))
@@ -541,20 +678,7 @@ class ExportService:
             ])
         
         asset_table = Table(asset_data, colWidths=[2.5*inch, 1.5*inch, 2*inch])
-        asset_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (2, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
+        asset_table.setStyle(styles['summary_table_centered'])
         story.append(asset_table)
         story.append(Spacer(1, 24))
         
@@ -574,20 +698,7 @@ class ExportService:
                 ])
             
             detail_table = Table(detail_data, colWidths=[1.5*inch, 1.3*inch, 1*inch, 1*inch, 0.8*inch])
-            detail_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a5568')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ]))
+            detail_table.setStyle(styles['detail_table'])
             story.append(detail_table)
             story.append(Spacer(1, 24))
         
@@ -606,39 +717,19 @@ class ExportService:
                     grade_str,
                 ])
             
-            road_table = Table(road_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-            road_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a5568')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ]))
+            # The road list is unbounded, so it may span pages: LongTable
+            # splits long tables cheaply and repeatRows keeps the header
+            road_table = LongTable(
+                road_data,
+                colWidths=[2.5*inch, 1.5*inch, 1.5*inch],
+                repeatRows=1,
+            )
+            road_table.setStyle(styles['breakdown_table'])
             story.append(road_table)
         
         # Build PDF
         doc.build(story)
-        pdf_bytes = buffer.getvalue()
-        
-        # Upload to S3
-        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/report.pdf"
-        await self._s3_service.upload_output_file(
-            s3_key=s3_key,
-            content=pdf_bytes,
-            content_type="application/pdf",
-        )
-        
-        url = await self._s3_service.get_output_presigned_url(s3_key)
-        logger.info(f"Generated PDF export for layout {layout_id}")
-        
-        return url
+        return buffer.getvalue()
     
     async def export_csv(
         self,
@@ -665,6 +756,37 @@ class ExportService:
         Returns:
             Presigned S3 download URL
         """
+        csv_bytes = await asyncio.to_thread(
+            self._build_csv,
+            site_name,
+            site_area_m2,
+            layout_data,
+            assets,
+            roads,
+        )
+        
+        # Upload to S3
+        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/layout_data.zip"
+        await self._s3_service.upload_output_file(
+            s3_key=s3_key,
+            content=csv_bytes,
+            content_type="application/zip",
+        )
+        
+        url = await self._s3_service.get_output_presigned_url(s3_key)
+        logger.info(f"Generated CSV export for layout {layout_id}")
+        
+        return url
+    
+    @staticmethod
+    def _build_csv(
+        site_name: str,
+        site_area_m2: float,
+        layout_data: dict,
+        assets: list[dict],
+        roads: list[dict],
+    ) -> bytes:
+        """Render the CSV ZIP archive (CPU-bound; run off the event loop)."""
         # Create multi-sheet CSV as a ZIP file with separate CSVs
         csv_buffer = io.BytesIO()
         
@@ -731,20 +853,8 @@ class ExportService:
                 ])
             zf.writestr("roads.csv", roads_csv.getvalue())
         
-        csv_bytes = csv_buffer.getvalue()
-        
-        # Upload to S3
-        s3_key = f"{self.OUTPUTS_S3_PREFIX}/{layout_id}/layout_data.zip"
-        await self._s3_service.upload_output_file(
-            s3_key=s3_key,
-            content=csv_bytes,
-            content_type="application/zip",
-        )
-        
-        url = await self._s3_service.get_output_presigned_url(s3_key)
-        logger.info(f"Generated CSV export for layout {layout_id}")
         
-        return url
+        return csv_buffer.getvalue()
 
 
 # Global service instance
@@ -4,7 +4,11 @@ S3 file storage service.
 Handles uploads and downloads to AWS S3 buckets.
 """
 import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 
 import boto3
@@ -15,6 +19,14 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Content-addressed objects never change, so any cache may keep them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest used to name content-addressed terrain objects."""
+    return hashlib.sha256(content).hexdigest()
+
 
 class S3Service:
     """
@@ -23,12 +35,34 @@ class S3Service:
     Handles uploading files to S3 and generating presigned URLs.
     """
     
+    # Presigned URLs are handed out again while at least this much of their
+    # lifetime is left, so a repeat export skips re-signing (SigV4)
+    PRESIGNED_URL_MIN_REMAINING_S = 900
+    PRESIGNED_URL_MAX_ENTRIES = 1024
+    
     def __init__(self):
         """Initialize S3 client."""
-        self._client = boto3.client(
+        self._session = boto3.Session()
+        self._client = self._session.client(
             "s3",
             region_name=settings.aws_region,
         )
+        # (access key, bucket, key, expires_in) -> (reuse until, url)
+        self._presigned_urls: OrderedDict[tuple[str, str, str, int], tuple[float, str]] = OrderedDict()
+    
+    def _signing_access_key(self) -> str:
+        """
+        Access key the client currently signs with.
+        
+        On the ECS task role these are temporary STS credentials, and a
+        presigned URL stops working when its session token expires,
+        whatever ExpiresIn says. botocore rotates them well before expiry
+        (and reading them here triggers that refresh), so keying cached
+        URLs on the access key stops URLs signed with a retiring token
+        from being handed out after the rotation.
+        """
+        credentials = self._session.get_credentials()
+        return credentials.get_frozen_credentials().access_key if credentials else ""
     
     @property
     def uploads_bucket(self) -> str:
@@ -101,6 +135,10 @@ class S3Service:
         """
         Generate a presigned URL for downloading a file.
         
+        A URL issued earlier for the same object, with the same credentials,
+        is returned instead while it still has PRESIGNED_URL_MIN_REMAINING_S
+        left to run.
+        
         Args:
             bucket: S3 bucket name
             key: S3 object key
@@ -109,6 +147,13 @@ class S3Service:
         Returns:
             Presigned URL string
         """
+        cache_key = (self._signing_access_key(), bucket, key, expires_in)
+        now = time.monotonic()
+        cached = self._presigned_urls.get(cache_key)
+        if cached is not None and cached[0] > now:
+            self._presigned_urls.move_to_end(cache_key)
+            return cached[1]
+        
         try:
             url = await asyncio.to_thread(
                 self._client.generate_presigned_url,
@@ -116,14 +161,22 @@ class S3Service:
                 Params={"Bucket": bucket, "Key": key},
                 ExpiresIn=expires_in,
             )
-            return url
         except ClientError as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             raise
+        
+        reuse_for = expires_in - self.PRESIGNED_URL_MIN_REMAINING_S
+        if reuse_for > 0:
+            self._presigned_urls[cache_key] = (now + reuse_for, url)
+            self._presigned_urls.move_to_end(cache_key)
+            while len(self._presigned_urls) > self.PRESIGNED_URL_MAX_ENTRIES:
+                self._presigned_urls.popitem(last=False)
+        return url
     
     async def delete_site_files(self, site_id: str) -> None:
         """
-        Delete all files for a site from S3.
+        Delete all files for a site from S3: the uploaded boundary file and
+        every terrain artifact (DEM, slope, GeoJSON) in the outputs bucket.
         
         Args:
             site_id: UUID of the site
@@ -152,6 +205,8 @@ class S3Service:
         except ClientError as e:
             logger.error(f"Failed to delete site files: {e}")
             raise
+        
+        await self.delete_terrain_files(site_id)
     
     # =========================================================================
     # Phase B: Terrain and Output File Operations
@@ -162,18 +217,21 @@ class S3Service:
         s3_key: str,
         content: bytes,
         content_type: str = "image/tiff",
+        cache_control: Optional[str] = None,
     ) -> str:
         """
         Upload terrain file (DEM, slope raster) to outputs bucket.
         
         Args:
-            s3_key: S3 key path (e.g., "terrain/{site_id}/dem.tif")
+            s3_key: S3 key path (e.g., "terrain/{site_id}/dem-{sha256}.tif")
             content: File content as bytes
             content_type: MIME type (default: image/tiff for GeoTIFF)
+            cache_control: Optional Cache-Control header stored with the object
             
         Returns:
             S3 key where the file was stored
         """
+        extra_args = {"CacheControl": cache_control} if cache_control else {}
         try:
             await asyncio.to_thread(
                 self._client.put_object,
@@ -181,6 +239,7 @@ class S3Service:
                 Key=s3_key,
                 Body=content,
                 ContentType=content_type,
+                **extra_args,
             )
             logger.info(f"Uploaded terrain file to s3://{self.outputs_bucket}/{s3_key}")
             return s3_key
@@ -288,8 +347,8 @@ class S3Service:
         Returns:
             S3 key where the file was stored
         """
-        import json
-        content = json.dumps(data, indent=2).encode("utf-8")
+        # Compact output: indent would force json's pure-Python encoder
+        content = json.dumps(data, separators=(",", ":")).encode("utf-8")
         return await self.upload_output_file(
             s3_key=s3_key,
             content=content,
@@ -306,26 +365,53 @@ class S3Service:
         prefix = f"terrain/{site_id}/"
         
         try:
-            response = await asyncio.to_thread(
-                self._client.list_objects_v2,
-                Bucket=self.outputs_bucket,
-                Prefix=prefix,
-            )
+            # Superseded content-addressed versions can push a site past
+            # one listing page (1000 keys), so walk every page
+            def _delete_all() -> int:
+                deleted = 0
+                paginator = self._client.get_paginator("list_objects_v2")
+                for page in paginator.paginate(Bucket=self.outputs_bucket, Prefix=prefix):
+                    objects = page.get("Contents", [])
+                    if objects:
+                        self._client.delete_objects(
+                            Bucket=self.outputs_bucket,
+                            Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]},
+                        )
+                        deleted += len(objects)
+                return deleted
             
-            objects = response.get("Contents", [])
-            if objects:
-                delete_keys = [{"Key": obj["Key"]} for obj in objects]
-                await asyncio.to_thread(
-                    self._client.delete_objects,
-                    Bucket=self.outputs_bucket,
-                    Delete={"Objects": delete_keys},
-                )
-                logger.info(f"Deleted {len(delete_keys)} terrain files for site {site_id}")
+            deleted = await asyncio.to_thread(_delete_all)
+            if deleted:
+                logger.info(f"Deleted {deleted} terrain files for site {site_id}")
                 
         except ClientError as e:
             logger.error(f"Failed to delete terrain files: {e}")
             raise
     
+    async def discard_terrain_files(self, s3_keys: list[str]) -> None:
+        """
+        Best-effort delete of superseded terrain objects in outputs bucket.
+        
+        Content-addressed keys change on every regeneration, so the object
+        a TerrainCache row used to point at must be removed explicitly.
+        Failures are logged, not raised: the row already points at the new
+        object, and site deletion sweeps the prefix anyway.
+        
+        Args:
+            s3_keys: S3 keys to delete
+        """
+        if not s3_keys:
+            return
+        try:
+            await asyncio.to_thread(
+                self._client.delete_objects,
+                Bucket=self.outputs_bucket,
+                Delete={"Objects": [{"Key": key} for key in s3_keys], "Quiet": True},
+            )
+            logger.info(f"Deleted {len(s3_keys)} superseded terrain files")
+        except ClientError as e:
+            logger.warning(f"Failed to delete superseded terrain files {s3_keys}: {e}")
+    
     async def get_output_presigned_url(
         self,
         key: str,
@@ -15,7 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models.terrain_cache import TerrainCache, TerrainType
-from app.services.s3 import get_s3_service
+from app.services.s3 import IMMUTABLE_CACHE_CONTROL, content_hash, get_s3_service
+from app.services.terrain_cache_lookup import get_terrain_cache_lookup
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -71,13 +72,14 @@ class SlopeService:
             slope_array, profile = self._compute_slope(dem_bytes)
             
             # Upload to S3
-            s3_key = await self._upload_slope_to_s3(site_id, slope_array, profile)
+            s3_key, digest = await self._upload_slope_to_s3(site_id, slope_array, profile)
             
             # Create cache record
             await self._update_cache_record(
                 site_id=site_id,
                 terrain_type=TerrainType.SLOPE,
                 s3_key=s3_key,
+                content_hash=digest,
                 resolution_m=profile.get("resolution_m"),
                 source="computed",
                 db=db,
@@ -193,21 +195,14 @@ class SlopeService:
         db: AsyncSession,
     ) -> Optional[str]:
         """Check if we have a cached slope raster for this site."""
-        stmt = (
-            select(TerrainCache)
-            .where(TerrainCache.site_id == site_id)
-            .where(TerrainCache.terrain_type == TerrainType.SLOPE.value)
-            .where(TerrainCache.variant_key.is_(None))
-        )
-        result = await db.execute(stmt)
-        cache_entry = result.scalar_one_or_none()
+        lookup = get_terrain_cache_lookup()
+        s3_key = await lookup.get_s3_key(site_id, TerrainType.SLOPE, db)
         
-        if cache_entry:
-            if await self._s3_service.terrain_file_exists(cache_entry.s3_key):
-                return cache_entry.s3_key
+        if s3_key:
+            if await self._s3_service.terrain_file_exists(s3_key):
+                return s3_key
             else:
-                await db.delete(cache_entry)
-                await db.commit()
+                await lookup.delete_entry(site_id, TerrainType.SLOPE, db, s3_key=s3_key)
         
         return None
     
@@ -216,29 +211,37 @@ class SlopeService:
         site_id: UUID,
         slope_array: np.ndarray,
         profile: dict,
-    ) -> str:
-        """Upload slope GeoTIFF to S3."""
-        s3_key = f"{self.TERRAIN_S3_PREFIX}/{site_id}/slope.tif"
+    ) -> tuple[str, str]:
+        """
+        Upload slope GeoTIFF to S3 under a content-addressed key.
         
+        Returns:
+            Tuple of (s3_key, sha256 hex digest of the GeoTIFF bytes)
+        """
         with MemoryFile() as memfile:
             with memfile.open(**profile) as dst:
                 dst.write(slope_array, 1)
             slope_bytes = memfile.read()
         
+        digest = content_hash(slope_bytes)
+        s3_key = f"{self.TERRAIN_S3_PREFIX}/{site_id}/slope-{digest}.tif"
+        
         await self._s3_service.upload_terrain_file(
             s3_key=s3_key,
             content=slope_bytes,
             content_type="image/tiff",
+            cache_control=IMMUTABLE_CACHE_CONTROL,
         )
         
         logger.info(f"Uploaded slope to s3://{settings.s3_outputs_bucket}/{s3_key}")
-        return s3_key
+        return s3_key, digest
     
     async def _update_cache_record(
         self,
         site_id: UUID,
         terrain_type: TerrainType,
         s3_key: str,
+        content_hash: str,
         resolution_m: Optional[float],
         source: str,
         db: AsyncSession,
@@ -257,9 +260,11 @@ class SlopeService:
 
         result = await db.execute(stmt)
         existing = result.scalar_one_or_none()
+        previous_key = existing.s3_key if existing else None
         
         if existing:
             existing.s3_key = s3_key
+            existing.content_hash = content_hash
             existing.resolution_m = resolution_m
             existing.source = source
             cache_entry = existing
@@ -268,6 +273,7 @@ class SlopeService:
                 site_id=site_id,
                 terrain_type=terrain_type.value,
                 s3_key=s3_key,
+                content_hash=content_hash,
                 resolution_m=resolution_m,
                 source=source,
                 variant_key=variant,
@@ -277,6 +283,10 @@ class SlopeService:
         await db.commit()
         await db.refresh(cache_entry)
         
+        # Content-addressed keys change with the content; drop the old object
+        if previous_key and previous_key != s3_key:
+            await self._s3_service.discard_terrain_files([previous_key])
+        
         return cache_entry
 
 
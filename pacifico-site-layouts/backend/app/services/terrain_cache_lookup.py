@@ -0,0 +1,198 @@
+"""
+In-process lookup cache for TerrainCache rows.
+
+TerrainCache rows are effectively immutable once written, yet every layout
+generation and terrain visualization request re-SELECTs them to resolve S3
+keys. This service keeps a small TTL + LRU map of
+(site_id, terrain_type, variant_key) -> s3_key so warm lookups skip the
+database round-trip entirely.
+
+Entries are invalidated through SQLAlchemy mapper events whenever a
+TerrainCache row is inserted, updated or deleted via the ORM in this
+process. The TTL bounds staleness from writes made by other workers.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.terrain_cache import TerrainCache, TerrainType
+
+logger = logging.getLogger(__name__)
+
+# (site_id, terrain_type value, variant_key)
+CacheKey = tuple[str, str, Optional[str]]
+
+
+class TerrainCacheLookup:
+    """
+    TTL/LRU cache in front of TerrainCache S3 key lookups.
+    """
+
+    # Invalidation (mapper events, invalidate_site) only reaches this
+    # process. Other uvicorn workers or ECS tasks keep a superseded key
+    # until the TTL runs out, so callers that must see a regeneration
+    # immediately (e.g. ETag checks) read the row from the database.
+    DEFAULT_TTL_S = 300.0
+    DEFAULT_MAX_ENTRIES = 4096
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize an empty lookup cache."""
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def _key(
+        site_id: UUID | str,
+        terrain_type: TerrainType | str,
+        variant: Optional[str],
+    ) -> CacheKey:
+        """Normalize lookup arguments into a hashable cache key."""
+        type_value = terrain_type.value if isinstance(terrain_type, TerrainType) else terrain_type
+        return (str(site_id), type_value, variant)
+
+    async def get_s3_key(
+        self,
+        site_id: UUID,
+        terrain_type: TerrainType,
+        db: AsyncSession,
+        variant: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Resolve the S3 key of a cached terrain artifact.
+
+        Args:
+            site_id: UUID of the site
+            terrain_type: Type of terrain artifact
+            db: Database session (only used on a cache miss)
+            variant: Variant key, or None for un-keyed artifacts (DEM, slope)
+
+        Returns:
+            S3 key, or None if no cache row exists
+        """
+        key = self._key(site_id, terrain_type, variant)
+        hit = self._entries.get(key)
+        if hit is not None:
+            expires_at, s3_key = hit
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return s3_key
+            del self._entries[key]
+
+        stmt = (
+            select(TerrainCache.s3_key)
+            .where(TerrainCache.site_id == site_id)
+            .where(TerrainCache.terrain_type == key[1])
+        )
+        if variant is None:
+            stmt = stmt.where(TerrainCache.variant_key.is_(None))
+        else:
+            stmt = stmt.where(TerrainCache.variant_key == variant)
+
+        result = await db.execute(stmt)
+        s3_key = result.scalar_one_or_none()
+
+        if s3_key is not None:
+            self._store(key, s3_key)
+
+        return s3_key
+
+    def remember(
+        self,
+        site_id: UUID | str,
+        terrain_type: TerrainType | str,
+        s3_key: str,
+        variant: Optional[str] = None,
+    ) -> None:
+        """Cache an S3 key the caller has just read from the database."""
+        self._store(self._key(site_id, terrain_type, variant), s3_key)
+
+    def _store(self, key: CacheKey, s3_key: str) -> None:
+        """Insert or refresh an entry, evicting the least recently used."""
+        self._entries[key] = (time.monotonic() + self._ttl_s, s3_key)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete_entry(
+        self,
+        site_id: UUID,
+        terrain_type: TerrainType,
+        db: AsyncSession,
+        variant: Optional[str] = None,
+        s3_key: Optional[str] = None,
+    ) -> None:
+        """
+        Delete a stale TerrainCache row (e.g. S3 object missing) and forget it.
+        
+        Pass the s3_key that turned out to be missing: if another worker has
+        since repointed the row at a new object, the row is left alone and
+        only this process's cached key is dropped.
+        """
+        stmt = (
+            delete(TerrainCache)
+            .where(TerrainCache.site_id == site_id)
+            .where(TerrainCache.terrain_type == terrain_type.value)
+        )
+        if variant is None:
+            stmt = stmt.where(TerrainCache.variant_key.is_(None))
+        else:
+            stmt = stmt.where(TerrainCache.variant_key == variant)
+        if s3_key is not None:
+            stmt = stmt.where(TerrainCache.s3_key == s3_key)
+
+        await db.execute(stmt)
+        await db.commit()
+        self.invalidate(site_id, terrain_type, variant)
+
+    def invalidate(
+        self,
+        site_id: UUID | str,
+        terrain_type: TerrainType | str,
+        variant: Optional[str] = None,
+    ) -> None:
+        """Drop a single entry from the cache."""
+        self._entries.pop(self._key(site_id, terrain_type, variant), None)
+
+    def invalidate_site(self, site_id: UUID | str) -> None:
+        """Drop every entry belonging to a site."""
+        site_key = str(site_id)
+        for key in [key for key in self._entries if key[0] == site_key]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+# Global service instance
+_terrain_cache_lookup: Optional[TerrainCacheLookup] = None
+
+
+def get_terrain_cache_lookup() -> TerrainCacheLookup:
+    """Get the terrain cache lookup singleton."""
+    global _terrain_cache_lookup
+    if _terrain_cache_lookup is None:
+        _terrain_cache_lookup = TerrainCacheLookup()
+    return _terrain_cache_lookup
+
+
+@event.listens_for(TerrainCache, "after_insert")
+@event.listens_for(TerrainCache, "after_update")
+@event.listens_for(TerrainCache, "after_delete")
+def _invalidate_on_write(mapper, connection, target: TerrainCache) -> None:
+    """Invalidate the cached S3 key whenever a TerrainCache row changes."""
+    get_terrain_cache_lookup().invalidate(
+        target.site_id,
+        target.terrain_type,
+        target.variant_key,
+    )
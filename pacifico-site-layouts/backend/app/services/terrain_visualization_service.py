@@ -9,10 +9,13 @@ Generates terrain visualization data including:
 """
 import json
 import logging
+import re
+from collections import OrderedDict
 from typing import Any, Optional
 from uuid import UUID
 
 import numpy as np
+from botocore.exceptions import ClientError
 from rasterio.features import shapes
 from rasterio.io import MemoryFile
 from rasterio.transform import Affine
@@ -25,7 +28,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.terrain_cache import TerrainCache, TerrainType
 from app.services.dem_service import get_dem_service
 from app.services.slope_service import get_slope_service
-from app.services.s3 import get_s3_service
+from app.services.s3 import IMMUTABLE_CACHE_CONTROL, content_hash, get_s3_service
+from app.services.terrain_cache_lookup import get_terrain_cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +51,50 @@ SLOPE_CLASSES = [
 ]
 
 
+# Bumped when the cached GeoJSON shape changes so older rows are not reused
+# (v2: clipping debris stripped, geometries are single-type lines/polygons)
+GEOJSON_CACHE_VERSION = "v2"
+
+# Variant key of the (only) slope heatmap rendering
+SLOPE_HEATMAP_VARIANT = f"{GEOJSON_CACHE_VERSION}|default"
+
+# Content digest embedded in content-addressed GeoJSON keys by _cache_geojson
+_GEOJSON_DIGEST_RE = re.compile(r"-([0-9a-f]{64})\.json$")
+
+
+def contours_variant(interval_m: float) -> str:
+    """TerrainCache variant key for contours at a given interval."""
+    return f"{GEOJSON_CACHE_VERSION}|interval:{interval_m:.2f}"
+
+
+def buildable_area_variant(asset_type: str, max_slope_deg: Optional[float] = None) -> str:
+    """TerrainCache variant key for buildable area (asset default slope if None)."""
+    if max_slope_deg is None:
+        max_slope_deg = SLOPE_LIMITS.get(asset_type, 15.0)
+    return f"{GEOJSON_CACHE_VERSION}|asset:{asset_type}|max:{max_slope_deg}"
+
+
+def _parts_of_type(geom, single: type, multi: type):
+    """
+    Keep only the parts of a clip result that match the wanted geometry type.
+    
+    Intersections can return points or stray lines alongside the real
+    result (e.g. a contour touching the boundary), wrapped in a
+    GeometryCollection. Returns a single or multi geometry, or None.
+    """
+    if isinstance(geom, (single, multi)):
+        return geom
+    parts = [
+        part
+        for member in getattr(geom, "geoms", ())
+        for part in (member.geoms if isinstance(member, multi) else (member,))
+        if isinstance(part, single)
+    ]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else multi(parts)
+
+
 class TerrainVisualizationService:
     """
     Service for generating terrain visualization data.
@@ -55,39 +103,98 @@ class TerrainVisualizationService:
     and slope heatmaps from cached DEM and slope data.
     """
     
+    # Serialized response bodies kept in memory, keyed by content digest
+    RESPONSE_BODY_CACHE_SIZE = 64
+    
     def __init__(self):
         self._dem_service = get_dem_service()
         self._slope_service = get_slope_service()
         self._s3_service = get_s3_service()
+        self._response_bodies: OrderedDict[str, bytes] = OrderedDict()
     
-    async def _get_cached_geojson(
+    async def get_cached_digest(
         self,
         site_id: UUID,
         terrain_type: TerrainType,
         variant: str,
         db: AsyncSession,
-    ) -> Optional[dict]:
-        """Retrieve cached GeoJSON from TerrainCache/S3."""
+    ) -> Optional[str]:
+        """
+        Content digest of a cached GeoJSON artifact, without downloading it.
+        
+        The digest is part of the S3 key, so it changes whenever the artifact
+        is regenerated (e.g. after a DEM refresh) and can serve as a strong
+        ETag. Returns None if nothing is cached or the key predates
+        content addressing.
+        
+        The key is read from the database, not the in-process lookup cache:
+        another worker may have regenerated the artifact, and a stale key
+        would keep its old ETag and body in use until the lookup TTL ran
+        out. The fresh key is handed to the lookup so the compute path in
+        this request sees it too.
+        """
         stmt = (
-            select(TerrainCache)
+            select(TerrainCache.s3_key)
             .where(TerrainCache.site_id == site_id)
             .where(TerrainCache.terrain_type == terrain_type.value)
             .where(TerrainCache.variant_key == variant)
         )
-        result = await db.execute(stmt)
-        cache_entry = result.scalar_one_or_none()
+        s3_key = (await db.execute(stmt)).scalar_one_or_none()
+        lookup = get_terrain_cache_lookup()
+        if s3_key is None:
+            lookup.invalidate(site_id, terrain_type, variant)
+        else:
+            lookup.remember(site_id, terrain_type, s3_key, variant=variant)
+        match = _GEOJSON_DIGEST_RE.search(s3_key) if s3_key else None
+        return match.group(1) if match else None
+    
+    def get_response_body(self, digest: str) -> Optional[bytes]:
+        """Return a previously serialized response body for a content digest."""
+        body = self._response_bodies.get(digest)
+        if body is not None:
+            self._response_bodies.move_to_end(digest)
+        return body
+    
+    def remember_response_body(self, digest: str, body: bytes) -> None:
+        """
+        Keep a serialized response body for a content digest.
         
-        if not cache_entry:
-            return None
+        Digests never change meaning, so entries need no invalidation;
+        the LRU bound only caps memory.
+        """
+        self._response_bodies[digest] = body
+        self._response_bodies.move_to_end(digest)
+        if len(self._response_bodies) > self.RESPONSE_BODY_CACHE_SIZE:
+            self._response_bodies.popitem(last=False)
+    
+    async def _get_cached_geojson(
+        self,
+        site_id: UUID,
+        terrain_type: TerrainType,
+        variant: str,
+        db: AsyncSession,
+    ) -> Optional[dict]:
+        """
+        Retrieve cached GeoJSON from TerrainCache/S3.
+        
+        Keys are content-addressed and never overwritten, so there is no
+        HEAD check before the download; a missing object drops the entry.
+        """
+        lookup = get_terrain_cache_lookup()
+        s3_key = await lookup.get_s3_key(site_id, terrain_type, db, variant=variant)
         
-        if not await self._s3_service.terrain_file_exists(cache_entry.s3_key):
-            await db.delete(cache_entry)
-            await db.commit()
+        if not s3_key:
             return None
         
         try:
-            data_bytes = await self._s3_service.download_terrain_file(cache_entry.s3_key)
+            data_bytes = await self._s3_service.download_terrain_file(s3_key)
             return json.loads(data_bytes.decode("utf-8"))
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                await lookup.delete_entry(site_id, terrain_type, db, variant=variant, s3_key=s3_key)
+            else:
+                logger.warning(f"Failed to load cached {terrain_type.value} for site {site_id}: {exc}")
+            return None
         except Exception as exc:
             logger.warning(f"Failed to load cached {terrain_type.value} for site {site_id}: {exc}")
             return None
@@ -100,16 +207,25 @@ class TerrainVisualizationService:
         data: dict,
         db: AsyncSession,
     ) -> None:
-        """Persist GeoJSON output to S3 and TerrainCache."""
+        """Persist GeoJSON output to S3 (content-addressed) and TerrainCache."""
         safe_variant = variant.replace(":", "_").replace("|", "_").replace("/", "_").replace(" ", "_")
-        s3_key = f"terrain/{site_id}/{terrain_type.value}_{safe_variant}.json"
         try:
-            await self._s3_service.upload_json(s3_key, data)
+            # Payloads carry the site UUID; default=str writes it as a string
+            content = json.dumps(data, default=str).encode("utf-8")
+            digest = content_hash(content)
+            s3_key = f"terrain/{site_id}/{terrain_type.value}_{safe_variant}-{digest}.json"
+            await self._s3_service.upload_terrain_file(
+                s3_key=s3_key,
+                content=content,
+                content_type="application/json",
+                cache_control=IMMUTABLE_CACHE_CONTROL,
+            )
             await self._upsert_cache_entry(
                 site_id=site_id,
                 terrain_type=terrain_type,
                 variant=variant,
                 s3_key=s3_key,
+                content_hash=digest,
                 db=db,
             )
         except Exception as exc:
@@ -121,6 +237,7 @@ class TerrainVisualizationService:
         terrain_type: TerrainType,
         variant: str,
         s3_key: str,
+        content_hash: str,
         db: AsyncSession,
     ) -> None:
         """Create or update TerrainCache entry for generated artifacts."""
@@ -132,21 +249,28 @@ class TerrainVisualizationService:
         )
         result = await db.execute(stmt)
         entry = result.scalar_one_or_none()
+        previous_key = entry.s3_key if entry else None
 
         if entry:
             entry.s3_key = s3_key
+            entry.content_hash = content_hash
             entry.source = "generated"
         else:
             entry = TerrainCache(
                 site_id=site_id,
                 terrain_type=terrain_type.value,
                 s3_key=s3_key,
+                content_hash=content_hash,
                 source="generated",
                 variant_key=variant,
             )
             db.add(entry)
 
         await db.commit()
+
+        # Content-addressed keys change with the content; drop the old object
+        if previous_key and previous_key != s3_key:
+            await self._s3_service.discard_terrain_files([previous_key])
     
     async def get_terrain_summary(
         self,
@@ -299,7 +423,7 @@ class TerrainVisualizationService:
         Returns:
             GeoJSON FeatureCollection with contour LineStrings
         """
-        variant = f"interval:{interval_m:.2f}"
+        variant = contours_variant(interval_m)
         cached = await self._get_cached_geojson(site_id, TerrainType.CONTOURS, variant, db)
         if cached:
             return cached
@@ -353,8 +477,10 @@ class TerrainVisualizationService:
                 
                 # Clip to boundary
                 try:
-                    clipped = geometry.intersection(boundary)
-                    if not clipped.is_empty:
+                    clipped = _parts_of_type(
+                        geometry.intersection(boundary), LineString, MultiLineString
+                    )
+                    if clipped is not None and not clipped.is_empty:
                         features.append({
                             "type": "Feature",
                             "geometry": mapping(clipped),
@@ -442,7 +568,7 @@ class TerrainVisualizationService:
         # Determine slope threshold
         if max_slope_deg is None:
             max_slope_deg = SLOPE_LIMITS.get(asset_type, 15.0)
-        variant = f"asset:{asset_type}|max:{max_slope_deg}"
+        variant = buildable_area_variant(asset_type, max_slope_deg)
         cached = await self._get_cached_geojson(site_id, TerrainType.BUILDABLE_AREA, variant, db)
         if cached:
             return cached
@@ -519,7 +645,7 @@ class TerrainVisualizationService:
             GeoJSON FeatureCollection with slope zone polygons
         """
         # Get DEM and slope data
-        variant = "default"
+        variant = SLOPE_HEATMAP_VARIANT
         cached = await self._get_cached_geojson(site_id, TerrainType.SLOPE_HEATMAP, variant, db)
         if cached:
             return cached
@@ -635,9 +761,13 @@ class TerrainVisualizationService:
                         continue
                     
                     # Simplify to reduce vertex count
-                    simplified = clipped.simplify(0.0001, preserve_topology=True)
+                    simplified = _parts_of_type(
+                        clipped.simplify(0.0001, preserve_topology=True),
+                        Polygon,
+                        MultiPolygon,
+                    )
                     
-                    if not simplified.is_empty:
+                    if simplified is not None and not simplified.is_empty:
                         features.append({
                             "type": "Feature",
                             "geometry": mapping(simplified),
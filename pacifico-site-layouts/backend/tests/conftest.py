@@ -0,0 +1,68 @@
+from uuid import UUID
+
+import pytest
+
+
+SITE_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+class FakeResult:
+    """Wraps one value behind the Result accessors the services use."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def one(self):
+        return self._value
+
+    def scalars(self):
+        return iter(self._value)
+
+
+class FakeSession:
+    """
+    Minimal AsyncSession stand-in.
+
+    Each execute() answers with the next of the given values; the last one
+    is repeated once the others are used up.
+    """
+
+    def __init__(self, *values):
+        self._values = list(values)
+        self.executed = 0
+        self.committed = False
+
+    async def execute(self, stmt):
+        self.executed += 1
+        if len(self._values) > 1:
+            return FakeResult(self._values.pop(0))
+        return FakeResult(self._values[0])
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def site_id():
+    return SITE_ID
+
+
+@pytest.fixture
+def fake_session():
+    """Factory for FakeSession(*values)."""
+    return FakeSession
+
+
+@pytest.fixture
+def make_service():
+    """Build a service without running __init__, using the given S3 stub."""
+
+    def factory(service_cls, s3_service=None):
+        service = service_cls.__new__(service_cls)
+        service._s3_service = s3_service
+        return service
+
+    return factory
@@ -0,0 +1,178 @@
+import random
+
+import pytest
+
+from app.services import compliance_rules_engine as engine_module
+from app.services.compliance_rules_engine import (
+    VECTORIZE_MIN_ITEMS,
+    ComplianceRule,
+    ComplianceRulesEngine,
+    Jurisdiction,
+    RuleType,
+    get_compliance_rules_engine,
+)
+
+
+def slope_rule(rule_id, value, asset_type="solar_array", enabled=True):
+    return ComplianceRule(
+        rule_id=rule_id,
+        rule_type=RuleType.MAX_SLOPE,
+        jurisdiction=Jurisdiction.DEFAULT,
+        asset_type=asset_type,
+        value=value,
+        unit="degrees",
+        enabled=enabled,
+    )
+
+
+def loop_screen(values, limits, above):
+    """Reference: a value offends if it violates any single limit."""
+    if above:
+        return [i for i, v in enumerate(values) if any(v > limit for limit in limits)]
+    return [i for i, v in enumerate(values) if any(v < limit for limit in limits)]
+
+
+@pytest.mark.parametrize("count", [1, VECTORIZE_MIN_ITEMS - 1, VECTORIZE_MIN_ITEMS, 200])
+@pytest.mark.parametrize("above", [True, False])
+def test_screen_uses_tightest_limit(count, above):
+    rng = random.Random(count)
+    limits = [5.0, 10.0, 7.5]
+    # Include values exactly on each limit, which do not violate it
+    values = [rng.choice([rng.uniform(0, 15), *limits]) for _ in range(count)]
+
+    assert engine_module._screen(values, limits, above) == loop_screen(values, limits, above)
+
+
+def test_screen_vectorizes_only_large_batches(monkeypatch):
+    calls = []
+    real_fromiter = engine_module.np.fromiter
+    monkeypatch.setattr(
+        engine_module.np,
+        "fromiter",
+        lambda *args, **kwargs: calls.append(kwargs["count"]) or real_fromiter(*args, **kwargs),
+    )
+
+    engine_module._screen([1.0] * (VECTORIZE_MIN_ITEMS - 1), [0.5], True)
+    engine_module._screen([1.0] * VECTORIZE_MIN_ITEMS, [0.5], True)
+
+    assert calls == [VECTORIZE_MIN_ITEMS]
+
+
+def test_screen_without_values_or_limits_is_empty():
+    assert engine_module._screen([], [1.0], True) == []
+    assert engine_module._screen([1.0, 2.0], [], False) == []
+
+
+@pytest.mark.parametrize("count", [4, VECTORIZE_MIN_ITEMS * 3])
+def test_validate_layout_reports_each_offending_asset(count):
+    engine = ComplianceRulesEngine()
+    engine.add_rule(slope_rule("max_slope_solar_strict", 6.0))
+    assets = [{"type": "solar_array", "slope_deg": 8.0 if i % 2 else 12.0} for i in range(count)]
+
+    result = engine.validate_layout(assets)
+
+    # 12° breaks both the default 10° rule and the strict 6° rule, 8° only the strict one
+    assert len(result.violations) == count // 2 * 2 + count // 2
+    assert [v.actual_value for v in result.violations[:3]] == [12.0, 12.0, 8.0]
+    assert result.checked_rules_count == count
+
+
+def test_validate_layout_keeps_input_order():
+    engine = ComplianceRulesEngine()
+    assets = [
+        {"type": "battery", "slope_deg": 6.0, "distance_to_boundary_m": 1.0},
+        {"type": "solar_array", "slope_deg": 12.0},
+        {"type": "battery", "distance_to_boundary_m": 2.0, "min_spacing_m": 3.0},
+        {"type": "solar_array", "min_spacing_m": 1.0},
+    ]
+
+    result = engine.validate_layout(assets, roads=[{"grade_pct": 20.0}])
+
+    assert [(v.rule_id, v.actual_value) for v in result.violations] == [
+        ("max_slope_battery", 6.0),
+        ("min_distance_boundary", 1.0),
+        ("max_slope_solar", 12.0),
+        ("min_distance_boundary", 2.0),
+        ("max_road_grade", 20.0),
+    ]
+    assert [v.actual_value for v in result.warnings] == [3.0, 1.0]
+
+
+def test_add_rule_replaces_existing_rule_id():
+    engine = ComplianceRulesEngine()
+    engine.add_rule(slope_rule("max_slope_solar", 20.0))
+
+    result = engine.validate_layout([{"type": "solar_array", "slope_deg": 15.0}])
+
+    assert result.is_compliant
+    assert engine._by_type[RuleType.MAX_SLOPE]["solar_array"] == [engine.custom_rules["max_slope_solar"]]
+
+
+def test_add_rule_disabled_drops_rule_from_index():
+    engine = ComplianceRulesEngine()
+    engine.add_rule(slope_rule("max_slope_solar", 10.0, enabled=False))
+
+    result = engine.validate_layout([{"type": "solar_array", "slope_deg": 45.0}])
+
+    assert result.is_compliant
+    assert engine._by_type[RuleType.MAX_SLOPE]["solar_array"] == []
+    assert "max_slope_solar" in engine.custom_rules
+    assert "max_slope_solar" not in [r.rule_id for r in engine.get_all_rules()]
+
+    engine.add_rule(slope_rule("max_slope_solar", 10.0))
+
+    assert not engine.validate_layout([{"type": "solar_array", "slope_deg": 45.0}]).is_compliant
+
+
+def test_remove_rule_updates_index():
+    engine = ComplianceRulesEngine()
+
+    assert engine.remove_rule("max_slope_battery")
+    assert not engine.remove_rule("max_slope_battery")
+
+    assert engine._by_type[RuleType.MAX_SLOPE]["battery"] == []
+    assert engine.validate_layout([{"type": "battery", "slope_deg": 30.0}]).is_compliant
+    # Removing a disabled rule leaves the index untouched
+    engine.add_rule(slope_rule("max_slope_extra", 1.0, enabled=False))
+    assert engine.remove_rule("max_slope_extra")
+    assert engine._by_type[RuleType.MAX_SLOPE]["solar_array"] == [engine.custom_rules["max_slope_solar"]]
+
+
+def test_first_error_stops_after_first_violation():
+    engine = ComplianceRulesEngine()
+    assets = [{"type": "solar_array", "slope_deg": 30.0} for _ in range(5)]
+    roads = [{"grade_pct": 50.0}]
+
+    full = engine.validate_layout(assets, roads)
+    first = engine.validate_layout(assets, roads, mode="first_error")
+
+    assert len(full.violations) == 6
+    assert len(first.violations) == 1
+    assert not first.is_compliant
+
+
+def test_first_error_does_not_stop_on_warnings():
+    engine = ComplianceRulesEngine()
+    assets = [
+        {"type": "solar_array", "min_spacing_m": 1.0},
+        {"type": "solar_array", "min_spacing_m": 2.0},
+    ]
+
+    result = engine.validate_layout(assets, roads=[{"grade_pct": 50.0}], mode="first_error")
+
+    assert len(result.warnings) == 2
+    assert [v.rule_id for v in result.violations] == ["max_road_grade"]
+
+
+def test_fresh_engine_is_isolated_from_cached_engine():
+    shared = get_compliance_rules_engine("ca")
+    fresh = get_compliance_rules_engine("ca", fresh=True)
+
+    fresh.remove_rule("wetland_buffer_ca")
+    fresh.add_rule(slope_rule("max_slope_solar", 1.0))
+
+    assert get_compliance_rules_engine("CA") is shared
+    assert fresh is not shared
+    assert "wetland_buffer_ca" in shared.custom_rules
+    assert shared.custom_rules["max_slope_solar"].value == 10.0
+    assert shared.validate_layout([{"type": "solar_array", "slope_deg": 5.0}]).is_compliant
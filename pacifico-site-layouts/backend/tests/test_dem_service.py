@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+from affine import Affine
+from botocore.exceptions import ClientError
+from rasterio.errors import RasterioIOError
+from shapely.geometry import box
+
+from app.models.terrain_cache import TerrainType
+from app.services import dem_service
+
+
+class DiscardingS3Service:
+    def __init__(self):
+        self.discarded: list[str] = []
+
+    async def discard_terrain_files(self, s3_keys):
+        self.discarded.extend(s3_keys)
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service(dem_service.DEMService, DiscardingS3Service())
+
+
+async def upsert_dem(service, db, site_id, s3_key, digest):
+    await service._update_cache_record(
+        site_id=site_id,
+        terrain_type=TerrainType.ELEVATION,
+        s3_key=s3_key,
+        content_hash=digest,
+        resolution_m=10,
+        source="usgs_3dep",
+        db=db,
+    )
+
+
+@pytest.mark.asyncio
+async def test_new_dem_discards_previous_object_and_derived_artifacts(
+    service, fake_session, site_id
+):
+    # The DEM upsert returns the previous row, then the derived-artifact delete its keys
+    db = fake_session(
+        ("old", "terrain/site/dem-old.tif"),
+        ["terrain/site/slope-old.tif", "terrain/site/contours_5-old.json"],
+    )
+
+    await upsert_dem(service, db, site_id, "terrain/site/dem-new.tif", "new")
+
+    assert db.committed
+    assert service._s3_service.discarded == [
+        "terrain/site/dem-old.tif",
+        "terrain/site/slope-old.tif",
+        "terrain/site/contours_5-old.json",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_first_or_unchanged_dem_discards_nothing(service, fake_session, site_id):
+    await upsert_dem(
+        service, fake_session((None, None), []), site_id, "terrain/site/dem-a.tif", "a"
+    )
+    await upsert_dem(
+        service,
+        fake_session(("a", "terrain/site/dem-a.tif"), []),
+        site_id,
+        "terrain/site/dem-a.tif",
+        "a",
+    )
+
+    assert service._s3_service.discarded == []
+
+
+def staged_tiles(keys):
+    return [key.split("/")[-2] for key in keys]
+
+
+def test_staged_tile_keys_name_tiles_by_north_west_corner():
+    keys = dem_service.DEMService._staged_tile_keys((-105.6, 39.4, -105.2, 39.8), "13")
+
+    assert keys == [
+        "StagedProducts/Elevation/13/TIFF/current/n40w106/USGS_13_n40w106.tif"
+    ]
+
+
+def test_staged_tile_keys_cover_bbox_across_degree_lines():
+    keys = dem_service.DEMService._staged_tile_keys((-105.2, 39.9, -104.8, 40.1), "1")
+
+    assert sorted(staged_tiles(keys)) == ["n40w105", "n40w106", "n41w105", "n41w106"]
+    assert all(key.startswith("StagedProducts/Elevation/1/TIFF/") for key in keys)
+
+
+class FakeStagedBucket:
+    """head_object answers: 404 for missing tiles, or raises a given error."""
+
+    def __init__(self, missing=(), error_code=None):
+        self.missing = set(missing)
+        self.error_code = error_code
+
+    def head_object(self, Bucket, Key):
+        tile = Key.split("/")[-2]
+        code = "404" if tile in self.missing else self.error_code
+        if code:
+            raise ClientError({"Error": {"Code": code}}, "HeadObject")
+        return {}
+
+
+class FakeDataset:
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def staged_io(monkeypatch):
+    """Stub the USGS bucket, rasterio.open and merge."""
+    opened = []
+
+    def fake_open(path):
+        dataset = FakeDataset(path)
+        opened.append(dataset)
+        return dataset
+
+    def fake_merge(sources, bounds, nodata, dtype):
+        return np.ones((1, 3, 4), dtype="float32"), Affine.identity()
+
+    monkeypatch.setattr(dem_service.rasterio, "open", fake_open)
+    monkeypatch.setattr(dem_service, "merge", fake_merge)
+    monkeypatch.setattr(dem_service, "_usgs_staged_client", lambda: FakeStagedBucket())
+    return opened
+
+
+def test_missing_staged_tiles_are_skipped(monkeypatch, staged_io):
+    monkeypatch.setattr(
+        dem_service, "_usgs_staged_client", lambda: FakeStagedBucket(missing={"n40w105"})
+    )
+
+    dem_array, _ = dem_service.DEMService._read_staged_tiles((-105.2, 39.4, -104.8, 39.8), 10)
+
+    assert dem_array.shape == (3, 4)
+    assert staged_tiles(dataset.path for dataset in staged_io) == ["n40w106"]
+    assert all(dataset.closed for dataset in staged_io)
+
+
+def test_no_staged_tiles_returns_none(monkeypatch, staged_io):
+    monkeypatch.setattr(
+        dem_service, "_usgs_staged_client", lambda: FakeStagedBucket(missing={"n40w106"})
+    )
+
+    assert dem_service.DEMService._read_staged_tiles((-105.6, 39.4, -105.2, 39.8), 10) == (None, None)
+    assert staged_io == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", ["throttled", "open", "merge"])
+async def test_staged_read_failures_fall_back_to_py3dep(monkeypatch, staged_io, service, failure):
+    if failure == "throttled":
+        monkeypatch.setattr(
+            dem_service, "_usgs_staged_client", lambda: FakeStagedBucket(error_code="SlowDown")
+        )
+    elif failure == "open":
+        def failing_open(path):
+            raise RasterioIOError("HTTP response code: 503")
+        monkeypatch.setattr(dem_service.rasterio, "open", failing_open)
+    else:
+        def failing_merge(*args, **kwargs):
+            raise RasterioIOError("Read failed")
+        monkeypatch.setattr(dem_service, "merge", failing_merge)
+
+    py3dep_calls = []
+
+    async def fake_py3dep(bbox, resolution_m):
+        py3dep_calls.append(resolution_m)
+        return np.full((5, 6), 100.0, dtype="float32"), Affine.identity()
+
+    monkeypatch.setattr(service, "_fetch_dem_from_py3dep", fake_py3dep)
+
+    dem_array, profile = await service._fetch_dem_from_3dep(box(-105.6, 39.4, -105.2, 39.8), 10)
+
+    assert py3dep_calls == [10]
+    assert dem_array.shape == (5, 6)
+    assert (profile["width"], profile["height"]) == (6, 5)
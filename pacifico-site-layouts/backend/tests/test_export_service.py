@@ -1,4 +1,6 @@
 import io
+import xml.etree.ElementTree as ET
+import zipfile
 from uuid import UUID
 
 import pytest
@@ -146,7 +148,58 @@ async def test_export_csv_handles_missing_numbers(dummy_s3, monkeypatch):
     assert content_type == "application/zip"
 
 
+@pytest.mark.asyncio
+async def test_export_kmz_writes_escaped_kml_with_shared_styles(dummy_s3):
+    svc = export_service.ExportService()
+    layout_id = UUID("123e4567-e89b-12d3-a456-426614174002")
+    assets = [
+        {
+            "asset_type": "solar_array",
+            "name": "Array <A> & B",
+            "capacity_kw": 250,
+            "slope_deg": 22.0,
+            "position": {"type": "Point", "coordinates": [-122.1, 37.1]},
+        },
+        {
+            "asset_type": "battery",
+            "name": "Battery 1",
+            "capacity_kw": None,
+            "position": {"type": "Point", "coordinates": [-122.2, 37.2]},
+        },
+    ]
+    roads = [
+        {
+            "name": "Road 1",
+            "length_m": 120.0,
+            "max_grade_pct": 7.5,
+            "geometry": {"type": "LineString", "coordinates": [[-122.1, 37.1], [-122.2, 37.2]]},
+        }
+    ]
 
+    await svc.export_kmz(
+        layout_id=layout_id,
+        site_name="Ridge & Valley",
+        site_boundary={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        assets=assets,
+        roads=roads,
+        layout_data={"total_capacity_kw": 250},
+    )
 
+    _, content, content_type = dummy_s3.uploads[0]
+    assert content_type == "application/vnd.google-earth.kmz"
+    kml = zipfile.ZipFile(io.BytesIO(content)).read("doc.kml")
+    root = ET.fromstring(kml)  # raises if anything was left unescaped
 
-
+    ns = {"kml": "http://www.opengis.net/kml/2.2"}
+    styles = {style.get("id") for style in root.iterfind(".//kml:Style", ns)}
+    placemarks = {
+        placemark.findtext("kml:name", namespaces=ns): placemark.findtext("kml:styleUrl", namespaces=ns)
+        for placemark in root.iterfind(".//kml:Placemark", ns)
+    }
+    assert placemarks == {
+        "Ridge & Valley": "#boundary",
+        "Array <A> & B": "#asset-over-limit",
+        "Battery 1": "#asset-battery",
+        "Road 1": "#road-moderate",
+    }
+    assert {url.lstrip("#") for url in placemarks.values()} <= styles
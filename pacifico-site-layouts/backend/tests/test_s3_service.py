@@ -0,0 +1,95 @@
+import pytest
+
+from app.services import s3
+
+
+class FakeCredentials:
+    def __init__(self, access_key):
+        self.access_key = access_key
+
+    def get_frozen_credentials(self):
+        return self
+
+
+class FakeSession:
+    def __init__(self, access_key="ASIAFIRST"):
+        self.credentials = FakeCredentials(access_key)
+
+    def get_credentials(self):
+        return self.credentials
+
+
+class SigningClient:
+    """Counts presign calls and returns distinguishable URLs."""
+
+    def __init__(self):
+        self.signed = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.signed += 1
+        return f"https://example.com/{Params['Key']}?sig={self.signed}"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def service(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(s3.time, "monotonic", clock)
+    svc = s3.S3Service.__new__(s3.S3Service)
+    svc._session = FakeSession()
+    svc._client = SigningClient()
+    svc._presigned_urls = s3.OrderedDict()
+    svc.clock = clock
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_presigned_url_is_reused_until_reuse_window_ends(service):
+    first = await service.get_presigned_url("bucket", "outputs/a/layout.kmz")
+    service.clock.now += 3600 - service.PRESIGNED_URL_MIN_REMAINING_S - 1
+    assert await service.get_presigned_url("bucket", "outputs/a/layout.kmz") == first
+    assert service._client.signed == 1
+
+    service.clock.now += 2
+    assert await service.get_presigned_url("bucket", "outputs/a/layout.kmz") != first
+    assert service._client.signed == 2
+
+
+@pytest.mark.asyncio
+async def test_short_lived_presigned_urls_are_not_cached(service):
+    await service.get_presigned_url("bucket", "outputs/a/layout.kmz", expires_in=600)
+    await service.get_presigned_url("bucket", "outputs/a/layout.kmz", expires_in=600)
+
+    assert service._client.signed == 2
+
+
+@pytest.mark.asyncio
+async def test_rotated_credentials_force_a_new_signature(service):
+    first = await service.get_presigned_url("bucket", "outputs/a/report.pdf")
+    service._session.credentials = FakeCredentials("ASIASECOND")
+
+    assert await service.get_presigned_url("bucket", "outputs/a/report.pdf") != first
+    assert service._client.signed == 2
+
+
+@pytest.mark.asyncio
+async def test_presigned_url_cache_evicts_least_recently_used(service, monkeypatch):
+    monkeypatch.setattr(service, "PRESIGNED_URL_MAX_ENTRIES", 2)
+
+    await service.get_presigned_url("bucket", "a")
+    await service.get_presigned_url("bucket", "b")
+    await service.get_presigned_url("bucket", "a")  # refresh a
+    await service.get_presigned_url("bucket", "c")  # evicts b
+    assert service._client.signed == 3
+
+    await service.get_presigned_url("bucket", "a")
+    assert service._client.signed == 3
+    await service.get_presigned_url("bucket", "b")
+    assert service._client.signed == 4
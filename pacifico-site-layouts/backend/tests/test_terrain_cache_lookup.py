@@ -0,0 +1,60 @@
+from uuid import UUID
+
+import pytest
+
+from app.models.terrain_cache import TerrainType
+from app.services.terrain_cache_lookup import TerrainCacheLookup
+
+
+@pytest.mark.asyncio
+async def test_warm_lookup_skips_database(fake_session, site_id):
+    lookup = TerrainCacheLookup()
+    db = fake_session("terrain/site/dem.tif")
+
+    first = await lookup.get_s3_key(site_id, TerrainType.ELEVATION, db)
+    second = await lookup.get_s3_key(site_id, TerrainType.ELEVATION, db)
+
+    assert first == second == "terrain/site/dem.tif"
+    assert db.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_expiry_force_reload(fake_session, site_id):
+    lookup = TerrainCacheLookup(ttl_s=0)
+    db = fake_session("terrain/site/slope.tif")
+
+    await lookup.get_s3_key(site_id, TerrainType.SLOPE, db)
+    await lookup.get_s3_key(site_id, TerrainType.SLOPE, db)
+    assert db.executed == 2  # ttl=0 never serves from cache
+
+    lookup = TerrainCacheLookup()
+    await lookup.get_s3_key(site_id, TerrainType.CONTOURS, db, variant="interval:5")
+    lookup.invalidate(site_id, "contours", "interval:5")
+    await lookup.get_s3_key(site_id, TerrainType.CONTOURS, db, variant="interval:5")
+    assert db.executed == 4
+
+
+@pytest.mark.asyncio
+async def test_misses_are_not_cached(fake_session, site_id):
+    lookup = TerrainCacheLookup()
+    db = fake_session(None)
+
+    assert await lookup.get_s3_key(site_id, TerrainType.ELEVATION, db) is None
+    assert await lookup.get_s3_key(site_id, TerrainType.ELEVATION, db) is None
+    assert db.executed == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_site_drops_only_that_site(fake_session, site_id):
+    lookup = TerrainCacheLookup()
+    other_site = UUID("123e4567-e89b-12d3-a456-426614174001")
+    db = fake_session("terrain/site/contours.json")
+
+    await lookup.get_s3_key(site_id, TerrainType.CONTOURS, db, variant="interval:5")
+    await lookup.get_s3_key(site_id, TerrainType.SLOPE, db)
+    await lookup.get_s3_key(other_site, TerrainType.SLOPE, db)
+    lookup.invalidate_site(site_id)
+
+    await lookup.get_s3_key(site_id, TerrainType.CONTOURS, db, variant="interval:5")
+    await lookup.get_s3_key(other_site, TerrainType.SLOPE, db)
+    assert db.executed == 4
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from app.models.terrain_cache import TerrainType
+from app.services import terrain_visualization_service
+from app.services.terrain_cache_lookup import TerrainCacheLookup
+
+
+class RecordingS3Service:
+    """Captures terrain uploads."""
+
+    def __init__(self):
+        self.uploads: dict[str, bytes] = {}
+
+    async def upload_terrain_file(self, s3_key, content, content_type, cache_control=None):
+        self.uploads[s3_key] = content
+        return s3_key
+
+
+@pytest.mark.asyncio
+async def test_cache_geojson_serializes_uuid_payloads(monkeypatch, make_service, site_id):
+    service = make_service(
+        terrain_visualization_service.TerrainVisualizationService, RecordingS3Service()
+    )
+    upserts = []
+
+    async def fake_upsert(**kwargs):
+        upserts.append(kwargs)
+
+    monkeypatch.setattr(service, "_upsert_cache_entry", fake_upsert)
+
+    payload = {"site_id": site_id, "type": "FeatureCollection", "features": []}
+    await service._cache_geojson(site_id, TerrainType.CONTOURS, "v2|interval:5", payload, db=None)
+
+    (s3_key, content), = service._s3_service.uploads.items()
+    assert json.loads(content)["site_id"] == str(site_id)
+    assert upserts[0]["s3_key"] == s3_key
+    assert s3_key.endswith(f"-{upserts[0]['content_hash']}.json")
+
+
+@pytest.mark.asyncio
+async def test_cached_digest_reads_database_over_stale_lookup(
+    monkeypatch, make_service, fake_session, site_id
+):
+    lookup = TerrainCacheLookup()
+    monkeypatch.setattr(terrain_visualization_service, "get_terrain_cache_lookup", lambda: lookup)
+    service = make_service(terrain_visualization_service.TerrainVisualizationService)
+    old_key = f"terrain/{site_id}/contours_5-{'a' * 64}.json"
+    new_key = f"terrain/{site_id}/contours_5-{'b' * 64}.json"
+    lookup.remember(site_id, TerrainType.CONTOURS, old_key, variant="interval:5")
+
+    # Another worker regenerated the contours under a new digest
+    digest = await service.get_cached_digest(
+        site_id, TerrainType.CONTOURS, "interval:5", fake_session(new_key)
+    )
+
+    assert digest == "b" * 64
+    assert await lookup.get_s3_key(
+        site_id, TerrainType.CONTOURS, fake_session(None), variant="interval:5"
+    ) == new_key
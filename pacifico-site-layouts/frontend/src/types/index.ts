@@ -482,6 +482,8 @@ export interface GenerateVariantsRequest {
   dem_resolution_m?: number;
   generate_variants?: boolean;
   variant_strategies?: LayoutStrategy[];
+  /** Bitmask alternative to variant_strategies (1=balanced, 2=density, 4=low_earthwork, 8=clustered) */
+  variant_strategies_mask?: number;
 }
 
 // =============================================================================